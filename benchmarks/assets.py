@@ -0,0 +1,162 @@
+"""Generate synthetic media so benchmarks run without external assets."""
+
+import os
+from dataclasses import dataclass
+
+import av
+import numpy as np
+from PIL import Image, ImageFont
+
+
+@dataclass(frozen=True)
+class SyntheticAssets:
+    """Paths of generated benchmark media.
+
+    Attributes:
+        video: Test-pattern video with moving gradients and noise.
+        images: Noise images with transparent borders.
+        audio: Sine-wave audio tracks at different pitches.
+        font: TrueType font file.
+    """
+
+    video: str
+    images: tuple[str, ...]
+    audio: tuple[str, ...]
+    font: str
+
+
+def make_test_pattern_video(path: str, width: int, height: int, fps: int, seconds: float) -> None:
+    """Write a moving gradient with noise so decoders and encoders do real work.
+
+    Args:
+        path: Destination file path.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        seconds: Length of the video.
+    """
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+
+    container = av.open(path, mode='w')
+    stream = container.add_stream('h264', rate=fps)
+    stream.width, stream.height = width, height
+    stream.pix_fmt = 'yuv420p'
+    stream.codec_context.options = {"preset": "ultrafast", "crf": "10"}
+
+    for index in range(int(seconds * fps)):
+        shift = index * 4
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[..., 0] = (x + shift) % 256
+        frame[..., 1] = (y + shift) % 256
+        frame[..., 2] = rng.integers(0, 32, (height, width), dtype=np.uint8) + 96
+        for packet in stream.encode(av.VideoFrame.from_ndarray(frame, format='rgb24')):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+def make_noise_image(path: str, width: int, height: int, seed: int) -> None:
+    """Write an RGBA noise image whose border fades to transparent.
+
+    Args:
+        path: Destination PNG path.
+        width: Image width in pixels.
+        height: Image height in pixels.
+        seed: Random seed, so each image differs.
+    """
+
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    edge_x = np.minimum(np.arange(width), np.arange(width)[::-1]) / max(1, width // 8)
+    edge_y = np.minimum(np.arange(height), np.arange(height)[::-1]) / max(1, height // 8)
+    alpha = np.clip(np.minimum(edge_y[:, None], edge_x[None, :]), 0.0, 1.0)
+    pixels[..., 3] = (alpha * 255).astype(np.uint8)
+    Image.fromarray(pixels, 'RGBA').save(path)
+
+
+def make_sine_audio(path: str, seconds: float, frequency: float, sample_rate: int = 44100) -> None:
+    """Write a stereo sine tone encoded as AAC.
+
+    Args:
+        path: Destination file path, such as "tone.m4a".
+        seconds: Length of the tone.
+        frequency: Tone frequency in Hz.
+        sample_rate: Sample rate of the file.
+    """
+
+    container = av.open(path, mode='w')
+    stream = container.add_stream('aac', rate=sample_rate)
+    stream.layout = 'stereo'
+    frame_size = stream.codec_context.frame_size or 1024
+
+    total = int(seconds * sample_rate)
+    for start in range(0, total, frame_size):
+        t = np.arange(start, start + frame_size, dtype=np.float32) / sample_rate
+        tone = (0.3 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+        frame = av.AudioFrame.from_ndarray(np.stack([tone, tone]), format='fltp', layout='stereo')
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+def write_font(path: str) -> None:
+    """Write the TrueType font bundled with Pillow to a file.
+
+    Args:
+        path: Destination TTF path.
+    """
+
+    with open(path, 'wb') as handle:
+        handle.write(ImageFont.load_default(size=12).font_bytes)
+
+
+def generate_assets(
+    directory: str,
+    width: int,
+    height: int,
+    fps: int,
+    seconds: float,
+    image_count: int = 4,
+    audio_count: int = 4,
+) -> SyntheticAssets:
+    """Generate every benchmark asset for one resolution into a directory.
+
+    Args:
+        directory: Directory to write the files into.
+        width: Video width in pixels.
+        height: Video height in pixels.
+        fps: Video frames per second.
+        seconds: Length of the video and audio.
+        image_count: Number of distinct noise images.
+        audio_count: Number of distinct sine tracks.
+
+    Returns:
+        SyntheticAssets: Paths of the generated files.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    video = os.path.join(directory, f"pattern-{width}x{height}.mp4")
+    make_test_pattern_video(video, width, height, fps, seconds)
+
+    images = []
+    for index in range(image_count):
+        path = os.path.join(directory, f"noise-{index}.png")
+        make_noise_image(path, max(16, width // 4), max(16, height // 4), index)
+        images.append(path)
+
+    audio = []
+    for index in range(audio_count):
+        path = os.path.join(directory, f"tone-{index}.m4a")
+        make_sine_audio(path, seconds, 220.0 * (index + 1))
+        audio.append(path)
+
+    font = os.path.join(directory, "font.ttf")
+    write_font(font)
+    return SyntheticAssets(video=video, images=tuple(images), audio=tuple(audio), font=font)
@@ -0,0 +1,82 @@
+"""Compare encoding throughput and output size across encoder profiles.
+
+Run from the repository root:
+
+    python -m benchmarks.encoder_profiles --seconds 10 --width 1280 --height 720
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.assets import make_test_pattern_video
+from openframe import *
+
+
+def build_scene(source: str, width: int, height: int, seconds: float) -> Scene:
+    """Build a scene with video, overlays, and fades.
+
+    Args:
+        source: Path of the background video.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        seconds: Length of the scene.
+
+    Returns:
+        Scene: Scene ready to render.
+    """
+
+    scene = Scene(start_at=0)
+    scene.add(VideoClip(path=source, duration=seconds, size=(width, height), content_mode=ContentMode.FILL))
+    scene.add(
+        Rectangle(
+            start_time=0.5,
+            duration=seconds - 1,
+            position=(width // 2, height // 2),
+            anchor_point=AnchorPoint.CENTER,
+            size=(width // 3, height // 4),
+            fill=(20, 20, 20, 180),
+            fade_in_duration=0.5,
+            fade_out_duration=0.5,
+        )
+    )
+    return scene
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    profiles = [("default", EncoderSettings())] + [
+        (profile.value, EncoderSettings.from_profile(profile)) for profile in EncoderProfile
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.mp4")
+        make_test_pattern_video(source, args.width, args.height, args.fps, args.seconds)
+        frames = int(args.seconds * args.fps)
+
+        print(f"{'profile':<10} {'codec':<10} {'fps':>8} {'size (KiB)':>12}")
+        for name, settings in profiles:
+            output = os.path.join(directory, f"{name}.mp4")
+            scene = build_scene(source, args.width, args.height, args.seconds)
+            started = time.perf_counter()
+            scene.render(
+                width=args.width,
+                height=args.height,
+                fps=args.fps,
+                output_path=output,
+                compositor=CompositorBackend.NUMPY,
+                encoder=settings,
+            )
+            elapsed = time.perf_counter() - started
+            print(f"{name:<10} {settings.codec:<10} {frames / elapsed:>8.1f} {os.path.getsize(output) / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,483 @@
+"""Time each render stage on synthetic timelines and write the results as JSON.
+
+Run from the repository root:
+
+    python -m benchmarks.suite --resolutions 720p 1080p --elements 4 16 --output results.json
+
+Compare against an earlier run with --compare, for example the results file
+of the previous release.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Callable
+
+import av
+import numpy as np
+import PIL
+
+from benchmarks.assets import SyntheticAssets, generate_assets
+from openframe import *
+from openframe import audio as audio_module
+from openframe.cache import CACHE_DIR_ENV
+from openframe.compositor import create_compositor
+from openframe.mixer import AudioMixer
+from openframe.sink import ContainerSink
+
+RESOLUTIONS = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+AUDIO_BLOCK = 1024
+ENCODE_DISTINCT_FRAMES = 8
+PREFETCH_FRAMES = 8
+
+
+def build_scene(assets: SyntheticAssets, width: int, height: int, seconds: float, elements: int) -> Scene:
+    """Build a nested scene of overlays that fade for the whole duration.
+
+    Every frame has a different opacity, so none is served from the repeated
+    frame cache and each one is composited.
+
+    Args:
+        assets: Generated media.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        seconds: Scene length.
+        elements: Number of overlay elements.
+
+    Returns:
+        Scene: Root scene holding one child scene per group of four elements.
+    """
+
+    root = Scene(start_at=0)
+    background = Scene(start_at=0)
+    background.add(Rectangle(duration=seconds, size=(width, height), fill=(40, 40, 60, 255)))
+    root.add_scene(background)
+
+    fade = seconds / 2
+    group = None
+    for index in range(elements):
+        if index % 4 == 0:
+            group = Scene(start_at=0)
+            root.add_scene(group)
+
+        position = ((index * 97) % max(1, width - width // 4), (index * 53) % max(1, height - height // 4))
+        timing = dict(duration=seconds, position=position, fade_in_duration=fade, fade_out_duration=fade)
+        kind = index % 4
+        if kind == 0:
+            group.add(ImageClip(path=assets.images[index % len(assets.images)], **timing))
+        elif kind == 1:
+            group.add(TextClip(text=f"Benchmark element {index}", font=assets.font, font_size=max(12, height // 20), **timing))
+        elif kind == 2:
+            group.add(Circle(size=(width // 6, width // 6), fill=(200, 80, 40, 160), **timing))
+        else:
+            group.add(
+                ImageClip(
+                    path=assets.images[index % len(assets.images)],
+                    size=(width // 3, height // 3),
+                    content_mode=ContentMode.FIT,
+                    **timing,
+                )
+            )
+
+    for index, path in enumerate(assets.audio):
+        root.add_audio(AudioClip(path=path, start_time=index * seconds / 8, volume=0.5))
+    return root
+
+
+def measure(function: Callable[[], object], repeat: int) -> tuple[list[float], object]:
+    """Run a function several times and time each run.
+
+    Args:
+        function: Work to time.
+        repeat: Number of runs.
+
+    Returns:
+        tuple[list[float], object]: Seconds per run and the last result.
+    """
+
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return timings, result
+
+
+def record(stage: str, timings: list[float], frames: int | None = None, **dimensions: object) -> dict:
+    """Summarize the timings of one stage.
+
+    Args:
+        stage: Stage name.
+        timings: Seconds per run.
+        frames: Frames processed per run, for per-frame figures.
+        **dimensions: Parameters of the run, such as resolution.
+
+    Returns:
+        dict: JSON-ready result entry.
+    """
+
+    best = min(timings)
+    entry = {
+        "stage": stage,
+        **dimensions,
+        "runs": len(timings),
+        "best_seconds": best,
+        "median_seconds": statistics.median(timings),
+    }
+    if frames:
+        entry["frames"] = frames
+        entry["best_ms_per_frame"] = best * 1000 / frames
+    return entry
+
+
+def composite_frames(scene: Scene, width: int, height: int, fps: int, frames: int, backend: CompositorBackend) -> list[np.ndarray]:
+    """Composite every frame of a scene without encoding.
+
+    Args:
+        scene: Scene to render.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        frames: Number of frames.
+        backend: Compositor backend.
+
+    Returns:
+        list[np.ndarray]: Copies of a few evenly spaced frames for the
+        encode stage.
+    """
+
+    scene._prepare(width, height, backend)
+    keep = max(1, frames // ENCODE_DISTINCT_FRAMES)
+    kept = []
+    for index in range(frames):
+        data = scene._create_frame(index / fps, width, height)
+        if index % keep == 0:
+            kept.append(data.copy())
+    for placement in scene._placements:
+        placement.close()
+    return kept
+
+
+def decode_video(assets: SyntheticAssets, width: int, height: int, fps: int, frames: int, fast_scale: bool) -> None:
+    """Decode and scale the test-pattern video to the frame size.
+
+    Args:
+        assets: Generated media.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        frames: Number of frames.
+        fast_scale: Whether to scale with swscale instead of Pillow.
+    """
+
+    clip = VideoClip(
+        path=assets.video,
+        duration=frames / fps,
+        size=(width, height),
+        content_mode=ContentMode.FILL,
+        fast_scale=fast_scale,
+    )
+    for index in range(frames):
+        clip._frame_for_time(index / fps)
+    clip.close()
+
+
+def render_video(assets: SyntheticAssets, width: int, height: int, fps: int, frames: int, prefetch: int, output: str) -> None:
+    """Render and encode a scaled video clip, so decoding can overlap the rest of the frame.
+
+    Args:
+        assets: Generated media.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        frames: Number of frames.
+        prefetch: Frames decoded ahead on a background thread, or 0 to
+            decode on the render thread.
+        output: Path of the encoded file.
+    """
+
+    scene = Scene(start_at=0)
+    scene.add(
+        VideoClip(
+            path=assets.video,
+            duration=frames / fps,
+            size=(width * 2 // 3, height * 2 // 3),
+            content_mode=ContentMode.FILL,
+            prefetch=prefetch,
+        )
+    )
+    scene.render(width=width, height=height, fps=fps, output_path=output)
+
+
+def mix_audio(scene: Scene, sample_rate: int, samples: int) -> None:
+    """Mix every audio clip of a scene into stereo blocks.
+
+    Args:
+        scene: Scene holding audio clips.
+        sample_rate: Output sample rate.
+        samples: Number of timeline samples to mix.
+    """
+
+    mixer = AudioMixer(scene._get_audio(), sample_rate, AudioLayout.STEREO.value, range(samples))
+    try:
+        while mixer.remaining > 0:
+            mixer.read(AUDIO_BLOCK)
+    finally:
+        mixer.close()
+
+
+def decode_and_mix_audio(scene: Scene, sample_rate: int, samples: int, directory: str) -> None:
+    """Mix a scene's audio starting from empty decode caches.
+
+    Args:
+        scene: Scene holding audio clips.
+        sample_rate: Output sample rate.
+        samples: Number of timeline samples to mix.
+        directory: Directory to create the empty disk cache in.
+    """
+
+    os.environ[CACHE_DIR_ENV] = tempfile.mkdtemp(dir=directory)
+    audio_module._load_pcm.cache_clear()
+    audio_module._source_duration.cache_clear()
+    mix_audio(scene, sample_rate, samples)
+
+
+def encode_frames(
+    frames: list[np.ndarray],
+    pixel_format: str,
+    path: str,
+    width: int,
+    height: int,
+    fps: int,
+    count: int,
+    encoder: EncoderSettings,
+) -> None:
+    """Encode a cycle of composited frames into a file.
+
+    Args:
+        frames: Distinct frames to cycle through.
+        pixel_format: Pixel format of the frames.
+        path: Output file path.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second.
+        count: Number of frames to encode.
+        encoder: Codec settings.
+    """
+
+    sink = ContainerSink(path, encoder=encoder)
+    sink.open(width, height, fps, 44100, None)
+    for index in range(count):
+        sink.write_video(frames[index % len(frames)], pixel_format)
+    sink.close()
+
+
+def environment() -> dict:
+    """Describe the software and machine the suite ran on.
+
+    Returns:
+        dict: Versions, platform, and commit of the run.
+    """
+
+    try:
+        version = metadata.version("openframe")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "openframe": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "av": av.__version__,
+        "numpy": np.__version__,
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run every stage across the requested resolutions and element counts.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        dict: Environment and result entries.
+    """
+
+    results = []
+    frames = int(args.seconds * args.fps)
+    samples = int(args.seconds * 44100)
+    encoder = EncoderSettings.from_profile(EncoderProfile(args.encoder)) if args.encoder else EncoderSettings()
+    backends = [CompositorBackend(name) for name in args.compositors]
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ[CACHE_DIR_ENV] = os.path.join(directory, "cache")
+        for name in args.resolutions:
+            width, height = RESOLUTIONS[name]
+            print(f"[{name}] generating assets", file=sys.stderr)
+            assets = generate_assets(os.path.join(directory, name), width, height, args.fps, args.seconds)
+            kept: dict[CompositorBackend, list[np.ndarray]] = {}
+
+            for elements in args.elements:
+                dims = dict(resolution=name, width=width, height=height, elements=elements)
+                timings, scene = measure(lambda: build_scene(assets, width, height, args.seconds, elements), args.repeat)
+                results.append(record("build", timings, **dims))
+
+                timings, _ = measure(lambda: (scene._get_elements(), scene._get_audio()), args.repeat)
+                results.append(record("flatten", timings, **dims))
+
+                for backend in backends:
+                    timings, kept[backend] = measure(
+                        lambda: composite_frames(scene, width, height, args.fps, frames, backend),
+                        args.repeat,
+                    )
+                    results.append(record("composite", timings, frames, compositor=backend.value, **dims))
+                print(f"[{name}] {elements} elements done", file=sys.stderr)
+
+            dims = dict(resolution=name, width=width, height=height)
+            for fast_scale in (False, True):
+                timings, _ = measure(lambda: decode_video(assets, width, height, args.fps, frames, fast_scale), args.repeat)
+                results.append(record("video_decode_scale", timings, frames, fast_scale=fast_scale, **dims))
+            for prefetch in (0, PREFETCH_FRAMES):
+                output = os.path.join(directory, f"prefetch-{name}-{prefetch}.mp4")
+                timings, _ = measure(
+                    lambda: render_video(assets, width, height, args.fps, frames, prefetch, output),
+                    args.repeat,
+                )
+                results.append(record("video_render", timings, frames, prefetch=prefetch, **dims))
+
+            audio_scene = build_scene(assets, width, height, args.seconds, 0)
+            timings, _ = measure(lambda: decode_and_mix_audio(audio_scene, 44100, samples, directory), args.repeat)
+            results.append(record("audio_decode_mix", timings, clips=len(assets.audio), **dims))
+            timings, _ = measure(lambda: mix_audio(audio_scene, 44100, samples), args.repeat)
+            results.append(record("audio_mix", timings, clips=len(assets.audio), **dims))
+
+            for backend in backends:
+                pixel_format = create_compositor(backend, width, height).pixel_format
+                output = os.path.join(directory, f"encode-{name}-{backend.value}.mp4")
+                timings, _ = measure(
+                    lambda: encode_frames(kept[backend], pixel_format, output, width, height, args.fps, frames, encoder),
+                    args.repeat,
+                )
+                results.append(
+                    record(
+                        "encode",
+                        timings,
+                        frames,
+                        compositor=backend.value,
+                        codec=encoder.codec,
+                        output_bytes=os.path.getsize(output),
+                        **dims,
+                    )
+                )
+            print(f"[{name}] done", file=sys.stderr)
+
+    return {"environment": environment(), "settings": vars(args), "results": results}
+
+
+def result_key(entry: dict) -> tuple:
+    """Identify a result entry independently of its timings.
+
+    Args:
+        entry: Result entry.
+
+    Returns:
+        tuple: Stage and run parameters.
+    """
+
+    ignored = {"runs", "best_seconds", "median_seconds", "best_ms_per_frame", "output_bytes"}
+    return tuple(sorted((key, str(value)) for key, value in entry.items() if key not in ignored))
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print the change in best time for every stage found in both runs.
+
+    Args:
+        current: Results of this run.
+        baseline: Results of an earlier run.
+    """
+
+    previous = {result_key(entry): entry for entry in baseline["results"]}
+    print(f"{'stage':<20} {'parameters':<60} {'baseline':>10} {'current':>10} {'change':>8}")
+    for entry in current["results"]:
+        before = previous.get(result_key(entry))
+        if before is None:
+            continue
+        params = ", ".join(
+            f"{key}={value}" for key, value in entry.items()
+            if key not in {"stage", "runs", "best_seconds", "median_seconds", "best_ms_per_frame", "output_bytes", "frames"}
+        )
+        change = entry["best_seconds"] / before["best_seconds"] - 1 if before["best_seconds"] else 0.0
+        print(f"{entry['stage']:<20} {params:<60} {before['best_seconds']:>10.4f} {entry['best_seconds']:>10.4f} {change:>+8.1%}")
+
+
+def print_summary(report: dict) -> None:
+    """Print the best time of every stage.
+
+    Args:
+        report: Results of this run.
+    """
+
+    for entry in report["results"]:
+        params = ", ".join(
+            f"{key}={value}" for key, value in entry.items()
+            if key in {"resolution", "elements", "compositor", "fast_scale", "prefetch", "clips"}
+        )
+        per_frame = f"{entry['best_ms_per_frame']:.2f} ms/frame" if "best_ms_per_frame" in entry else ""
+        print(f"{entry['stage']:<20} {params:<45} {entry['best_seconds']:>9.4f} s  {per_frame}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resolutions", nargs="+", choices=sorted(RESOLUTIONS), default=["720p", "1080p"])
+    parser.add_argument("--elements", nargs="+", type=int, default=[4, 16])
+    parser.add_argument("--compositors", nargs="+", choices=[backend.value for backend in CompositorBackend], default=["pillow", "numpy"])
+    parser.add_argument("--encoder", choices=[profile.value for profile in EncoderProfile], default=None)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="JSON file to write; defaults to benchmark-<timestamp>.json")
+    parser.add_argument("--compare", default=None, help="Earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    report = run(args)
+    output = args.output or f"benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+
+    print_summary(report)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            compare(report, json.load(handle))
+    print(f"wrote {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,7 +48,7 @@ def create_scene(telop: str, slide: str) -> Scene:
     return scene
 
 def main():
-    start = time.time()
+    start = time.perf_counter()
     
     scene_configs = [
         SceneConfig(telop="Every night, \nTom waited at the small train station.", slide="assets/sample1.jpg"),
@@ -91,10 +91,11 @@ def main():
     
     editor.add_scene(bg_scene, layer=Layer.BOTTOM)
     
-    end = time.time()
-    print(f"{end-start}")
+    built = time.perf_counter()
+    print(f"build: {built - start:.3f}s")
     
     editor.render(output_path="assets/youtube.mp4")
+    print(f"render: {time.perf_counter() - built:.3f}s")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 from openframe.scene import Scene
 from openframe.text import TextClip
 from openframe.image import ImageClip
-from openframe.audio import AudioClip
+from openframe.audio import AudioClip, AudioLayout
 from openframe.video import VideoClip
+from openframe.encoder import EncoderSettings
+from openframe.sink import Sink, ContainerSink, CallbackSink
+from openframe.stats import RenderStats
 from openframe.shape import ShapeClip, Rectangle, Circle, Triangle
-from openframe.util import ContentMode, Layer, AnchorPoint, TextAlign
+from openframe.util import ContentMode, Layer, AnchorPoint, TextAlign, CompositorBackend, EncoderProfile, Interpolation
@@ -1,16 +1,27 @@
+import json
+import math
+import os
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
+from typing import BinaryIO
 
 import av
 import numpy as np
 
+from openframe.cache import atomic_output, cache_dir, cache_stem, source_stat
+
+AUDIO_DECODE_BLOCK = 65536
+AUDIO_CACHE_NAMESPACE = "audio"
+
 
 class AudioLayout(Enum):
     MONO = "mono"
     STEREO = "stereo"
+    SURROUND_5_1 = "5.1"
+
 
-@lru_cache(maxsize=64)
 def _source_duration_cached(path: str) -> float:
     """Return cached duration for the given audio source.
 
@@ -21,14 +32,49 @@ def _source_duration_cached(path: str) -> float:
         float: Duration in seconds.
     """
 
+    return _source_duration(*source_stat(path))
+
+
+@lru_cache(maxsize=64)
+def _source_duration(path: str, mtime_ns: int, size: int) -> float:
+    """Return a source's duration, reading it from the disk cache when present.
+
+    Args:
+        path: Absolute path of the source.
+        mtime_ns: Modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        float: Duration in seconds.
+    """
+
+    try:
+        metadata_path = os.path.join(cache_dir(AUDIO_CACHE_NAMESPACE), f"{cache_stem(path, mtime_ns, size)}.json")
+    except OSError:
+        metadata_path = None
+
+    if metadata_path is not None and os.path.exists(metadata_path):
+        try:
+            with open(metadata_path, encoding="utf-8") as handle:
+                return float(json.load(handle)["duration"])
+        except (OSError, ValueError, KeyError):
+            pass
+
     container = av.open(path)
     stream = container.streams.audio[0]
     duration = float(stream.duration * stream.time_base)
     container.close()
+
+    if metadata_path is not None:
+        metadata = {"path": path, "mtime_ns": mtime_ns, "size": size, "duration": duration}
+        try:
+            with atomic_output(metadata_path) as handle:
+                handle.write(json.dumps(metadata).encode("utf-8"))
+        except OSError:
+            pass
     return duration
 
 
-@lru_cache(maxsize=16)
 def _decode_audio_cached(path: str, sample_rate: int, layout: str) -> np.ndarray:
     """Decode and cache audio samples for a given source and format.
 
@@ -38,24 +84,340 @@ def _decode_audio_cached(path: str, sample_rate: int, layout: str) -> np.ndarray
         layout: Audio layout name.
 
     Returns:
-        np.ndarray: Audio samples shaped as (samples, channels).
+        np.ndarray: Read-only float32 samples shaped as (samples, channels).
     """
 
-    container = av.open(path)
-    stream = container.streams.audio[0]
-    resampler = av.AudioResampler(format="fltp", layout=layout, rate=sample_rate)
-    frames: list[np.ndarray] = []
+    return _load_pcm(*source_stat(path), sample_rate, layout)
 
-    for frame in container.decode(stream):
-        resampled = resampler.resample(frame) or []
-        if not isinstance(resampled, list):
-            resampled = [resampled]
-        frames.extend([chunk.to_ndarray() for chunk in resampled])
 
-    container.close()
+@lru_cache(maxsize=16)
+def _load_pcm(path: str, mtime_ns: int, size: int, sample_rate: int, layout: str) -> np.ndarray:
+    """Memory-map a source's samples in one format, decoding them on a cache miss.
+
+    Samples are stored as raw float32 PCM in the disk cache, keyed by the
+    source's path, modification time, and size plus the target format, so
+    later processes map the file instead of decoding again. When the cache
+    directory is not writable the samples go to an unnamed temporary file.
+
+    Args:
+        path: Absolute path of the source.
+        mtime_ns: Modification time in nanoseconds.
+        size: File size in bytes.
+        sample_rate: Target sample rate.
+        layout: Audio layout name.
+
+    Returns:
+        np.ndarray: Read-only float32 samples shaped as (samples, channels).
+    """
+
+    channels = len(av.AudioLayout(layout).channels)
+    try:
+        directory = cache_dir(AUDIO_CACHE_NAMESPACE)
+        pcm_path = os.path.join(directory, f"{cache_stem(path, mtime_ns, size)}-{sample_rate}-{layout}.pcm")
+        if not os.path.exists(pcm_path):
+            with atomic_output(pcm_path) as handle:
+                _decode_into(handle, path, sample_rate, layout)
+        return _map_pcm(pcm_path, channels)
+    except OSError:
+        pass
 
-    merged = np.concatenate(frames, axis=1)
-    return merged.T.astype(np.float32)
+    with tempfile.TemporaryFile(prefix="openframe-audio-") as handle:
+        _decode_into(handle, path, sample_rate, layout)
+        handle.flush()
+        return _map_pcm(handle, channels)
+
+
+def _decode_into(handle: BinaryIO, path: str, sample_rate: int, layout: str) -> None:
+    """Decode and resample a source block by block into raw float32 PCM.
+
+    Args:
+        handle: Binary file receiving interleaved samples.
+        path: File path for the audio asset.
+        sample_rate: Target sample rate.
+        layout: Audio layout name.
+    """
+
+    decoder = _SourceDecoder(path, sample_rate, layout)
+    try:
+        while True:
+            block = decoder.read(AUDIO_DECODE_BLOCK)
+            if block.shape[0] == 0:
+                break
+            handle.write(np.ascontiguousarray(block).tobytes())
+    finally:
+        decoder.close()
+
+
+def _map_pcm(source: str | BinaryIO, channels: int) -> np.ndarray:
+    """Memory-map raw float32 PCM read-only.
+
+    Args:
+        source: File path or open binary file holding the samples.
+        channels: Number of interleaved channels.
+
+    Returns:
+        np.ndarray: Samples shaped as (samples, channels).
+    """
+
+    byte_count = os.path.getsize(source) if isinstance(source, str) else os.fstat(source.fileno()).st_size
+    samples = byte_count // (4 * channels)
+    if samples == 0:
+        return np.zeros((0, channels), dtype=np.float32)
+    return np.memmap(source, dtype=np.float32, mode="r", shape=(samples, channels))
+
+
+def _layout_for_channels(channels: int) -> str:
+    """Return the name of the supported layout with the given channel count.
+
+    Args:
+        channels: Number of output channels.
+
+    Returns:
+        str: Audio layout name.
+    """
+
+    for layout in AudioLayout:
+        if len(av.AudioLayout(layout.value).channels) == channels:
+            return layout.value
+    raise ValueError(f"Unsupported channel count: {channels}.")
+
+
+def _channel_gains(layout: str, pan: float) -> np.ndarray | None:
+    """Return per-channel gains that place a clip in the stereo field.
+
+    Constant-power panning keeps both sides at unity when pan is 0.0. Left
+    channels of the layout follow the left gain, right channels the right
+    gain, and center or LFE channels are left untouched.
+
+    Args:
+        layout: Audio layout name.
+        pan: Position from -1.0 (left) to 1.0 (right).
+
+    Returns:
+        np.ndarray | None: Float32 gains shaped as (channels,), or None when
+        no channel changes.
+    """
+
+    if pan == 0.0:
+        return None
+
+    angle = (pan + 1.0) * math.pi / 4.0
+    left, right = math.cos(angle) * math.sqrt(2.0), math.sin(angle) * math.sqrt(2.0)
+    gains = []
+    for channel in av.AudioLayout(layout).channels:
+        if channel.name.endswith("L"):
+            gains.append(left)
+        elif channel.name.endswith("R"):
+            gains.append(right)
+        else:
+            gains.append(1.0)
+
+    if all(gain == 1.0 for gain in gains):
+        return None
+    return np.array(gains, dtype=np.float32)
+
+
+class _SourceDecoder:
+    """Decode an audio source sequentially into resampled samples.
+
+    Only the samples of the frame currently being consumed are held in
+    memory, so sources of any length can be streamed into the disk cache.
+    """
+
+    def __init__(self, path: str, sample_rate: int, layout: str) -> None:
+        """Open the source for decoding.
+
+        Args:
+            path: File path for the audio asset.
+            sample_rate: Target sample rate.
+            layout: Audio layout name.
+        """
+
+        self._container = av.open(path)
+        self._stream = self._container.streams.audio[0]
+        self._resampler = av.AudioResampler(format="fltp", layout=layout, rate=sample_rate)
+        self._channels = len(av.AudioLayout(layout).channels)
+        self._frames = self._container.decode(self._stream)
+        self._carry: np.ndarray | None = None
+
+    def read(self, count: int) -> np.ndarray:
+        """Return the next samples, fewer than count only once the source ends.
+
+        Args:
+            count: Maximum number of samples to return.
+
+        Returns:
+            np.ndarray: Samples shaped as (samples, channels).
+        """
+
+        parts: list[np.ndarray] = []
+        filled = 0
+        while filled < count:
+            if self._carry is None or self._carry.shape[1] == 0:
+                self._carry = self._decode_next()
+                if self._carry is None:
+                    break
+
+            take = min(count - filled, self._carry.shape[1])
+            parts.append(self._carry[:, :take])
+            self._carry = self._carry[:, take:]
+            filled += take
+
+        if not parts:
+            return np.zeros((0, self._channels), dtype=np.float32)
+        return np.concatenate(parts, axis=1).T
+
+    def close(self) -> None:
+        """Close the underlying container."""
+
+        self._container.close()
+
+    def _decode_next(self) -> np.ndarray | None:
+        """Decode and resample frames until some samples are produced.
+
+        Returns:
+            np.ndarray | None: Planar samples shaped as (channels, samples), or
+            None once the source is exhausted.
+        """
+
+        for frame in self._frames:
+            resampled = self._resampler.resample(frame) or []
+            if not isinstance(resampled, list):
+                resampled = [resampled]
+            if resampled:
+                return np.concatenate([chunk.to_ndarray() for chunk in resampled], axis=1).astype(np.float32, copy=False)
+        return None
+
+
+class AudioClipReader:
+    """Produce a clip's samples block by block in timeline order.
+
+    Samples are sliced from the source decoded once per format by
+    _decode_audio_cached, looping clips wrap around the source range, and
+    fades, volume, and pan are applied to each block as it is read, so
+    memory does not grow with clip length.
+    """
+
+    def __init__(self, clip: 'AudioClip', sample_rate: int, layout: str) -> None:
+        """Prepare a reader without decoding the source.
+
+        Args:
+            clip: Audio clip to read.
+            sample_rate: Target sample rate.
+            layout: Audio layout name.
+        """
+
+        self.clip = clip
+        self.sample_rate = sample_rate
+        self.layout = layout
+        self.channels = len(av.AudioLayout(layout).channels)
+        self.length = max(0, int(clip.duration * sample_rate))
+        gains = _channel_gains(layout, clip.pan)
+        self._scale = clip.volume if gains is None else gains * clip.volume
+        self._segment: np.ndarray | None = None
+
+    @property
+    def total(self) -> int:
+        """Return the number of samples the clip actually plays.
+
+        Looping clips play for their full length; other clips stop early when
+        the source range is shorter than their duration.
+
+        Returns:
+            int: Number of samples.
+        """
+
+        if self.clip.loop_enable:
+            return self.length
+        return min(self.length, self._source_segment().shape[0])
+
+    def read(self, position: int, count: int) -> np.ndarray:
+        """Return count samples starting at a clip-relative sample position.
+
+        Samples past the end of the clip are zero.
+
+        Args:
+            position: First sample to read, relative to the clip start.
+            count: Number of samples to return.
+
+        Returns:
+            np.ndarray: Samples shaped as (samples, channels).
+        """
+
+        block = np.zeros((count, self.channels), dtype=np.float32)
+        if position >= self.length:
+            return block
+
+        segment = self._source_segment()
+        span = segment.shape[0]
+        total = self.total
+        available = max(0, min(count, total - position))
+        if available == 0 or span == 0:
+            return block
+
+        if not self.clip.loop_enable:
+            block[:available] = segment[position : position + available]
+        else:
+            offset = position % span
+            head = min(available, span - offset)
+            block[:head] = segment[offset : offset + head]
+            repetitions, tail = divmod(available - head, span)
+            if repetitions:
+                body = block[head : head + repetitions * span]
+                body.reshape(repetitions, span, self.channels)[:] = segment
+            if tail:
+                block[available - tail : available] = segment[:tail]
+
+        self._apply_envelope(block[:available], position, total)
+        return block
+
+    def close(self) -> None:
+        """Drop the reference to the decoded source."""
+
+        self._segment = None
+
+    def _source_segment(self) -> np.ndarray:
+        """Return the clip's source range from the decoded source.
+
+        Returns:
+            np.ndarray: Memory-mapped samples shaped as (samples, channels).
+        """
+
+        if self._segment is None:
+            audio = self.clip._decode_audio(self.sample_rate, self.layout)
+            start_idx = int(self.clip.source_start * self.sample_rate)
+            end_idx = int(self.clip.source_end * self.sample_rate) if self.clip.source_end is not None else audio.shape[0]
+            self._segment = audio[start_idx:end_idx]
+        return self._segment
+
+    def _apply_envelope(self, block: np.ndarray, position: int, total: int) -> None:
+        """Apply fades, volume, and pan in place to samples starting at position.
+
+        Fade ramps are built and multiplied only over the samples they cover;
+        volume and pan are folded into a single per-channel scale.
+
+        Args:
+            block: Samples shaped as (samples, channels).
+            position: Clip-relative position of the first sample.
+            total: Number of samples the clip actually plays.
+        """
+
+        count = block.shape[0]
+        fade_in = min(total, int(self.clip.fade_in_duration * self.sample_rate))
+        if position < fade_in:
+            stop = min(count, fade_in - position)
+            ramp = np.arange(position, position + stop) / fade_in
+            block[:stop] *= ramp.astype(np.float32)[:, None]
+
+        fade_out = min(total, int(self.clip.fade_out_duration * self.sample_rate))
+        fade_start = total - fade_out
+        if fade_out > 0 and position + count > fade_start:
+            first = max(0, fade_start - position)
+            ramp = (total - np.arange(position + first, position + count)) / fade_out
+            block[first:] *= ramp.astype(np.float32)[:, None]
+
+        if np.any(self._scale != 1.0):
+            block *= self._scale
 
 
 @dataclass(kw_only=True)
@@ -63,6 +425,7 @@ class AudioClip:
     """Represent an audio segment placed on the scene timeline.
 
     The clip can repeat automatically when loop_enable is True and the requested duration exceeds the source length.
+    Set pan between -1.0 (left) and 1.0 (right) to position the clip when mixing to stereo or surround layouts.
     """
 
     path: str
@@ -73,6 +436,16 @@ class AudioClip:
     fade_in_duration: float = 0.0
     fade_out_duration: float = 0.0
     volume: float = 1.0
+    pan: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validate the pan position.
+
+        Returns:
+            None
+        """
+        if not -1.0 <= self.pan <= 1.0:
+            raise ValueError("pan must be between -1.0 and 1.0.")
 
     @property
     def duration(self) -> float:
@@ -96,72 +469,35 @@ class AudioClip:
     def render(self, sample_rate: int, channels: int) -> np.ndarray:
         """Decode and return audio samples aligned to the requested format.
 
+        Looping clips are filled by broadcasting the source range into the
+        output, and fades are applied only where they reach, so the result is
+        the only full-length array allocated.
+
         Args:
             sample_rate (int): Target sample rate.
-            channels (int): Target number of channels (ignored; mono only).
+            channels (int): Target number of channels: 1 for mono, 2 for
+                stereo, or 6 for 5.1.
 
         Returns:
             np.ndarray: Audio samples shaped as (samples, channels).
         """
-        audio = self._decode_audio(sample_rate, AudioLayout.MONO.value)
-        start_idx = int(self.source_start * sample_rate)
-        end_idx = int(self.source_end * sample_rate) if self.source_end is not None else audio.shape[0]
-        desired_samples = max(0, int(self.duration * sample_rate))
-        segment = audio[start_idx:end_idx]
-
-        if not self.loop_enable or desired_samples <= segment.shape[0]:
-            trimmed = segment[:desired_samples]
-        elif desired_samples == 0 or segment.shape[0] == 0:
-            channels_count = audio.shape[1]
-            trimmed = np.zeros((desired_samples, channels_count), dtype=np.float32)
-        else:
-            repetitions = desired_samples // segment.shape[0]
-            remainder = desired_samples % segment.shape[0]
-            chunks = [segment] * repetitions
-            if remainder:
-                chunks.append(segment[:remainder])
-            trimmed = np.concatenate(chunks, axis=0)
-
-        return self._apply_fades(trimmed, sample_rate)
+        reader = self.reader(sample_rate, _layout_for_channels(channels))
+        try:
+            return reader.read(0, reader.total)
+        finally:
+            reader.close()
 
-    def _apply_fades(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
-        """Apply fade-in and fade-out envelopes to the rendered samples.
+    def reader(self, sample_rate: int, layout: str) -> AudioClipReader:
+        """Return a reader that produces the clip's samples block by block.
 
         Args:
-            samples: The raw samples to shape.
-            sample_rate: Number of samples per second used for sizing fades.
+            sample_rate (int): Target sample rate.
+            layout (str): Audio layout name.
 
         Returns:
-            np.ndarray: Samples with fade envelopes applied.
+            AudioClipReader: Reader positioned at the start of the clip.
         """
-        if samples.shape[0] == 0:
-            return samples
-
-        total_samples = samples.shape[0]
-        envelope = np.ones(total_samples, dtype=np.float32)
-
-        fade_in_samples = min(total_samples, int(self.fade_in_duration * sample_rate))
-        if fade_in_samples > 0:
-            envelope[:fade_in_samples] = np.linspace(
-                0.0,
-                1.0,
-                fade_in_samples,
-                dtype=np.float32,
-                endpoint=False,
-            )
-
-        fade_out_samples = min(total_samples, int(self.fade_out_duration * sample_rate))
-        if fade_out_samples > 0:
-            fade_out_curve = np.linspace(
-                1.0,
-                0.0,
-                fade_out_samples,
-                dtype=np.float32,
-                endpoint=False,
-            )
-            envelope[-fade_out_samples:] *= fade_out_curve
-
-        return samples * envelope[:, None] * self.volume
+        return AudioClipReader(self, sample_rate, layout)
 
     def _source_duration(self) -> float:
         """Return source audio duration in seconds.
@@ -0,0 +1,176 @@
+import hashlib
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Hashable, Iterator
+
+CACHE_DIR_ENV = "OPENFRAME_CACHE_DIR"
+
+
+def cache_dir(namespace: str) -> str:
+    """Return the directory holding one kind of persistent cache, creating it.
+
+    The root is $OPENFRAME_CACHE_DIR when set, otherwise openframe inside
+    $XDG_CACHE_HOME or ~/.cache.
+
+    Args:
+        namespace: Subdirectory name for the cache kind, such as "audio".
+
+    Returns:
+        str: Absolute path of the cache directory.
+    """
+
+    root = os.environ.get(CACHE_DIR_ENV)
+    if not root:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        root = os.path.join(base, "openframe")
+
+    directory = os.path.abspath(os.path.join(root, namespace))
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def source_stat(path: str) -> tuple[str, int, int]:
+    """Return the identity of a source file for cache lookups.
+
+    Args:
+        path: File path of the source.
+
+    Returns:
+        tuple[str, int, int]: Absolute path, modification time in
+        nanoseconds, and size in bytes.
+    """
+
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def cache_stem(path: str, mtime_ns: int, size: int) -> str:
+    """Return the file name stem of a source's entries in the disk cache.
+
+    Args:
+        path: Absolute path of the source.
+        mtime_ns: Modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        str: Hex digest identifying this version of the source.
+    """
+
+    return hashlib.sha1(f"{path}\n{mtime_ns}\n{size}".encode()).hexdigest()
+
+
+@contextmanager
+def atomic_output(path: str) -> Iterator[BinaryIO]:
+    """Write a file under a temporary name and move it into place on success.
+
+    Concurrent readers, including other processes sharing the cache, see
+    either no file or the complete file, never a partial one.
+
+    Args:
+        path: Final file path.
+
+    Yields:
+        BinaryIO: File opened for binary writing.
+    """
+
+    partial_path = f"{path}.{os.getpid()}.partial"
+    try:
+        with open(partial_path, "wb") as handle:
+            yield handle
+        os.replace(partial_path, path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
+class ByteLRUCache:
+    """Least-recently-used cache whose capacity is measured in bytes.
+
+    Entries are evicted oldest first once the summed sizes exceed the budget.
+    A single entry larger than the whole budget is not stored.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Maximum combined size of all entries in bytes.
+        """
+
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """Return the combined size of all cached entries in bytes."""
+
+        return self._size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing.
+
+        Returns:
+            Any: Cached value or default.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """Store a value, evicting older entries to stay within budget.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            nbytes: Size of the value in bytes.
+        """
+
+        self.pop(key)
+        if nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = (value, nbytes)
+        self._size += nbytes
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= evicted
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove an entry and return its value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Any: Removed value, or None when the key is missing.
+        """
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        self._size -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+
+        self._entries.clear()
+        self._size = 0
@@ -0,0 +1,557 @@
+import time
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+import av
+import numpy as np
+from PIL import Image
+
+from openframe.cache import ByteLRUCache
+from openframe.stats import active_stats
+from openframe.util import CompositorBackend
+
+PREMULTIPLIED_CACHE_BYTES = 512 * 1024 * 1024
+FULL_FRAME_DIRTY_RATIO = 0.5
+
+_premultiplied_cache = ByteLRUCache(PREMULTIPLIED_CACHE_BYTES)
+
+
+@dataclass(frozen=True)
+class Premultiplied:
+    """Float pixels ready to be blended onto a NumPy canvas.
+
+    Attributes:
+        rgb: Color channels multiplied by alpha, shaped (height, width, 3).
+        alpha: Coverage in the 0.0-1.0 range shaped (height, width, 1), or None
+            when every pixel is fully opaque.
+    """
+
+    rgb: np.ndarray
+    alpha: np.ndarray | None
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the pixel arrays."""
+
+        return self.rgb.nbytes + (0 if self.alpha is None else self.alpha.nbytes)
+
+
+def premultiply(image: Image.Image) -> Premultiplied:
+    """Convert an RGBA image into premultiplied float pixels.
+
+    Args:
+        image: Source RGBA image.
+
+    Returns:
+        Premultiplied: Pixels ready for blending.
+    """
+
+    pixels = np.asarray(image.convert('RGBA') if image.mode != 'RGBA' else image)
+    rgb = pixels[..., :3].astype(np.float32)
+    alpha_channel = pixels[..., 3:]
+
+    if alpha_channel.min() == 255:
+        return Premultiplied(rgb=rgb, alpha=None)
+
+    alpha = alpha_channel.astype(np.float32)
+    alpha *= 1.0 / 255.0
+    rgb *= alpha
+    return Premultiplied(rgb=rgb, alpha=alpha)
+
+
+def premultiply_cached(image: Image.Image) -> Premultiplied:
+    """Return premultiplied pixels for an image that never changes.
+
+    Entries are keyed by image identity and keep the image alive, so an id is
+    never reused while its entry is cached.
+
+    Args:
+        image: Static RGBA image owned by an element.
+
+    Returns:
+        Premultiplied: Cached pixels ready for blending.
+    """
+
+    key = id(image)
+    entry = _premultiplied_cache.get(key)
+    if entry is not None:
+        return entry[1]
+
+    pixels = premultiply(image)
+    _premultiplied_cache.put(key, (image, pixels), pixels.nbytes)
+    return pixels
+
+
+def blend(
+    canvas: np.ndarray,
+    pixels: Premultiplied,
+    position: Tuple[int, int],
+    opacity: float,
+) -> None:
+    """Alpha-blend premultiplied pixels into a region of the canvas in place.
+
+    Args:
+        canvas: Float RGB canvas shaped (height, width, 3).
+        pixels: Premultiplied source pixels.
+        position: Top-left destination coordinate, which may lie off-canvas.
+        opacity: Extra opacity applied as a scalar multiplier.
+    """
+
+    canvas_height, canvas_width = canvas.shape[:2]
+    source_height, source_width = pixels.rgb.shape[:2]
+    x, y = position
+
+    left, top = max(0, x), max(0, y)
+    right = min(canvas_width, x + source_width)
+    bottom = min(canvas_height, y + source_height)
+    if right <= left or bottom <= top:
+        return
+
+    region = canvas[top:bottom, left:right]
+    source = (slice(top - y, bottom - y), slice(left - x, right - x))
+    rgb = pixels.rgb[source]
+
+    if pixels.alpha is None and opacity >= 1.0:
+        region[...] = rgb
+        return
+
+    if pixels.alpha is None:
+        region *= 1.0 - opacity
+        region += rgb * opacity
+        return
+
+    alpha = pixels.alpha[source]
+    if opacity >= 1.0:
+        region -= region * alpha
+        region += rgb
+        return
+
+    region -= region * (alpha * opacity)
+    region += rgb * opacity
+
+
+def stack(layers: Iterable[tuple[Premultiplied, Tuple[int, int]]], size: Tuple[int, int]) -> Premultiplied:
+    """Flatten premultiplied layers into one, as if blended one by one.
+
+    Blending the result onto a canvas matches blending every layer in order,
+    up to float rounding.
+
+    Args:
+        layers: Pixels and top-left positions relative to the result, bottom
+            layer first.
+        size: Width and height of the result.
+
+    Returns:
+        Premultiplied: Combined pixels and coverage.
+    """
+
+    width, height = size
+    rgb = np.zeros((height, width, 3), dtype=np.float32)
+    transmittance = np.ones((height, width, 1), dtype=np.float32)
+    for pixels, position in layers:
+        blend(rgb, pixels, position, 1.0)
+        blocked = Premultiplied(rgb=np.zeros(pixels.rgb.shape[:2] + (1,), dtype=np.float32), alpha=pixels.alpha)
+        blend(transmittance, blocked, position, 1.0)
+
+    if transmittance.max() == 0.0:
+        return Premultiplied(rgb=rgb, alpha=None)
+    np.subtract(1.0, transmittance, out=transmittance)
+    return Premultiplied(rgb=rgb, alpha=transmittance)
+
+
+Box = Tuple[int, int, int, int]
+
+
+def _overlaps(first: Box, second: Box) -> bool:
+    """Report whether two (left, top, right, bottom) boxes overlap or touch.
+
+    Args:
+        first: First box.
+        second: Second box.
+
+    Returns:
+        bool: True when the boxes share an edge or any area.
+    """
+
+    return first[0] <= second[2] and second[0] <= first[2] and first[1] <= second[3] and second[1] <= first[3]
+
+
+def _intersects(first: Box, second: Box) -> bool:
+    """Report whether two (left, top, right, bottom) boxes share any area.
+
+    Args:
+        first: First box.
+        second: Second box.
+
+    Returns:
+        bool: True when the boxes overlap.
+    """
+
+    return first[0] < second[2] and second[0] < first[2] and first[1] < second[3] and second[1] < first[3]
+
+
+def _merge_boxes(boxes: Iterable[Box]) -> list[Box]:
+    """Merge overlapping boxes until the remaining boxes are disjoint.
+
+    Args:
+        boxes: Boxes as (left, top, right, bottom).
+
+    Returns:
+        list[Box]: Disjoint boxes covering every input box.
+    """
+
+    merged: list[Box] = []
+    for box in boxes:
+        index = 0
+        while index < len(merged):
+            other = merged[index]
+            if _overlaps(box, other):
+                box = (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+                del merged[index]
+                index = 0
+            else:
+                index += 1
+        merged.append(box)
+    return merged
+
+
+@dataclass(frozen=True, eq=False)
+class _Drawn:
+    """What one element contributed to the previous frame.
+
+    Attributes:
+        clip: Placement that was drawn.
+        content: Image the pixels came from, or None when unknown.
+        box: Frame region covered as (left, top, right, bottom), or None when
+            the element lies entirely off-frame.
+        opacity: Opacity the element was drawn at.
+    """
+
+    clip: object
+    content: Image.Image | None
+    box: Box | None
+    opacity: float
+
+    def unchanged(self, previous: '_Drawn') -> bool:
+        """Report whether the element draws the same pixels as before.
+
+        Args:
+            previous: Record of the same placement in the previous frame.
+
+        Returns:
+            bool: True when the region, opacity, and content all match.
+        """
+
+        if self.box != previous.box or self.opacity != previous.opacity:
+            return False
+        return self.opacity <= 0 or (self.content is not None and self.content is previous.content)
+
+
+class _FrameBuffer:
+    """Own the output pixels of a compositor and a VideoFrame sharing them.
+
+    Compositors write each frame into the same array, so handing the frame to
+    an encoder copies nothing. Because the buffer still holds the previous
+    frame, only regions whose elements changed are composited again. The
+    buffers are dropped when pickled and allocated again on first use.
+    """
+
+    pixel_format = 'rgba'
+    channels = 4
+
+    def __init__(self, width: int, height: int) -> None:
+        """Configure the frame size.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+        """
+
+        self.width = width
+        self.height = height
+        self._pixels: np.ndarray | None = None
+        self._video_frame: av.VideoFrame | None = None
+        self._drawn: list[_Drawn] | None = None
+
+    def __getstate__(self) -> dict:
+        """Drop the buffers, which are rebuilt lazily after unpickling."""
+
+        state = self.__dict__.copy()
+        state.update({name: None for name in self._buffer_attributes()})
+        return state
+
+    @property
+    def video_frame(self) -> av.VideoFrame:
+        """Return the VideoFrame whose pixels are the latest composed frame."""
+
+        self._ensure_buffer()
+        return self._video_frame
+
+    def _ensure_buffer(self) -> np.ndarray:
+        """Allocate the shared pixel buffer on first use.
+
+        Returns:
+            np.ndarray: Pixel buffer shaped (height, width, channels).
+        """
+
+        if self._pixels is None:
+            self._pixels = np.zeros((self.height, self.width, self.channels), dtype=np.uint8)
+            self._video_frame = av.VideoFrame.from_numpy_buffer(self._pixels, format=self.pixel_format)
+        return self._pixels
+
+    def _buffer_attributes(self) -> tuple[str, ...]:
+        """Return the attributes holding buffers that cannot be pickled."""
+
+        return ('_pixels', '_video_frame', '_drawn')
+
+    def _frame_view(self) -> np.ndarray:
+        """Return a read-only view of the shared buffer.
+
+        Later frames are composited on top of the buffer's contents, so
+        callers must not write to it.
+
+        Returns:
+            np.ndarray: View of the latest composed frame.
+        """
+
+        view = self._pixels.view()
+        view.flags.writeable = False
+        return view
+
+    def _dirty_regions(self, elements: list, t: float) -> tuple[list[Box], list[Box | None]]:
+        """Find the frame regions that differ from the previous frame.
+
+        Regions covered by elements that appeared, disappeared, moved, faded,
+        or changed content are dirty; every element overlapping a dirty region
+        is drawn again there, so layers above and below are kept intact. A
+        change in stacking order, or dirty regions covering more than
+        FULL_FRAME_DIRTY_RATIO of the frame, dirties the whole frame.
+
+        Args:
+            elements: Visible elements in z-order.
+            t: Timeline time in seconds.
+
+        Returns:
+            tuple[list[Box], list[Box | None]]: Disjoint dirty boxes, and the
+            box of every element in the order given.
+        """
+
+        drawn = []
+        for clip in elements:
+            opacity = clip.opacity_at(t)
+            drawn.append(_Drawn(clip, clip._content_at(t) if opacity > 0 else None, self._element_box(clip), opacity))
+
+        previous, self._drawn = self._drawn, drawn
+        boxes = [entry.box for entry in drawn]
+        full = [(0, 0, self.width, self.height)]
+        if previous is None:
+            return full, boxes
+
+        before = {id(entry.clip): entry for entry in previous}
+        after = {id(entry.clip) for entry in drawn}
+        kept = [id(entry.clip) for entry in drawn if id(entry.clip) in before]
+        if kept != [id(entry.clip) for entry in previous if id(entry.clip) in after]:
+            return full, boxes
+
+        dirty = [entry.box for entry in previous if id(entry.clip) not in after]
+        for entry in drawn:
+            old = before.get(id(entry.clip))
+            if old is None:
+                dirty.append(entry.box)
+            elif not entry.unchanged(old):
+                dirty.extend((old.box, entry.box))
+
+        regions = _merge_boxes(box for box in dirty if box is not None)
+        area = sum((right - left) * (bottom - top) for left, top, right, bottom in regions)
+        if area > FULL_FRAME_DIRTY_RATIO * self.width * self.height:
+            return full, boxes
+        return regions, boxes
+
+    def _element_box(self, clip) -> Box | None:
+        """Return the frame region an element draws into.
+
+        Args:
+            clip: Visible element.
+
+        Returns:
+            Box | None: Region clipped to the frame, or None when off-frame.
+        """
+
+        x, y = clip.element.render_position
+        width, height = clip.element.bounding_box_size
+        left, top = max(0, x), max(0, y)
+        right, bottom = min(self.width, x + max(1, width)), min(self.height, y + max(1, height))
+        if right <= left or bottom <= top:
+            return None
+        return left, top, right, bottom
+
+    def _count_composited(self, regions: list[Box]) -> None:
+        """Record how many pixels were composited for the frame.
+
+        Args:
+            regions: Composited boxes.
+        """
+
+        stats = active_stats()
+        if stats is not None:
+            stats.count("composited_pixels", sum((right - left) * (bottom - top) for left, top, right, bottom in regions))
+
+
+class PillowCompositor(_FrameBuffer):
+    """Composite frames by pasting RGBA overlays onto a Pillow canvas.
+
+    The canvas is a Pillow image mapped onto the shared pixel buffer, so
+    pasted overlays land directly in the frame handed to the encoder.
+    """
+
+    pixel_format = 'rgba'
+    channels = 4
+
+    def __init__(self, width: int, height: int) -> None:
+        """Configure the frame size.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+        """
+
+        super().__init__(width, height)
+        self._canvas: Image.Image | None = None
+
+    def compose(self, elements: list, t: float) -> np.ndarray:
+        """Render visible elements into the shared RGBA frame.
+
+        Only regions that changed since the previous frame are redrawn; each
+        is rendered onto its own canvas and pasted into the frame.
+
+        Args:
+            elements: Visible elements in z-order.
+            t: Timeline time in seconds.
+
+        Returns:
+            np.ndarray: Read-only RGBA frame data. Every call returns a new
+            view of the same buffer, which the next call overwrites.
+        """
+
+        pixels = self._ensure_buffer()
+        if self._canvas is None:
+            self._canvas = Image.frombuffer('RGBA', (self.width, self.height), pixels, 'raw', 'RGBA', 0, 1)
+            # frombuffer marks mapped images read-only so that the first paste
+            # copies them; writing through to the buffer is the point here.
+            self._canvas.readonly = 0
+
+        regions, boxes = self._dirty_regions(elements, t)
+        self._count_composited(regions)
+        stats = active_stats()
+        for region in regions:
+            left, top, right, bottom = region
+            if region == (0, 0, self.width, self.height):
+                canvas = self._canvas
+                canvas.paste((0, 0, 0, 255), region)
+            else:
+                canvas = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 255))
+
+            for clip, box in zip(elements, boxes):
+                if box is None or not _intersects(box, region):
+                    continue
+                if stats is None:
+                    clip.render(canvas, t, (left, top))
+                    continue
+                started = time.perf_counter()
+                clip.render(canvas, t, (left, top))
+                stats.add_time(f"element:{type(clip.element).__name__}", time.perf_counter() - started)
+
+            if canvas is not self._canvas:
+                self._canvas.paste(canvas, (left, top))
+        return self._frame_view()
+
+    def _buffer_attributes(self) -> tuple[str, ...]:
+        """Return the attributes holding buffers that cannot be pickled."""
+
+        return super()._buffer_attributes() + ('_canvas',)
+
+
+class NumpyCompositor(_FrameBuffer):
+    """Composite frames by blending premultiplied pixels into a float canvas.
+
+    The canvas is allocated once and reused, and each element is blended only
+    inside its own region, so no full-frame overlays are created per element.
+    The result is rounded straight into the shared RGB frame buffer.
+
+    Elements contribute the same overlays the Pillow compositor pastes, but
+    Pillow rounds to 8 bits after every blend while the float canvas is
+    rounded once. Opaque content matches PillowCompositor within one level
+    per channel, and each overlapping translucent layer can add up to one
+    more level of difference.
+    """
+
+    pixel_format = 'rgb24'
+    channels = 3
+
+    def __init__(self, width: int, height: int) -> None:
+        """Configure the frame size.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+        """
+
+        super().__init__(width, height)
+        self._canvas: np.ndarray | None = None
+
+    def compose(self, elements: list, t: float) -> np.ndarray:
+        """Blend visible elements into the shared canvas.
+
+        Only regions that changed since the previous frame are blended again
+        and rounded into the frame buffer.
+
+        Args:
+            elements: Visible elements in z-order.
+            t: Timeline time in seconds.
+
+        Returns:
+            np.ndarray: Read-only RGB frame data as uint8. Every call returns a
+            new view of the same buffer, which the next call overwrites.
+        """
+
+        if self._canvas is None:
+            self._canvas = np.zeros((self.height, self.width, 3), dtype=np.float32)
+
+        pixels = self._ensure_buffer()
+        regions, boxes = self._dirty_regions(elements, t)
+        self._count_composited(regions)
+        stats = active_stats()
+        for region in regions:
+            left, top, right, bottom = region
+            canvas = self._canvas[top:bottom, left:right]
+            canvas.fill(0.0)
+            for clip, box in zip(elements, boxes):
+                if box is None or not _intersects(box, region):
+                    continue
+                if stats is None:
+                    clip.composite(canvas, t, (left, top))
+                    continue
+                started = time.perf_counter()
+                clip.composite(canvas, t, (left, top))
+                stats.add_time(f"element:{type(clip.element).__name__}", time.perf_counter() - started)
+
+            canvas += 0.5
+            np.copyto(pixels[top:bottom, left:right], canvas, casting='unsafe')
+        return self._frame_view()
+
+
+def create_compositor(backend: CompositorBackend, width: int, height: int) -> PillowCompositor | NumpyCompositor:
+    """Instantiate the compositor for the requested backend.
+
+    Args:
+        backend: Compositing backend.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+
+    Returns:
+        PillowCompositor | NumpyCompositor: Compositor for the frame size.
+    """
+
+    if backend == CompositorBackend.NUMPY:
+        return NumpyCompositor(width, height)
+    return PillowCompositor(width, height)
@@ -0,0 +1,745 @@
+import json
+import math
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Callable, Hashable
+
+import av
+from PIL import Image
+
+from openframe import stats
+from openframe.cache import ByteLRUCache, atomic_output, cache_dir, cache_stem, source_stat
+
+PREFETCH_POLL_SECONDS = 0.1
+SHARED_FRAME_CACHE_BYTES = 256 * 1024 * 1024
+SHARED_WINDOW_FRAMES = 512
+FORWARD_SEEK_SECONDS = 5.0
+KEYFRAME_INDEX_NAMESPACE = "video-index"
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """Stream metadata of a video file.
+
+    Attributes:
+        time_base: Stream time base in seconds, or None when missing.
+        duration: Stream duration in seconds, or None when missing.
+        width: Coded frame width in pixels.
+        height: Coded frame height in pixels.
+        frame_rate: Average frame rate, or 0.0 when unknown.
+    """
+
+    time_base: float | None
+    duration: float | None
+    width: int
+    height: int
+    frame_rate: float
+
+
+@lru_cache(maxsize=256)
+def probe_video(path: str) -> VideoInfo:
+    """Read the metadata of the first video stream once per path.
+
+    Args:
+        path: File path of the video source.
+
+    Returns:
+        VideoInfo: Metadata of the first video stream.
+    """
+
+    container = av.open(path)
+    try:
+        stream = container.streams.video[0]
+        time_base = None if stream.time_base is None else float(stream.time_base)
+        duration = None
+        if time_base is not None and stream.duration is not None:
+            duration = float(stream.duration * stream.time_base)
+        return VideoInfo(
+            time_base=time_base,
+            duration=duration,
+            width=stream.codec_context.width,
+            height=stream.codec_context.height,
+            frame_rate=float(stream.average_rate or stream.guessed_rate or 0),
+        )
+    finally:
+        container.close()
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    """Presentation times of a video stream's keyframes and how to seek to them.
+
+    Attributes:
+        times: Keyframe presentation times in seconds, ascending.
+        seek_timestamps: Presentation timestamp of each keyframe in stream
+            time base units, passed to container.seek unchanged so the seek
+            lands exactly on the keyframe.
+    """
+
+    times: tuple[float, ...]
+    seek_timestamps: tuple[int, ...]
+
+    def keyframe_before(self, target_time: float) -> tuple[float, int] | None:
+        """Return the last keyframe presented at or before target_time.
+
+        Args:
+            target_time: Source timestamp in seconds.
+
+        Returns:
+            tuple[float, int] | None: Keyframe time and seek timestamp, or None
+            when the index is empty.
+        """
+
+        if not self.times:
+            return None
+        index = max(0, bisect_right(self.times, target_time) - 1)
+        return self.times[index], self.seek_timestamps[index]
+
+
+def keyframe_index(path: str) -> KeyframeIndex:
+    """Return the keyframe index of a video file, building it at most once.
+
+    Args:
+        path: File path of the video source.
+
+    Returns:
+        KeyframeIndex: Keyframes of the first video stream.
+    """
+
+    return _load_keyframe_index(*source_stat(path))
+
+
+@lru_cache(maxsize=64)
+def _load_keyframe_index(path: str, mtime_ns: int, size: int) -> KeyframeIndex:
+    """Read a keyframe index from the disk cache, scanning the file on a miss.
+
+    The scan demuxes packets without decoding them. Indexes are keyed by the
+    file's path, modification time, and size, so an edited file is scanned
+    again.
+
+    Args:
+        path: Absolute path of the source.
+        mtime_ns: Modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        KeyframeIndex: Keyframes of the first video stream.
+    """
+
+    try:
+        index_path = os.path.join(cache_dir(KEYFRAME_INDEX_NAMESPACE), f"{cache_stem(path, mtime_ns, size)}.json")
+    except OSError:
+        index_path = None
+
+    if index_path is not None and os.path.exists(index_path):
+        try:
+            with open(index_path, encoding="utf-8") as handle:
+                entry = json.load(handle)
+            return KeyframeIndex(tuple(entry["times"]), tuple(entry["seek_timestamps"]))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    keyframes = []
+    container = av.open(path)
+    try:
+        stream = container.streams.video[0]
+        time_base = float(stream.time_base)
+        for packet in container.demux(stream):
+            if packet.is_keyframe and packet.pts is not None:
+                keyframes.append((float(packet.pts * time_base), packet.pts))
+    finally:
+        container.close()
+
+    keyframes.sort()
+    index = KeyframeIndex(tuple(time for time, _ in keyframes), tuple(timestamp for _, timestamp in keyframes))
+    if index_path is not None:
+        entry = {"path": path, "mtime_ns": mtime_ns, "size": size, **asdict(index)}
+        try:
+            with atomic_output(index_path) as handle:
+                handle.write(json.dumps(entry).encode("utf-8"))
+        except OSError:
+            pass
+    return index
+
+
+def seek_to_keyframe(
+    container: av.container.input.InputContainer,
+    stream: av.video.stream.VideoStream,
+    seek_time: float,
+    index: KeyframeIndex | None,
+) -> None:
+    """Position the demuxer on the last keyframe presented at or before seek_time.
+
+    Without an index the demuxer searches for the keyframe itself.
+
+    Args:
+        container: Input container holding the stream.
+        stream: Video stream to seek.
+        seek_time: Source timestamp in seconds.
+        index: Keyframe index of the file, or None to let the demuxer search.
+    """
+
+    keyframe = None if index is None else index.keyframe_before(seek_time)
+    if keyframe is not None:
+        timestamp = keyframe[1]
+    else:
+        timestamp = int(seek_time / float(stream.time_base))
+    container.seek(timestamp, stream=stream, any_frame=False, backward=True)
+
+
+def frame_timestamp(frame: av.VideoFrame, time_base: float) -> float:
+    """Return the presentation timestamp in seconds for a decoded frame.
+
+    Args:
+        frame: Video frame from PyAV.
+        time_base: Stream time base in seconds.
+
+    Returns:
+        float: Frame timestamp in seconds.
+    """
+
+    if frame.pts is not None:
+        return float(frame.pts * time_base)
+    if frame.time is not None:
+        return float(frame.time)
+    raise ValueError("Decoded frame does not provide timing information.")
+
+
+class FramePrefetcher:
+    """Decode and process video frames ahead of the renderer on a background thread.
+
+    The thread owns its own container and fills a bounded buffer with
+    (lap, timestamp, image) tuples in source order. Looping sources wrap back
+    to the start and increment the lap, so the consumer can tell a new pass
+    apart from an earlier timestamp. PyAV and Pillow release the GIL while
+    decoding and scaling, which lets that work overlap with compositing.
+    Seeks past the start of the file go through the keyframe index.
+
+    Once the consumer reports its playback stride through hint, frames that
+    no upcoming target will select are buffered as raw decoded frames instead
+    of being scaled, so fast playback does not scale frames it drops.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start_time: float,
+        end_time: float,
+        loop: bool,
+        process: Callable[[av.VideoFrame], Image.Image],
+        capacity: int,
+    ) -> None:
+        """Configure the prefetcher without starting it.
+
+        Args:
+            path: File path of the video source.
+            start_time: First source timestamp to emit, in seconds.
+            end_time: Last source timestamp to emit, in seconds.
+            loop: Whether to wrap around to start_time after end_time.
+            process: Converts a decoded frame into the image to buffer.
+            capacity: Maximum number of processed frames held in the buffer.
+        """
+
+        self.path = path
+        self.start_time = start_time
+        self.end_time = end_time
+        self.loop = loop
+        self.process = process
+        self._buffer: queue.Queue = queue.Queue(maxsize=max(1, capacity))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._finished = False
+        self._hint: tuple[float, float] | None = None
+
+    def start(self, seek_time: float) -> None:
+        """Start decoding from the keyframe at or before seek_time.
+
+        Args:
+            seek_time: Source time in seconds to begin decoding from.
+        """
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(seek_time,),
+            name=f"openframe-prefetch:{self.path}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def hint(self, target_time: float, stride: float) -> None:
+        """Report the latest requested source time and the step between requests.
+
+        Args:
+            target_time: Most recent source time requested by the renderer.
+            stride: Source seconds advanced between consecutive requests.
+        """
+
+        self._hint = (target_time, stride)
+
+    def next(self) -> tuple[int, float, Image.Image | av.VideoFrame] | None:
+        """Return the next buffered frame, blocking only while the buffer is empty.
+
+        Returns:
+            tuple[int, float, Image.Image | av.VideoFrame] | None: Lap, timestamp,
+            and processed image (or raw frame when it was predicted to be
+            skipped), or None once the source is exhausted.
+        """
+
+        if self._finished:
+            return None
+
+        item = self._buffer.get()
+        if isinstance(item, BaseException):
+            self._finished = True
+            raise item
+        if item is None:
+            self._finished = True
+        return item
+
+    def close(self) -> None:
+        """Stop the decoding thread and release its container."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._finished = True
+
+    def _run(self, seek_time: float) -> None:
+        """Decode frames into the buffer until stopped or exhausted.
+
+        Args:
+            seek_time: Source time in seconds to begin decoding from.
+        """
+
+        container = av.open(self.path)
+        try:
+            stream = container.streams.video[0]
+            time_base = float(stream.time_base)
+            lap = 0
+
+            while not self._stop.is_set():
+                index = keyframe_index(self.path) if seek_time > 0 else None
+                seek_to_keyframe(container, stream, seek_time, index)
+                emitted = False
+                previous_time = None
+                for frame in container.decode(stream):
+                    frame_time = frame_timestamp(frame, time_base)
+                    if frame_time < self.start_time:
+                        continue
+                    if frame_time > self.end_time:
+                        break
+                    payload = self.process(frame) if self._is_needed(previous_time, frame_time) else frame
+                    if not self._put((lap, frame_time, payload)):
+                        return
+                    emitted = True
+                    previous_time = frame_time
+
+                if not self.loop or not emitted:
+                    self._put(None)
+                    return
+
+                lap += 1
+                seek_time = self.start_time
+        except Exception as error:
+            self._put(error)
+        finally:
+            container.close()
+
+    def _is_needed(self, previous_time: float | None, frame_time: float) -> bool:
+        """Predict whether a requested time will land on this frame.
+
+        A frame is selected for every target in (previous_time, frame_time],
+        with targets extrapolated from the last hint.
+
+        Args:
+            previous_time: Timestamp of the previous frame in this pass.
+            frame_time: Timestamp of the candidate frame.
+
+        Returns:
+            bool: True when the frame should be processed ahead of time.
+        """
+
+        hint = self._hint
+        if hint is None or previous_time is None or hint[1] <= 0:
+            return True
+
+        reference, stride = hint
+        epsilon = 1e-6
+        return math.floor((frame_time - reference) / stride + epsilon) > math.floor(
+            (previous_time - reference) / stride - epsilon
+        )
+
+    def _put(self, item: object) -> bool:
+        """Add an item to the buffer, giving up once the prefetcher is closed.
+
+        Args:
+            item: Frame tuple, end marker, or exception to hand to the consumer.
+
+        Returns:
+            bool: True when the item was buffered.
+        """
+
+        while not self._stop.is_set():
+            try:
+                self._buffer.put(item, timeout=PREFETCH_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class LoopFrameCache:
+    """Processed frames from one full pass over a looping source.
+
+    Frames are recorded in source order while the first pass decodes. Once
+    the pass is complete, later passes look frames up by timestamp instead of
+    seeking and decoding again. Recording stops as soon as the frames exceed
+    the byte budget.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Largest size the recorded frames may reach.
+        """
+
+        self.max_bytes = max_bytes
+        self.times: list[float] = []
+        self.frames: list[Image.Image] = []
+        self.nbytes = 0
+        self.complete = False
+        self.abandoned = False
+
+    @property
+    def recording(self) -> bool:
+        """Return True while frames are still being collected."""
+
+        return not self.complete and not self.abandoned
+
+    def record(self, frame_time: float, image: Image.Image) -> None:
+        """Append a processed frame from the first pass.
+
+        Args:
+            frame_time: Source timestamp in seconds.
+            image: Processed frame.
+        """
+
+        if not self.recording or (self.times and frame_time <= self.times[-1]):
+            return
+
+        self.nbytes += image.width * image.height * len(image.getbands())
+        if self.nbytes > self.max_bytes:
+            self.abandon()
+            return
+
+        self.times.append(frame_time)
+        self.frames.append(image)
+
+    def finish(self) -> None:
+        """Mark the pass as complete so lookups can be served."""
+
+        if self.recording and self.frames:
+            self.complete = True
+
+    def abandon(self) -> None:
+        """Stop recording and release the frames gathered so far."""
+
+        self.abandoned = True
+        self.times = []
+        self.frames = []
+        self.nbytes = 0
+
+    def lookup(self, target_time: float) -> tuple[float, Image.Image]:
+        """Return the first frame at or after target_time.
+
+        Targets past the final frame resolve to the final frame.
+
+        Args:
+            target_time: Source timestamp in seconds.
+
+        Returns:
+            tuple[float, Image.Image]: Frame timestamp and image.
+        """
+
+        index = min(bisect_left(self.times, target_time), len(self.times) - 1)
+        return self.times[index], self.frames[index]
+
+
+class SharedDecoder:
+    """Decoder for one video file shared by every clip that reads it.
+
+    The container opens on the first frame request. Decoded frames, and the
+    images clips process from them, are kept in a byte-bounded cache along
+    with the timestamps decoded contiguously since the last seek. A clip
+    asking for a frame another clip has just decoded is served from the cache,
+    and clips playing nearby ranges advance one decode position instead of
+    each seeking their own demuxer.
+
+    The first seek past the start of the file loads its keyframe index. From
+    then on every seek lands on the last keyframe before the target, and the
+    decoder only advances instead of seeking while no keyframe lies between
+    its position and the target, so each request decodes the fewest frames.
+    """
+
+    def __init__(self, path: str, cache_bytes: int) -> None:
+        """Configure the decoder without opening the file.
+
+        Args:
+            path: File path of the video source.
+            cache_bytes: Budget for cached frames and processed images.
+        """
+
+        self.path = path
+        self.references = 0
+        self._container: av.container.input.InputContainer | None = None
+        self._stream: av.video.stream.VideoStream | None = None
+        self._frame_iter = None
+        self._time_base = 0.0
+        self._position: float | None = None
+        self._exhausted = False
+        self._times: list[float] = []
+        self._cache = ByteLRUCache(cache_bytes)
+        self._index: KeyframeIndex | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True once the container has been opened."""
+
+        return self._container is not None
+
+    def frame_at(
+        self,
+        target_time: float,
+        start_time: float,
+        end_time: float,
+        key: Hashable,
+        process: Callable[[av.VideoFrame], Image.Image],
+    ) -> tuple[float, Image.Image] | None:
+        """Return the first frame at or after target_time within a source range.
+
+        Args:
+            target_time: Source timestamp in seconds.
+            start_time: First source timestamp the caller accepts.
+            end_time: Last source timestamp the caller accepts.
+            key: Identifies the caller's processing settings.
+            process: Converts a decoded frame into the caller's image.
+
+        Returns:
+            tuple[float, Image.Image] | None: Frame timestamp and processed
+            image, or None when no frame remains in the range.
+        """
+
+        target_time = max(target_time, start_time)
+        collector = stats.active_stats()
+        hit = self._cached_frame(target_time, key)
+        if hit is None:
+            if collector is not None:
+                started = time.perf_counter()
+            if not self._can_advance(target_time):
+                self._seek(target_time)
+            hit = self._decode_until(target_time)
+            if collector is not None:
+                collector.add_time("video_decode", time.perf_counter() - started)
+        if hit is None or hit[0] > end_time:
+            return None
+
+        frame_time, frame = hit
+        if isinstance(frame, Image.Image):
+            return frame_time, frame
+
+        if collector is not None:
+            started = time.perf_counter()
+        image = process(frame)
+        if collector is not None:
+            collector.add_time("video_process", time.perf_counter() - started)
+        self._cache.put((frame_time, key), image, image.width * image.height * len(image.getbands()))
+        return frame_time, image
+
+    def close(self) -> None:
+        """Close the container and drop cached frames."""
+
+        if self._container is not None:
+            self._container.close()
+        self._container = None
+        self._stream = None
+        self._frame_iter = None
+        self._position = None
+        self._times = []
+        self._cache.clear()
+
+    def _cached_frame(self, target_time: float, key: Hashable) -> tuple[float, Image.Image | av.VideoFrame] | None:
+        """Look up the first frame at or after target_time among recent frames.
+
+        Only timestamps decoded contiguously since the last seek are searched,
+        so no unseen frame can lie between the target and the result. A
+        processed image for key is preferred over the raw frame.
+
+        Args:
+            target_time: Source timestamp in seconds.
+            key: Identifies the caller's processing settings.
+
+        Returns:
+            tuple[float, Image.Image | av.VideoFrame] | None: Timestamp with a
+            processed image or raw frame, or None on a miss.
+        """
+
+        times = self._times
+        if not times or target_time < times[0] or target_time > times[-1]:
+            return None
+
+        frame_time = times[bisect_left(times, target_time)]
+        frame = self._cache.get((frame_time, key))
+        if frame is None:
+            frame = self._cache.get((frame_time, None))
+        return None if frame is None else (frame_time, frame)
+
+    def _can_advance(self, target_time: float) -> bool:
+        """Report whether decoding forward reaches target_time sooner than seeking.
+
+        With a keyframe index, advancing wins unless a keyframe lies between
+        the decode position and the target. Without one, targets within
+        FORWARD_SEEK_SECONDS are reached by advancing.
+
+        Args:
+            target_time: Source timestamp in seconds.
+
+        Returns:
+            bool: True when the current decode position is before the target
+            and seeking would not skip any frames.
+        """
+
+        if self._frame_iter is None or self._position is None or target_time < self._position:
+            return False
+        if self._index is None:
+            return target_time <= self._position + FORWARD_SEEK_SECONDS
+
+        keyframe = self._index.keyframe_before(target_time)
+        return keyframe is None or keyframe[0] <= self._position
+
+    def _seek(self, seek_time: float) -> None:
+        """Restart decoding at the last keyframe presented at or before seek_time.
+
+        Args:
+            seek_time: Source timestamp in seconds.
+        """
+
+        if self._container is None:
+            self._container = av.open(self.path)
+            self._stream = self._container.streams.video[0]
+            self._time_base = float(self._stream.time_base)
+
+        if self._index is None and seek_time > 0:
+            self._index = keyframe_index(self.path)
+        seek_to_keyframe(self._container, self._stream, seek_time, self._index)
+        stats.count("decoder_seeks")
+        self._frame_iter = self._container.decode(self._stream)
+        self._position = seek_time
+        self._exhausted = False
+        self._times = []
+
+    def _decode_until(self, target_time: float) -> tuple[float, av.VideoFrame] | None:
+        """Decode forward, caching every frame, until one reaches target_time.
+
+        Args:
+            target_time: Source timestamp in seconds.
+
+        Returns:
+            tuple[float, av.VideoFrame] | None: Frame timestamp and raw frame,
+            or None once the stream is exhausted.
+        """
+
+        if self._exhausted:
+            return None
+
+        for frame in self._frame_iter:
+            stats.count("decoded_frames")
+            frame_time = frame_timestamp(frame, self._time_base)
+            self._remember(frame_time, frame)
+            if frame_time >= target_time:
+                return frame_time, frame
+
+        self._exhausted = True
+        return None
+
+    def _remember(self, frame_time: float, frame: av.VideoFrame) -> None:
+        """Cache a decoded frame and extend the contiguous timestamp window.
+
+        Args:
+            frame_time: Frame timestamp in seconds.
+            frame: Decoded frame.
+        """
+
+        self._position = max(self._position, frame_time)
+        times = self._times
+        if times and frame_time <= times[-1]:
+            return
+
+        times.append(frame_time)
+        if len(times) > 2 * SHARED_WINDOW_FRAMES:
+            del times[:-SHARED_WINDOW_FRAMES]
+        self._cache.put((frame_time, None), frame, sum(plane.buffer_size for plane in frame.planes))
+
+
+class DecoderPool:
+    """Reference-counted shared decoders keyed by file path.
+
+    Clips acquire a decoder when they first need a frame and release it when
+    closed; the container closes as soon as the last clip releases it.
+    """
+
+    def __init__(self, cache_bytes: int = SHARED_FRAME_CACHE_BYTES) -> None:
+        """Create an empty pool.
+
+        Args:
+            cache_bytes: Frame cache budget given to each decoder.
+        """
+
+        self.cache_bytes = cache_bytes
+        self._decoders: dict[str, SharedDecoder] = {}
+
+    def __len__(self) -> int:
+        return len(self._decoders)
+
+    def acquire(self, path: str) -> SharedDecoder:
+        """Return the decoder for path and add a reference to it.
+
+        Args:
+            path: File path of the video source.
+
+        Returns:
+            SharedDecoder: Decoder shared by every clip reading the file.
+        """
+
+        key = os.path.abspath(path)
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            decoder = SharedDecoder(path, self.cache_bytes)
+            self._decoders[key] = decoder
+        decoder.references += 1
+        return decoder
+
+    def release(self, decoder: SharedDecoder) -> None:
+        """Drop a reference and close the decoder once none remain.
+
+        Args:
+            decoder: Decoder returned by acquire.
+        """
+
+        decoder.references -= 1
+        if decoder.references > 0:
+            return
+
+        decoder.close()
+        key = os.path.abspath(decoder.path)
+        if self._decoders.get(key) is decoder:
+            del self._decoders[key]
+
+
+decoder_pool = DecoderPool()
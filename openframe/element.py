@@ -1,9 +1,61 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
+import numpy as np
 from PIL import Image, ImageDraw
 
+from openframe.cache import ByteLRUCache
+from openframe import stats
+from openframe.compositor import Premultiplied, blend, premultiply, premultiply_cached
 from openframe.util import AnchorPoint
 
+OPACITY_LEVELS = 256
+OPACITY_CACHE_BYTES = 256 * 1024 * 1024
+
+_overlay_cache = ByteLRUCache(OPACITY_CACHE_BYTES)
+
+
+@lru_cache(maxsize=OPACITY_LEVELS)
+def _opacity_table(level: int) -> list[int]:
+    """Return the alpha lookup table for a quantized opacity level.
+
+    Args:
+        level: Opacity level between 0 and OPACITY_LEVELS - 1.
+
+    Returns:
+        list[int]: Table mapping source alpha to scaled alpha.
+    """
+
+    return [value * level // (OPACITY_LEVELS - 1) for value in range(256)]
+
+
+def _new_overlay(width: int, height: int) -> Image.Image:
+    """Allocate a transparent overlay of at least one pixel per side.
+
+    Args:
+        width: Overlay width in pixels.
+        height: Overlay height in pixels.
+
+    Returns:
+        Image.Image: Blank RGBA image.
+    """
+
+    stats.count("overlay_allocations")
+    return Image.new('RGBA', (max(1, width), max(1, height)), (0, 0, 0, 0))
+
+
+def _opacity_level(opacity: float) -> int:
+    """Quantize an opacity into one of OPACITY_LEVELS steps.
+
+    Args:
+        opacity: Value between 0.0 and 1.0.
+
+    Returns:
+        int: Opacity level between 0 and OPACITY_LEVELS - 1.
+    """
+
+    return round(max(0.0, min(1.0, opacity)) * (OPACITY_LEVELS - 1))
+
 
 @dataclass(kw_only=True)
 class FrameElement:
@@ -94,27 +146,137 @@ class FrameElement:
 
         return max(0.0, min(1.0, target_opacity * opacity))
 
-    def render(self, canvas: Image.Image, t: float) -> None:
+    def render(self, canvas: Image.Image, t: float, origin: Tuple[int, int] = (0, 0)) -> None:
         """Draw the element onto the canvas with fade handled via an overlay.
 
         Args:
             canvas: Frame canvas to compose onto.
             t: Current time in seconds.
+            origin: Frame coordinate of the canvas's top-left corner, for
+                canvases covering only part of the frame.
         """
 
         opacity = self.opacity_at(t)
         if opacity <= 0:
             return
 
+        x, y = self.render_position
+        position = (x - origin[0], y - origin[1])
+        image = self._static_image()
+        if image is not None:
+            overlay = self._faded_overlay(image, opacity)
+            canvas.paste(overlay, position, overlay)
+            return
+
         width, height = self.bounding_box_size
-        overlay = Image.new('RGBA', (max(1, width), max(1, height)), (0, 0, 0, 0))
+        overlay = _new_overlay(width, height)
         overlay_draw = ImageDraw.Draw(overlay)
         self._render_content(overlay, overlay_draw)
 
         if opacity < 1.0:
             overlay = self._apply_opacity(overlay, opacity)
 
-        canvas.paste(overlay, self.render_position, overlay)
+        canvas.paste(overlay, position, overlay)
+
+    def _faded_overlay(self, image: Image.Image, opacity: float) -> Image.Image:
+        """Return the overlay of a static image at a quantized opacity.
+
+        Overlays are cached per source image and opacity level with LRU
+        eviction bounded by bytes, so a fade costs one lookup per frame once
+        its levels have been computed.
+
+        Args:
+            image: Static RGBA image returned by _static_image.
+            opacity: Value between 0.0 and 1.0 to scale alpha.
+
+        Returns:
+            Image.Image: Overlay ready to paste onto the frame canvas.
+        """
+
+        level = _opacity_level(opacity)
+        key = (id(image), level)
+        entry = _overlay_cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+        if level == OPACITY_LEVELS - 1:
+            width, height = self.bounding_box_size
+            overlay = _new_overlay(width, height)
+            self._render_content(overlay, ImageDraw.Draw(overlay))
+        else:
+            overlay = self._apply_opacity(self._faded_overlay(image, 1.0), opacity)
+
+        _overlay_cache.put(key, (image, overlay), overlay.width * overlay.height * 4)
+        return overlay
+
+    def composite(self, canvas: np.ndarray, t: float, origin: Tuple[int, int] = (0, 0)) -> None:
+        """Blend the element into a NumPy canvas with opacity as a scalar.
+
+        Args:
+            canvas: Float RGB canvas shaped (height, width, 3).
+            t: Current time in seconds.
+            origin: Frame coordinate of the canvas's top-left corner, for
+                canvases covering only part of the frame.
+        """
+
+        opacity = self.opacity_at(t)
+        if opacity <= 0:
+            return
+
+        x, y = self.render_position
+        blend(canvas, self._premultiplied_pixels(t), (x - origin[0], y - origin[1]), opacity)
+
+    def _premultiplied_pixels(self, t: float) -> Premultiplied:
+        """Return the element's pixels prepared for NumPy blending.
+
+        The pixels are those of the overlay the Pillow compositor pastes, so
+        translucent content looks the same with either backend. Elements with
+        a static image reuse its cached overlay; others render their content
+        into an overlay first.
+
+        Args:
+            t: Current time in seconds.
+
+        Returns:
+            Premultiplied: Pixels sized to the element's bounding box.
+        """
+
+        image = self._static_image()
+        if image is not None:
+            return premultiply_cached(self._faded_overlay(image, 1.0))
+
+        width, height = self.bounding_box_size
+        overlay = _new_overlay(width, height)
+        self._render_content(overlay, ImageDraw.Draw(overlay))
+        return premultiply(overlay)
+
+    def _static_image(self) -> Image.Image | None:
+        """Return the pre-rendered image for elements whose pixels never change.
+
+        Returns:
+            Image.Image | None: Cached RGBA image, or None for dynamic content.
+        """
+
+        return None
+
+    def _content_at(self, t: float) -> Image.Image | None:
+        """Return the image that determines the element's pixels at time t.
+
+        Two times returning the same image object at the same opacity draw
+        identical pixels, which lets compositors skip unchanged regions.
+
+        Args:
+            t: Current time in seconds.
+
+        Returns:
+            Image.Image | None: Source image, or None when the content cannot
+            be identified and must be redrawn every frame.
+        """
+
+        return self._static_image()
+
+    def close(self) -> None:
+        """Release resources held for rendering, such as background decoders."""
 
     def _render_content(self, canvas: Image.Image, draw: ImageDraw.ImageDraw) -> None:
         """Render element content onto an overlay before fade adjustments.
@@ -141,7 +303,8 @@ class FrameElement:
         if opacity >= 1.0:
             return image
 
+        stats.count("overlay_allocations")
         result = image.copy()
-        alpha = result.getchannel('A').point(lambda value: int(value * opacity))
+        alpha = result.getchannel('A').point(_opacity_table(_opacity_level(opacity)))
         result.putalpha(alpha)
         return result
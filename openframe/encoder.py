@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+
+import av
+
+from openframe.util import EncoderProfile
+
+_PARAMS_OPTIONS = {
+    "libx264": "x264-params",
+    "libx265": "x265-params",
+    "libsvtav1": "svtav1-params",
+    "libaom-av1": "aom-params",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class EncoderSettings:
+    """Describe how video and audio streams are encoded.
+
+    The defaults reproduce the historical low-latency h264 settings. Use
+    from_profile for tuned presets that trade CPU time for file size.
+
+    Attributes:
+        codec: Video encoder name such as "h264", "libx265", or "libsvtav1".
+        preset: Encoder speed preset, or None for the encoder default.
+        tune: Encoder tuning such as "zerolatency" or "film", or None.
+        crf: Constant rate factor for quality-targeted encoding.
+        bit_rate: Target video bit rate in bits per second.
+        gop_size: Maximum number of frames between keyframes.
+        keyframe_interval: Maximum seconds between keyframes, converted to a
+            GOP size from the stream's frame rate. Ignored when gop_size is
+            set.
+        threads: Number of encoder threads, or None to let the encoder decide.
+        thread_type: Threading mode such as "FRAME" or "SLICE". x264 only
+            pipelines frames with "FRAME"; slice threading keeps latency low at
+            the cost of throughput.
+        pixel_format: Pixel format of the encoded video.
+        params: Encoder-specific parameters passed as x264-params,
+            x265-params, svtav1-params, or aom-params, for example
+            {"keyint": "120", "bframes": "3"}.
+        options: Additional codec options passed through unchanged.
+        audio_codec: Audio encoder name.
+        audio_bit_rate: Target audio bit rate in bits per second, or None for
+            the encoder default.
+    """
+
+    codec: str = "h264"
+    preset: str | None = "ultrafast"
+    tune: str | None = "zerolatency"
+    crf: int | None = None
+    bit_rate: int | None = None
+    gop_size: int | None = None
+    keyframe_interval: float | None = None
+    threads: int | None = None
+    thread_type: str | None = None
+    pixel_format: str = "yuv420p"
+    params: dict[str, str] = field(default_factory=dict)
+    options: dict[str, str] = field(default_factory=dict)
+    audio_codec: str = "aac"
+    audio_bit_rate: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate rate control and threading values.
+
+        Returns:
+            None
+        """
+        if self.crf is not None and self.bit_rate is not None:
+            raise ValueError("crf and bit_rate cannot both be set.")
+        if self.bit_rate is not None and self.bit_rate <= 0:
+            raise ValueError("bit_rate must be greater than 0.")
+        if self.gop_size is not None and self.gop_size < 1:
+            raise ValueError("gop_size must be 1 or greater.")
+        if self.keyframe_interval is not None and self.keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be greater than 0.")
+        if self.threads is not None and self.threads < 0:
+            raise ValueError("threads must be 0 or greater.")
+
+    @classmethod
+    def from_profile(cls, profile: EncoderProfile) -> 'EncoderSettings':
+        """Return the settings of a named profile.
+
+        DRAFT favors encoding speed with frame-threaded ultrafast x264.
+        STREAMING targets a constant bit rate with a keyframe every two
+        seconds at any frame rate, so HLS and DASH segments stay aligned, and
+        no lookahead. ARCHIVE favors small files with
+        x265 at a slower preset.
+
+        Args:
+            profile: Named profile.
+
+        Returns:
+            EncoderSettings: Settings for the profile.
+        """
+        if profile == EncoderProfile.DRAFT:
+            return cls(preset="ultrafast", tune=None, crf=28, thread_type="FRAME")
+        if profile == EncoderProfile.STREAMING:
+            return cls(
+                preset="veryfast",
+                tune="zerolatency",
+                bit_rate=4_000_000,
+                keyframe_interval=2.0,
+                options={"maxrate": "4M", "bufsize": "8M"},
+                audio_bit_rate=128_000,
+            )
+        return cls(
+            codec="libx265",
+            preset="medium",
+            tune=None,
+            crf=22,
+            thread_type="FRAME",
+            params={"log-level": "error"},
+            audio_bit_rate=192_000,
+        )
+
+    def codec_options(self) -> dict[str, str]:
+        """Return the private codec options for the video encoder.
+
+        Returns:
+            dict[str, str]: Options handed to the codec context.
+        """
+        options = {}
+        if self.preset is not None:
+            options["preset"] = self.preset
+        if self.tune is not None:
+            options["tune"] = self.tune
+        if self.crf is not None:
+            options["crf"] = str(self.crf)
+        if self.params:
+            name = _PARAMS_OPTIONS.get(av.codec.Codec(self.codec, "w").name)
+            if name is None:
+                raise ValueError(f"Codec {self.codec} does not accept encoder params.")
+            options[name] = ":".join(f"{key}={value}" for key, value in self.params.items())
+        options.update(self.options)
+        return options
+
+    def configure_video(self, stream: av.video.stream.VideoStream) -> None:
+        """Apply the video settings to a newly added stream.
+
+        Args:
+            stream: Output video stream, added with its frame rate.
+        """
+        context = stream.codec_context
+        context.options = self.codec_options()
+        stream.pix_fmt = self.pixel_format
+        if self.bit_rate is not None:
+            context.bit_rate = self.bit_rate
+        if self.gop_size is not None:
+            context.gop_size = self.gop_size
+        elif self.keyframe_interval is not None:
+            context.gop_size = max(1, round(self.keyframe_interval * context.framerate))
+        if self.threads is not None:
+            context.thread_count = self.threads
+        if self.thread_type is not None:
+            context.thread_type = self.thread_type
+
+    def configure_audio(self, stream: av.audio.stream.AudioStream) -> None:
+        """Apply the audio settings to a newly added stream.
+
+        Args:
+            stream: Output audio stream.
+        """
+        if self.audio_bit_rate is not None:
+            stream.codec_context.bit_rate = self.audio_bit_rate
@@ -0,0 +1,354 @@
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
+
+from PIL import Image, ImageDraw
+
+from openframe.compositor import Premultiplied, premultiply_cached, stack
+from openframe.element import FrameElement
+from openframe.timeline import Placement
+
+Box = Tuple[int, int, int, int]
+
+MAX_GROUP_AREA_RATIO = 2.0
+
+
+@dataclass(kw_only=True)
+class LayerGroup(FrameElement):
+    """Static elements pre-composited into a single layer.
+
+    Members share one visibility interval and opacity curve, so the group
+    is drawn once per frame with that curve instead of once per member. The
+    flattened pixels are built on first use and dropped when pickled.
+
+    Attributes:
+        members: Static elements in z-order, bottom first, at full opacity.
+    """
+
+    members: list[FrameElement]
+    _image: Image.Image | None = field(init=False, default=None, repr=False)
+    _pixels: Premultiplied | None = field(init=False, default=None, repr=False)
+
+    def __getstate__(self) -> dict:
+        """Drop the flattened pixels, which are rebuilt after unpickling.
+
+        Returns:
+            dict: Picklable group state.
+        """
+
+        state = self.__dict__.copy()
+        state['_image'] = None
+        state['_pixels'] = None
+        return state
+
+    @property
+    def bounding_box_size(self) -> Tuple[int, int]:
+        """Return the size of the region covered by the members."""
+
+        return self.size
+
+    def _static_image(self) -> Image.Image:
+        """Return the members flattened into one RGBA image.
+
+        Members contribute the overlays they would paste onto the frame. When
+        the bottom member is opaque over the whole group, the others are
+        pasted onto it exactly as they would be pasted onto the frame;
+        otherwise the overlays are alpha-composited onto a transparent image.
+
+        Returns:
+            Image.Image: Flattened image covering the group.
+        """
+
+        if self._image is None:
+            self._image = self._flatten()
+        return self._image
+
+    def _render_content(self, canvas: Image.Image, draw: ImageDraw.ImageDraw) -> None:
+        """Copy the flattened image onto the overlay canvas.
+
+        The image already holds the members' overlays, so it is copied rather
+        than pasted through its own alpha a second time.
+
+        Args:
+            canvas: Overlay canvas matching the group bounds.
+            draw: Drawing helper (unused).
+        """
+
+        canvas.paste(self._static_image(), (0, 0))
+
+    def _premultiplied_pixels(self, t: float) -> Premultiplied:
+        """Return the members' overlays blended together in float precision.
+
+        Args:
+            t: Current time in seconds.
+
+        Returns:
+            Premultiplied: Pixels covering the group.
+        """
+
+        if self._pixels is None:
+            left, top = self.position
+            layers = []
+            for member in self.members:
+                overlay = member._faded_overlay(member._static_image(), 1.0)
+                layers.append((premultiply_cached(overlay), _offset(member, left, top)))
+            self._pixels = stack(layers, self.size)
+        return self._pixels
+
+    def close(self) -> None:
+        """Release resources held by the members."""
+
+        for member in self.members:
+            member.close()
+
+    def _flatten(self) -> Image.Image:
+        """Composite the members into an image of the group's size.
+
+        Returns:
+            Image.Image: Flattened RGBA image.
+        """
+
+        left, top = self.position
+        width, height = self.size
+        overlays = [
+            (member._faded_overlay(member._static_image(), 1.0), _offset(member, left, top))
+            for member in self.members
+        ]
+        (base, (x, y)), rest = overlays[0], overlays[1:]
+
+        if x <= 0 and y <= 0 and x + base.width >= width and y + base.height >= height and _is_opaque(base):
+            image = base.crop((-x, -y, width - x, height - y))
+            for overlay, position in rest:
+                image.paste(overlay, position, overlay)
+            # Pasting lowers alpha where members are translucent, but the stack
+            # covers an opaque base, so the group replaces what lies beneath.
+            image.putalpha(255)
+            return image
+
+        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        for overlay, position in overlays:
+            layer = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+            layer.paste(overlay, position)
+            image = Image.alpha_composite(image, layer)
+        return image
+
+
+def _offset(member: FrameElement, left: int, top: int) -> Tuple[int, int]:
+    """Return a member's position relative to the group's top-left corner.
+
+    Args:
+        member: Group member.
+        left: Group left edge in frame coordinates.
+        top: Group top edge in frame coordinates.
+
+    Returns:
+        Tuple[int, int]: Member position inside the group.
+    """
+
+    x, y = member.render_position
+    return x - left, y - top
+
+
+def _is_opaque(image: Image.Image) -> bool:
+    """Report whether every pixel of an RGBA image is fully opaque.
+
+    Args:
+        image: RGBA image.
+
+    Returns:
+        bool: True when the alpha channel is 255 everywhere.
+    """
+
+    return image.getchannel('A').getextrema() == (255, 255)
+
+
+def _frame_box(element: FrameElement, width: int, height: int) -> Box | None:
+    """Return the part of the frame an element covers.
+
+    Args:
+        element: Element to locate.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+
+    Returns:
+        Box | None: (left, top, right, bottom) clipped to the frame, or None
+        when the element lies off-frame.
+    """
+
+    x, y = element.render_position
+    element_width, element_height = element.bounding_box_size
+    left, top = max(0, x), max(0, y)
+    right, bottom = min(width, x + element_width), min(height, y + element_height)
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right, bottom
+
+
+def _union(boxes: Sequence[Box]) -> Box:
+    """Return the smallest box containing every given box.
+
+    Args:
+        boxes: Boxes as (left, top, right, bottom).
+
+    Returns:
+        Box: Enclosing box.
+    """
+
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+def _area(box: Box) -> int:
+    """Return the number of pixels in a box.
+
+    Args:
+        box: Box as (left, top, right, bottom).
+
+    Returns:
+        int: Pixel count.
+    """
+
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def _timing(placement: Placement) -> tuple:
+    """Describe when and how visibly a placement is drawn.
+
+    Placements with equal timings are visible over the same interval and
+    share an opacity curve.
+
+    Args:
+        placement: Placement to describe.
+
+    Returns:
+        tuple: Offset, start, duration, opacity, and fade durations.
+    """
+
+    element = placement.element
+    return (
+        placement.offset,
+        element.start_time,
+        element.duration,
+        max(0.0, min(1.0, element.opacity)),
+        element.fade_in_duration,
+        element.fade_out_duration,
+    )
+
+
+def _fades(timing: tuple) -> bool:
+    """Report whether an opacity curve ever drops below full opacity.
+
+    Args:
+        timing: Timing returned by _timing.
+
+    Returns:
+        bool: True when the opacity curve is not constantly 1.
+    """
+
+    _, _, _, opacity, fade_in, fade_out = timing
+    return opacity < 1.0 or fade_in > 0 or fade_out > 0
+
+
+def group_static_layers(placements: Sequence[Placement], width: int, height: int) -> list[Placement]:
+    """Replace runs of adjacent static placements with flattened groups.
+
+    A run shares its visibility interval and opacity curve. Overlapping
+    members are only grouped when drawn at full opacity throughout, since
+    fading a flattened stack differs from fading its layers one by one;
+    members that fade are grouped only while they do not overlap. Runs stop
+    growing once their enclosing box would exceed MAX_GROUP_AREA_RATIO times
+    the members' combined area.
+
+    Args:
+        placements: Flattened placements in z-order, bottom first.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+
+    Returns:
+        list[Placement]: Placements with every run of two or more static
+        elements replaced by a single LayerGroup placement.
+    """
+
+    result: list[Placement] = []
+    run: list[tuple[Placement, Box]] = []
+
+    def close_run() -> None:
+        if len(run) < 2:
+            result.extend(placement for placement, _ in run)
+        else:
+            result.append(_group(run))
+        run.clear()
+
+    for placement in placements:
+        element = placement.element
+        box = _frame_box(element, width, height) if element._static_image() is not None else None
+        if box is None:
+            close_run()
+            result.append(placement)
+            continue
+
+        if run and not _joins(run, placement, box):
+            close_run()
+        run.append((placement, box))
+
+    close_run()
+    return result
+
+
+def _joins(run: list[tuple[Placement, Box]], placement: Placement, box: Box) -> bool:
+    """Report whether a static placement can extend a run.
+
+    Args:
+        run: Current run with frame boxes.
+        placement: Candidate placement.
+        box: Candidate's frame box.
+
+    Returns:
+        bool: True when the candidate shares the run's timing, keeps the group
+        from being mostly empty, and, for fading runs, overlaps none of its
+        members.
+    """
+
+    timing = _timing(run[0][0])
+    if _timing(placement) != timing:
+        return False
+
+    boxes = [other for _, other in run] + [box]
+    union = _union(boxes)
+    if _area(union) > MAX_GROUP_AREA_RATIO * sum(_area(other) for other in boxes):
+        return False
+    if not _fades(timing):
+        return True
+    return not any(
+        box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]
+        for _, other in run
+    )
+
+
+def _group(run: list[tuple[Placement, Box]]) -> Placement:
+    """Build the placement of a group covering a run.
+
+    Args:
+        run: Placements with their frame boxes, bottom first.
+
+    Returns:
+        Placement: Group placement with the run's offset and timing.
+    """
+
+    left, top, right, bottom = _union([box for _, box in run])
+    first = run[0][0]
+    element = first.element
+    group = LayerGroup(
+        members=[placement.element for placement, _ in run],
+        start_time=element.start_time,
+        duration=element.duration,
+        position=(left, top),
+        size=(right - left, bottom - top),
+        opacity=element.opacity,
+        fade_in_duration=element.fade_in_duration,
+        fade_out_duration=element.fade_out_duration,
+    )
+    return Placement(group, first.offset)
@@ -69,6 +69,11 @@ class ImageClip(FrameElement):
 
         canvas.paste(self.image, (0, 0), self.image)
 
+    def _static_image(self) -> Image.Image:
+        """Return the cached image so compositors can reuse its pixels."""
+
+        return self.image
+
     @property
     def bounding_box_size(self) -> Tuple[int, int]:
         """Return the dimensions of the image that will be drawn."""
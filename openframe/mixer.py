@@ -0,0 +1,110 @@
+from typing import Sequence
+
+import av
+import numpy as np
+
+from openframe.audio import AudioClipReader
+from openframe.timeline import Placement
+
+
+class AudioMixer:
+    """Mix audio clip placements block by block over a range of timeline samples.
+
+    A clip's reader is opened when the first block it overlaps is mixed and
+    closed once the mix has moved past its end, so only clips audible around
+    the current block hold decoders and buffers. Peak memory therefore
+    depends on the block size and the number of overlapping clips, not on the
+    length of the timeline.
+    """
+
+    def __init__(self, placements: Sequence[Placement], sample_rate: int, layout: str, samples: range) -> None:
+        """Schedule the placements that overlap the sample range.
+
+        Args:
+            placements: Audio clip placements on the root timeline.
+            sample_rate: Target sample rate.
+            layout: Audio layout name.
+            samples: Timeline sample indices to mix.
+        """
+
+        self.sample_rate = sample_rate
+        self.layout = layout
+        self.channels = len(av.AudioLayout(layout).channels)
+        self._samples = samples
+        self._position = samples.start
+
+        scheduled = []
+        for order, placement in enumerate(placements):
+            start = int(placement.start_time * sample_rate)
+            if start >= samples.stop:
+                continue
+            stop = start + max(0, int(placement.element.duration * sample_rate))
+            if stop > samples.start:
+                scheduled.append((start, stop, order, placement))
+
+        self._scheduled = sorted(scheduled, key=lambda entry: entry[0])
+        self._cursor = 0
+        self._active: list[tuple[int, int, int, AudioClipReader]] = []
+
+    @property
+    def position(self) -> int:
+        """Return the timeline sample the next block starts at."""
+
+        return self._position
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of timeline samples left to mix."""
+
+        return max(0, self._samples.stop - self._position)
+
+    def read(self, count: int) -> np.ndarray:
+        """Mix the next count timeline samples.
+
+        Samples past the end of the range are zero, so every block can be
+        handed to a fixed-frame-size encoder.
+
+        Args:
+            count: Number of samples in the block.
+
+        Returns:
+            np.ndarray: Planar float32 samples shaped as (channels, count),
+            clipped to the -1.0 to 1.0 range.
+        """
+
+        block = np.zeros((self.channels, count), dtype=np.float32)
+        begin = self._position
+        end = min(self._samples.stop, begin + count)
+        self._position = begin + count
+
+        admitted = False
+        while self._cursor < len(self._scheduled) and self._scheduled[self._cursor][0] < end:
+            start, stop, order, placement = self._scheduled[self._cursor]
+            self._active.append((start, stop, order, placement.element.reader(self.sample_rate, self.layout)))
+            self._cursor += 1
+            admitted = True
+        if admitted:
+            self._active.sort(key=lambda entry: entry[2])
+
+        for start, stop, _, reader in self._active:
+            low, high = max(begin, start), min(end, stop)
+            if high > low:
+                block[:, low - begin : high - begin] += reader.read(low - start, high - low).T
+
+        still_active = []
+        for entry in self._active:
+            if entry[1] <= end:
+                entry[3].close()
+            else:
+                still_active.append(entry)
+        self._active = still_active
+
+        np.clip(block, -1.0, 1.0, out=block)
+        return block
+
+    def close(self) -> None:
+        """Close the readers of clips that are still active."""
+
+        for entry in self._active:
+            entry[3].close()
+        self._active = []
@@ -1,14 +1,159 @@
-import av
+import os
+import pickle
+import time
 import numpy as np
-from dataclasses import dataclass, field, replace
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Optional
-from PIL import Image
+from typing import BinaryIO, Iterator, Optional
 from tqdm import tqdm
 
+from openframe.compositor import NumpyCompositor, PillowCompositor, create_compositor
 from openframe.element import FrameElement
+from openframe.encoder import EncoderSettings
+from openframe.group import group_static_layers
+from openframe.mixer import AudioMixer
 from openframe.audio import AudioClip, AudioLayout
-from openframe.util import Layer
+from openframe.segment import AUDIO_TRACK_NAME, Segment, concat_segments, plan_segments, prepare_segment_dir, remove_segment_dir
+from openframe.sink import AUDIO_FRAME_SIZE, ContainerSink, Sink, convert_frame
+from openframe.stats import RenderStats, active_stats, collecting
+from openframe.timeline import Placement, TimelineIndex
+from openframe.util import CompositorBackend, EncoderProfile, Layer
+
+AUDIO_SAMPLE_RATE = 44100
+
+_worker_scene: Optional['Scene'] = None
+
+
+def _init_render_worker(payload: bytes) -> None:
+    """Unpickle the flattened scene once per worker process.
+
+    VideoClips acquire decoders from the worker's own pool on their first
+    frame, so workers never share demuxer state with the parent or with each
+    other.
+
+    Args:
+        payload: Pickled scene holding the flattened placements.
+    """
+
+    global _worker_scene
+    _worker_scene = pickle.loads(payload)
+
+
+def _render_frame_range(start: int, stop: int, fps: int, width: int, height: int) -> list[tuple[np.ndarray, bool]]:
+    """Render a contiguous range of frames inside a worker process.
+
+    Args:
+        start: First frame index to render.
+        stop: Frame index to stop before.
+        fps: Frames per second of the export.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+
+    Returns:
+        list[tuple[np.ndarray, bool]]: Frames in presentation order, each with
+        whether it repeats the previous one. A repeated frame is the same
+        array, so it is pickled once. The first frame never counts as
+        repeated because the worker may have rendered another chunk before it.
+    """
+
+    frames = []
+    copied = None
+    for index in range(start, stop):
+        frame_data = _worker_scene._create_frame(index / fps, width, height)
+        repeated = _worker_scene._frame_repeated and copied is not None
+        if not repeated:
+            copied = frame_data.copy()
+        frames.append((copied, repeated))
+    return frames
+
+
+def _render_segment(
+    payload: bytes,
+    directory: str,
+    segment: Segment,
+    width: int,
+    height: int,
+    fps: int,
+    encoder: EncoderSettings,
+) -> None:
+    """Encode the video of one timeline segment in a worker process.
+
+    The file is written under a temporary name and renamed once complete, so
+    an interrupted export never leaves a truncated segment behind.
+
+    Args:
+        payload: Pickled (scene, audio clips) tuple with flattened content.
+        directory: Directory holding the segment files.
+        segment: Segment to encode.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second of the export.
+        encoder: Codec settings of the export.
+    """
+
+    scene, _ = pickle.loads(payload)
+    final_path = os.path.join(directory, segment.file_name)
+    partial_path = os.path.join(directory, segment.file_name.replace(".mp4", ".partial.mp4"))
+    scene._export(
+        ContainerSink(partial_path, encoder=encoder),
+        width,
+        height,
+        fps,
+        range(segment.start_frame, segment.stop_frame),
+        [],
+        range(0),
+        progress=False,
+    )
+    os.replace(partial_path, final_path)
+
+
+def _render_audio_track(
+    payload: bytes,
+    directory: str,
+    total_samples: int,
+    width: int,
+    height: int,
+    fps: int,
+    sample_rate: int,
+    audio_layout: AudioLayout,
+    encoder: EncoderSettings,
+) -> None:
+    """Encode the audio of the whole timeline in a worker process.
+
+    AAC encoders prime every stream they start, so audio encoded per segment
+    would click at each boundary. One pass over the timeline produces the
+    same packets as an unsegmented render.
+
+    Args:
+        payload: Pickled (scene, audio clips) tuple with flattened content.
+        directory: Directory holding the segment files.
+        total_samples: Number of audio samples in the export.
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        fps: Frames per second of the export.
+        sample_rate: Audio sample rate of the export.
+        audio_layout: Audio channel layout of the export.
+        encoder: Codec settings of the export.
+    """
+
+    scene, audio_clips = pickle.loads(payload)
+    final_path = os.path.join(directory, AUDIO_TRACK_NAME)
+    partial_path = os.path.join(directory, AUDIO_TRACK_NAME.replace(".mp4", ".partial.mp4"))
+    scene._export(
+        ContainerSink(partial_path, encoder=encoder, include_video=False),
+        width,
+        height,
+        fps,
+        range(0),
+        audio_clips,
+        range(total_samples),
+        progress=False,
+        sample_rate=sample_rate,
+        audio_layout=audio_layout,
+    )
+    os.replace(partial_path, final_path)
 
 
 @dataclass
@@ -24,6 +169,11 @@ class Scene:
     _audio: list[AudioClip] = field(default_factory=list)
     _content_type: Optional['Scene.ContentType'] = field(default=None, init=False)
     _duration: float = field(default=0.0, init=False)
+    _placements: list[Placement] = field(default_factory=list, init=False, repr=False)
+    _index: Optional[TimelineIndex] = field(default=None, init=False, repr=False)
+    _compositor: PillowCompositor | NumpyCompositor | None = field(default=None, init=False, repr=False)
+    _last_frame: tuple[tuple, np.ndarray] | None = field(default=None, init=False, repr=False)
+    _frame_repeated: bool = field(default=False, init=False, repr=False)
     
 
     def add(self, element: FrameElement, layer: Layer=Layer.TOP) -> None:
@@ -69,40 +219,49 @@ class Scene:
 
         self._update_duration(clip.end_time)
         
-    def _get_elements(self) -> list[FrameElement]:
-        """Adjusts element start times and returns the configured element list.
+    def _get_elements(self, offset: float = 0.0) -> list[Placement]:
+        """Flatten the scene tree into placements on the root timeline.
+
+        Elements are not copied; each placement records the summed start
+        offsets of the scenes enclosing it.
+
+        Args:
+            offset (float): Start offset accumulated from enclosing scenes.
 
         Returns:
-            list[FrameElement]: Elements shifted according to this scene's start time.
+            list[Placement]: Placements in z-order, bottom layer first.
         """
+        offset += self.start_at
         if self._content_type == self.ContentType.ELEMENTS:
-            return self._clone_with_offset(self._elements, self.start_at)
+            return [Placement(element, offset) for element in self._elements]
 
         if self._content_type == self.ContentType.SCENES:
-            elements: list[FrameElement] = []
+            placements: list[Placement] = []
             for scene in self._scenes:
-                child_elements = scene._get_elements()
-                elements.extend(self._clone_with_offset(child_elements, self.start_at))
-            return elements
+                placements.extend(scene._get_elements(offset))
+            return placements
         
         return []
 
-    def _get_audio(self) -> list[AudioClip]:
-        """Adjust audio start times and returns the configured audio list.
+    def _get_audio(self, offset: float = 0.0) -> list[Placement]:
+        """Flatten the audio clips of the scene tree into placements.
+
+        Args:
+            offset (float): Start offset accumulated from enclosing scenes.
 
         Returns:
-            list[AudioClip]: Audio clips shifted according to this scene's start time.
+            list[Placement]: Audio clip placements on the root timeline.
         """
-        clips = self._clone_audio_with_offset(self._audio, self.start_at)
+        offset += self.start_at
+        placements = [Placement(clip, offset) for clip in self._audio]
 
         if self._content_type != self.ContentType.SCENES:
-            return clips
+            return placements
 
         for scene in self._scenes:
-            child_clips = scene._get_audio()
-            clips.extend(self._clone_audio_with_offset(child_clips, self.start_at))
+            placements.extend(scene._get_audio(offset))
 
-        return clips
+        return placements
         
     @property
     def total_duration(self) -> float:
@@ -119,32 +278,6 @@ class Scene:
         return self._duration
         
 
-    @staticmethod
-    def _clone_with_offset(elements: list[FrameElement], offset: float) -> list[FrameElement]:
-        """Return copies of elements with their start times shifted.
-
-        Args:
-            elements (list[FrameElement]): Elements to clone.
-            offset (float): Amount of seconds to add to each start time.
-
-        Returns:
-            list[FrameElement]: New elements with adjusted start times.
-        """
-        return [replace(element, start_time=element.start_time + offset) for element in elements]
-
-    @staticmethod
-    def _clone_audio_with_offset(clips: list[AudioClip], offset: float) -> list[AudioClip]:
-        """Return copies of audio clips with their start times shifted.
-
-        Args:
-            clips (list[AudioClip]): Audio clips to clone.
-            offset (float): Amount of seconds to add to each start time.
-
-        Returns:
-            list[AudioClip]: New audio clips with adjusted start times.
-        """
-        return [replace(clip, start_time=clip.start_time + offset) for clip in clips]
-
     def _update_duration(self, end_time: float) -> None:
         """Update cached duration if the new end time exceeds it.
 
@@ -179,24 +312,176 @@ class Scene:
             height (int): Frame height in pixels.
 
         Returns:
-            np.ndarray: Frame image data in RGBA format.
+            np.ndarray: Frame image data in the compositor's pixel format.
+        """
+
+        if self._index is None:
+            self._index = TimelineIndex(self._placements)
+
+        stats = active_stats()
+        if stats is not None:
+            started = time.perf_counter()
+
+        visible = self._index.visible_at(t)
+        signature = self._static_signature(visible, t)
+        if stats is not None:
+            composing = time.perf_counter()
+            stats.add_time("visibility", composing - started)
+
+        if signature is not None and self._last_frame is not None and self._last_frame[0] == signature:
+            if stats is not None:
+                stats.count("repeated_frames")
+            self._frame_repeated = True
+            return self._last_frame[1]
+
+        compositor = self._ensure_compositor(width, height)
+        frame = compositor.compose(visible, t)
+        self._last_frame = None if signature is None else (signature, frame)
+        self._frame_repeated = False
+        if stats is not None:
+            stats.add_time("compose", time.perf_counter() - composing)
+        return frame
+
+    @staticmethod
+    def _static_signature(visible: list[Placement], t: float) -> tuple | None:
+        """Describe a frame made only of static elements so repeats can be detected.
+
+        Two times with equal signatures show the same elements at the same
+        opacities and therefore produce identical frames.
+
+        Args:
+            visible (list[Placement]): Visible placements in z-order.
+            t (float): Current time in seconds.
+
+        Returns:
+            tuple | None: Placement identities and opacities, or None when any
+            visible element changes its pixels over time.
+        """
+
+        signature = []
+        for clip in visible:
+            if clip._static_image() is None:
+                return None
+            signature.append((id(clip), clip.opacity_at(t)))
+        return tuple(signature)
+
+    def _ensure_compositor(self, width: int, height: int) -> PillowCompositor | NumpyCompositor:
+        """Return the active compositor, defaulting to Pillow when none is set.
+
+        Args:
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+
+        Returns:
+            PillowCompositor | NumpyCompositor: Compositor used for frames.
         """
 
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 255))
+        if self._compositor is None:
+            self._compositor = create_compositor(CompositorBackend.PILLOW, width, height)
+        return self._compositor
+
+    def _flattened_copy(self) -> 'Scene':
+        """Return a scene holding only the flattened placements for worker processes.
+
+        Returns:
+            Scene: Scene with the flattened placements and compositor settings.
+        """
 
-        for clip in self._elements:
-            if clip.is_visible(t):
-                clip.render(img, t)
+        scene = Scene(start_at=0)
+        scene._placements = self._placements
+        scene._compositor = self._compositor
+        return scene
 
-        return np.array(img)
+    def iter_frames(
+        self,
+        width: int = 1920,
+        height: int = 1080,
+        fps: int = 30,
+        compositor: CompositorBackend = CompositorBackend.PILLOW,
+        pixel_format: str = "rgba",
+        group_static: bool = True,
+    ) -> Iterator[np.ndarray]:
+        """Yield the raw frames of the timeline without encoding them.
+
+        Frames are composited lazily as the iterator advances, so in-process
+        consumers can process a render of any length frame by frame.
+
+        Args:
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (int): Frames per second.
+            compositor (CompositorBackend): Backend used to composite frames.
+            pixel_format (str): Pixel format of the yielded frames, such as
+                "rgba", "rgb24", or "yuv420p". Planar formats have their
+                planes stacked vertically.
+            group_static (bool): Pre-flatten runs of static layers that share
+                timing into one layer. Pass False to composite every layer
+                separately.
+
+        Yields:
+            np.ndarray: Read-only frames in presentation order. Frames share
+            the compositor's buffer and repeated frames are the same array
+            object, so copy a frame to keep or modify it past the next
+            iteration.
+        """
+        total_frames = int(self.total_duration * fps)
+        self._prepare(width, height, compositor, group_static)
+        source_format = self._compositor.pixel_format
+        converted = None
+
+        try:
+            for index in range(total_frames):
+                frame_data = self._create_frame(index / fps, width, height)
+                if not self._frame_repeated or converted is None:
+                    converted = convert_frame(frame_data, source_format, pixel_format)
+                yield converted
+        finally:
+            for placement in self._placements:
+                placement.close()
+
+    def _prepare(
+        self,
+        width: int,
+        height: int,
+        compositor: CompositorBackend,
+        group_static: bool = True,
+    ) -> None:
+        """Flatten the timeline and set up compositing for a render.
+
+        Args:
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            compositor (CompositorBackend): Backend used to composite frames.
+            group_static (bool): Whether to group runs of static layers.
+        """
+        placements = self._get_elements()
+        if group_static:
+            placements = group_static_layers(placements, width, height)
+        self._placements = placements
+        self._index = TimelineIndex(self._placements)
+        self._compositor = create_compositor(compositor, width, height)
+        self._last_frame = None
+        self._frame_repeated = False
 
     def render(
         self, 
         width: int = 1920, 
         height: int = 1080, 
         fps: int = 30, 
-        output_path: str = "output.mp4"
-    ) -> None:
+        output_path: str | BinaryIO = "output.mp4",
+        workers: int = 1,
+        segments: int = 1,
+        segment_dir: str | None = None,
+        compositor: CompositorBackend = CompositorBackend.PILLOW,
+        group_static: bool = True,
+        container_format: str | None = None,
+        container_options: dict[str, str] | None = None,
+        audio_layout: AudioLayout = AudioLayout.MONO,
+        audio_sample_rate: int = AUDIO_SAMPLE_RATE,
+        sink: Sink | None = None,
+        encoder: EncoderSettings | EncoderProfile | None = None,
+        stats: RenderStats | bool = False,
+    ) -> RenderStats | None:
         """Encode all configured elements into a video file.
 
         Args:
@@ -204,84 +489,410 @@ class Scene:
             width (int): Frame width in pixels.
             height (int): Frame height in pixels.
             fps (int): Frames per second for the exported video.
-            output_path (str): File path to write the encoded video into.
+            output_path (str | BinaryIO): File path or writable binary file
+                object to write the encoded video into. File objects such as
+                sys.stdout.buffer need container_format, for example "mpegts".
+            workers (int): Number of processes compositing frames. Values above 1
+                split the frame range across a process pool while a single encoder
+                consumes the frames in order. With segments, this caps how many
+                segments are encoded at once.
+            segments (int): Number of time segments to encode independently and
+                concatenate without re-encoding. Values above 1 encode segments
+                in parallel and let an interrupted export resume from the
+                segments that already finished.
+            segment_dir (str | None): Directory for segment files. Defaults to
+                output_path with a ".segments" suffix, and is required when
+                output_path is a file object.
+            compositor (CompositorBackend): Backend used to composite frames.
+                NUMPY blends cached premultiplied pixels into one reused canvas
+                instead of allocating Pillow overlays per element. Both
+                backends blend the same overlays but round differently: Pillow
+                rounds after every blend and NUMPY once per frame. Opaque
+                content differs by at most one level per channel, and each
+                overlapping translucent layer can add up to one more.
+            group_static (bool): Pre-flatten runs of static layers that share
+                timing into one layer. Grouped frames differ from ungrouped
+                ones by at most one level per channel; pass False to
+                composite every layer separately.
+            container_format (str | None): Muxer name such as "mp4" or
+                "mpegts". Defaults to the format implied by output_path.
+            container_options (dict[str, str] | None): Muxer options. For
+                example {"movflags": "frag_keyframe+empty_moov"} writes a
+                fragmented MP4 that can be played while it is being written.
+            audio_layout (AudioLayout): Channel layout of the audio track.
+                Sources are resampled into this layout and panned per clip.
+            audio_sample_rate (int): Sample rate of the audio track.
+            sink (Sink | None): Destination receiving the frames and audio
+                blocks instead of output_path, such as a CallbackSink handing
+                NumPy arrays to in-process code. Cannot be combined with
+                segments.
+            encoder (EncoderSettings | EncoderProfile | None): Codec, rate
+                control, and threading settings, or a named profile such as
+                EncoderProfile.DRAFT. Defaults to low-latency ultrafast h264.
+                Ignored when a sink is given.
+            stats (RenderStats | bool): Collect per-stage timings and
+                counters into this RenderStats, or into a new one when True.
+                Only work done in this process is measured.
 
         Returns:
-            None
+            RenderStats | None: Collected statistics, or None when stats is
+            False.
         """
-        output_container = av.open(output_path, mode='w')
-        stream = output_container.add_stream('h264', rate=fps)
-        stream.codec_context.options = {
-            "preset": "ultrafast",
-            "tune": "zerolatency",
-        }
-        stream.pix_fmt = 'yuv420p'
-        stream.width, stream.height = width, height
-        total_frames = int(self.total_duration * fps)
+        if workers < 1:
+            raise ValueError("workers must be 1 or greater.")
+        if segments < 1:
+            raise ValueError("segments must be 1 or greater.")
+        if audio_sample_rate <= 0:
+            raise ValueError("audio_sample_rate must be greater than 0.")
+        if segments > 1 and sink is not None:
+            raise ValueError("segments cannot be combined with a sink.")
+        if segments > 1 and segment_dir is None and not isinstance(output_path, str):
+            raise ValueError("segment_dir is required when output_path is a file object.")
+
+        if isinstance(encoder, EncoderProfile):
+            encoder = EncoderSettings.from_profile(encoder)
+        encoder = encoder or EncoderSettings()
+        if stats is True:
+            stats = RenderStats()
+        stats = stats or None
+
+        started = time.perf_counter()
+        with collecting(stats):
+            total_frames = int(self.total_duration * fps)
+            total_samples = int(self.total_duration * audio_sample_rate)
         
-        self._elements = self._get_elements()
-        audio_clips = self._get_audio()
-        audio_stream = None
+            self._prepare(width, height, compositor, group_static)
+            audio_clips = self._get_audio()
+
+            if segments > 1:
+                self._render_segments(
+                    output_path=output_path,
+                    segment_dir=segment_dir or f"{output_path}.segments",
+                    width=width,
+                    height=height,
+                    fps=fps,
+                    total_frames=total_frames,
+                    total_samples=total_samples,
+                    audio_clips=audio_clips,
+                    workers=workers,
+                    segments=segments,
+                    container_format=container_format,
+                    container_options=container_options,
+                    sample_rate=audio_sample_rate,
+                    audio_layout=audio_layout,
+                    encoder=encoder,
+                )
+            else:
+                self._export(
+                    sink or ContainerSink(output_path, container_format, container_options, encoder),
+                    width,
+                    height,
+                    fps,
+                    range(total_frames),
+                    audio_clips,
+                    range(total_samples),
+                    workers=workers,
+                    sample_rate=audio_sample_rate,
+                    audio_layout=audio_layout,
+                )
+        if stats is not None:
+            stats.finish(time.perf_counter() - started)
+        return stats
+
+    def _export(
+        self,
+        sink: Sink,
+        width: int,
+        height: int,
+        fps: int,
+        frames: range,
+        audio_clips: list[Placement],
+        samples: range,
+        workers: int = 1,
+        progress: bool = True,
+        sample_rate: int = AUDIO_SAMPLE_RATE,
+        audio_layout: AudioLayout = AudioLayout.MONO,
+    ) -> None:
+        """Send a range of frames and the matching audio mix to a sink.
 
-        if audio_clips:
-            audio_stream = output_container.add_stream('aac', rate=44100)
-            audio_stream.layout = AudioLayout.MONO.value
+        Audio blocks are written right after the video frames they cover, so
+        the sink receives both streams in presentation order and a container
+        is interleaved as it is written.
 
-        for i in tqdm(range(total_frames), desc="Exporting", unit="frame", ncols=100):
-            t = i / fps
-            frame_data = self._create_frame(t, width, height)
-            frame = av.VideoFrame.from_ndarray(frame_data, format='rgba')
-            for packet in stream.encode(frame):
-                output_container.mux(packet)
+        Args:
+            sink (Sink): Destination of the frames and audio blocks.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (int): Frames per second for the exported video.
+            frames (range): Frame indices to encode.
+            audio_clips (list[Placement]): Flattened audio clip placements to mix.
+            samples (range): Audio sample indices to encode.
+            workers (int): Number of processes compositing frames.
+            progress (bool): Whether to show a progress bar.
+            sample_rate (int): Audio sample rate.
+            audio_layout (AudioLayout): Audio channel layout.
 
-        for packet in stream.encode():
-            output_container.mux(packet)
+        Returns:
+            None
+        """
+        compositor = self._ensure_compositor(width, height)
+        pixel_format = compositor.pixel_format
+        sink.open(width, height, fps, sample_rate, audio_layout if audio_clips else None)
+        mixer = AudioMixer(audio_clips, sample_rate, audio_layout.value, samples) if audio_clips else None
+
+        if workers > 1:
+            frame_data_iter = self._iter_frames_parallel(frames, width, height, fps, workers)
+        else:
+            frame_data_iter = self._iter_frames_local(frames, width, height, fps)
+
+        progress_bar = tqdm(
+            frame_data_iter,
+            total=len(frames),
+            desc="Exporting",
+            unit="frame",
+            ncols=100,
+            disable=not progress,
+        )
+
+        stats = active_stats()
+        try:
+            frame_started = time.perf_counter()
+            for (frame_data, repeated), index in zip(progress_bar, frames):
+                sink.write_video(
+                    frame_data,
+                    pixel_format,
+                    compositor.video_frame if workers == 1 else None,
+                    repeated=repeated,
+                )
+                if mixer is not None:
+                    self._write_audio(sink, mixer, int((index + 1) * sample_rate / fps))
+                if stats is not None:
+                    now = time.perf_counter()
+                    stats.end_frame(index, now - frame_started)
+                    frame_started = now
+
+            if mixer is not None:
+                self._write_audio(sink, mixer, samples.stop)
+        finally:
+            progress_bar.close()
+            frame_data_iter.close()
+            if mixer is not None:
+                mixer.close()
+
+        finish_started = time.perf_counter()
+        sink.close()
+        if stats is not None:
+            stats.add_time("finish", time.perf_counter() - finish_started)
+        for placement in self._placements:
+            placement.close()
+
+    def _render_segments(
+        self,
+        output_path: str | BinaryIO,
+        segment_dir: str,
+        width: int,
+        height: int,
+        fps: int,
+        total_frames: int,
+        total_samples: int,
+        audio_clips: list[Placement],
+        workers: int,
+        segments: int,
+        container_format: str | None = None,
+        container_options: dict[str, str] | None = None,
+        sample_rate: int = AUDIO_SAMPLE_RATE,
+        audio_layout: AudioLayout = AudioLayout.MONO,
+        encoder: EncoderSettings | None = None,
+    ) -> None:
+        """Encode time segments in parallel and concatenate them losslessly.
 
-        if audio_stream is not None:
-            self._encode_audio(output_container, audio_stream, audio_clips)
+        Segments hold video only, while the audio is encoded once for the
+        whole timeline alongside them and muxed in when the segments are
+        joined. Finished files are written under their final name only after
+        they close successfully, so rerunning the same export skips them.
 
-        output_container.close()
+        Args:
+            output_path (str | BinaryIO): File path or file object to write the
+                final video into.
+            segment_dir (str): Directory holding the segment files.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (int): Frames per second for the exported video.
+            total_frames (int): Number of frames in the export.
+            total_samples (int): Number of audio samples in the export.
+            audio_clips (list[Placement]): Flattened audio clip placements to mix.
+            workers (int): Maximum number of segments encoded at once.
+            segments (int): Requested number of segments.
+            container_format (str | None): Muxer name for the final output.
+            container_options (dict[str, str] | None): Muxer options for the
+                final output.
+            sample_rate (int): Audio sample rate.
+            audio_layout (AudioLayout): Audio channel layout.
+            encoder (EncoderSettings | None): Codec settings shared by every
+                segment.
 
-    def _encode_audio(
+        Returns:
+            None
+        """
+        encoder = encoder or EncoderSettings()
+        plan = plan_segments(
+            total_frames,
+            total_samples,
+            segments,
+            fps,
+            sample_rate,
+            AUDIO_FRAME_SIZE,
+        )
+        settings = {
+            "width": width,
+            "height": height,
+            "fps": fps,
+            "audio_track": bool(audio_clips),
+            "sample_rate": sample_rate,
+            "audio_layout": audio_layout.value,
+            "encoder": asdict(encoder),
+        }
+        finished = prepare_segment_dir(segment_dir, settings, plan)
+        todo = [segment for segment in plan if segment.index not in finished]
+        audio_path = os.path.join(segment_dir, AUDIO_TRACK_NAME) if audio_clips else None
+        audio_todo = audio_path is not None and not os.path.exists(audio_path)
+        payload = pickle.dumps((self._flattened_copy(), audio_clips))
+        tasks = len(todo) + audio_todo
+        max_workers = min(tasks, workers if workers > 1 else (os.cpu_count() or 1))
+
+        if tasks:
+            with ProcessPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [
+                    executor.submit(_render_segment, payload, segment_dir, segment, width, height, fps, encoder)
+                    for segment in todo
+                ]
+                if audio_todo:
+                    futures.append(
+                        executor.submit(
+                            _render_audio_track,
+                            payload,
+                            segment_dir,
+                            total_samples,
+                            width,
+                            height,
+                            fps,
+                            sample_rate,
+                            audio_layout,
+                            encoder,
+                        )
+                    )
+                for future in tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    desc="Exporting",
+                    unit="segment",
+                    ncols=100,
+                ):
+                    future.result()
+
+        concat_segments(
+            segment_dir,
+            plan,
+            fps,
+            output_path,
+            audio_path=audio_path,
+            container_format=container_format,
+            container_options=container_options,
+        )
+        remove_segment_dir(segment_dir, plan)
+
+    def _iter_frames_local(
         self,
-        container: av.container.output.OutputContainer,
-        stream: av.audio.stream.AudioStream,
-        clips: list[AudioClip],
-    ) -> None:
-        """Mix audio clips and encode them into the output container.
+        frames: range,
+        width: int,
+        height: int,
+        fps: int,
+    ) -> Iterator[tuple[np.ndarray, bool]]:
+        """Composite frames in this process and yield them in order.
+
+        Args:
+            frames (range): Frame indices to render.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (int): Frames per second for the exported video.
+
+        Yields:
+            tuple[np.ndarray, bool]: Each frame and whether it repeats the
+            previous one.
+        """
+        for index in frames:
+            frame_data = self._create_frame(index / fps, width, height)
+            yield frame_data, self._frame_repeated and index != frames.start
+
+    def _iter_frames_parallel(
+        self,
+        frames: range,
+        width: int,
+        height: int,
+        fps: int,
+        workers: int,
+    ) -> Iterator[tuple[np.ndarray, bool]]:
+        """Composite frames in a process pool and yield them in order.
+
+        Each worker receives the flattened placements once and renders contiguous
+        one-second chunks so video decoders keep reading forward. At most two
+        chunks per worker are in flight to bound memory use.
+
+        Args:
+            frames (range): Frame indices to render.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            fps (int): Frames per second for the exported video.
+            workers (int): Number of worker processes.
+
+        Yields:
+            tuple[np.ndarray, bool]: Each frame in presentation order and
+            whether it repeats the previous one.
+        """
+        payload = pickle.dumps(self._flattened_copy())
+        chunk_size = max(1, fps)
+        chunks = iter(range(frames.start, frames.stop, chunk_size))
+        pending = deque()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(payload,),
+        ) as executor:
+            def submit_next() -> None:
+                start = next(chunks, None)
+                if start is None:
+                    return
+                stop = min(frames.stop, start + chunk_size)
+                pending.append(executor.submit(_render_frame_range, start, stop, fps, width, height))
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                frame_batch = pending.popleft().result()
+                submit_next()
+                yield from frame_batch
+
+    def _write_audio(self, sink: Sink, mixer: AudioMixer, stop: int) -> None:
+        """Write mixed audio blocks until the mix reaches a timeline sample.
+
+        Blocks are whole encoder frames, so the mix may run up to one frame
+        past stop; the final block of the range is zero-padded.
 
         Args:
-            container (av.container.output.OutputContainer): Output container.
-            stream (av.audio.stream.AudioStream): Target audio stream.
-            clips (list[AudioClip]): Audio clips to mix.
+            sink (Sink): Destination of the audio blocks.
+            mixer (AudioMixer): Mixer positioned at the next sample to write.
+            stop (int): Timeline sample the written audio should reach.
         """
-        sample_rate = stream.rate
-        channels = 1
-        total_samples = int(self.total_duration * sample_rate)
-        mix = np.zeros((total_samples, channels), dtype=np.float32)
-
-        for clip in clips:
-            clip_data = clip.render(sample_rate, channels)
-            start_idx = int(clip.start_time * sample_rate)
-            end_idx = min(total_samples, start_idx + clip_data.shape[0])
-            mix[start_idx:end_idx] += clip_data[: end_idx - start_idx]
-
-        mix = np.clip(mix, -1.0, 1.0)
-        frame_size = stream.codec_context.frame_size or 1024
-        layout = stream.layout.name
-
-        for start in range(0, total_samples, frame_size):
-            end = min(total_samples, start + frame_size)
-            chunk = mix[start:end]
-
-            if end - start < frame_size:
-                pad = np.zeros((frame_size - (end - start), channels), dtype=np.float32)
-                chunk = np.vstack((chunk, pad))
-
-            frame = av.AudioFrame.from_ndarray(chunk.T, format="fltp", layout=layout)
-            frame.sample_rate = sample_rate
-            for packet in stream.encode(frame):
-                container.mux(packet)
-
-        for packet in stream.encode():
-            container.mux(packet)
+        frame_size = sink.audio_frame_size
+
+        stats = active_stats()
+        while mixer.remaining > 0 and mixer.position < stop:
+            if stats is None:
+                sink.write_audio(mixer.read(frame_size))
+                continue
+            started = time.perf_counter()
+            samples = mixer.read(frame_size)
+            stats.add_time("audio_mix", time.perf_counter() - started)
+            sink.write_audio(samples)
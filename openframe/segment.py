@@ -0,0 +1,251 @@
+import heapq
+import json
+import os
+from dataclasses import asdict, dataclass
+from fractions import Fraction
+from typing import BinaryIO, Iterator
+
+import av
+
+MANIFEST_NAME = "manifest.json"
+AUDIO_TRACK_NAME = "segment_audio.mp4"
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Describe one independently encoded slice of the timeline.
+
+    Attributes:
+        index: Position of the segment in the final file.
+        start_frame: First video frame index in the segment.
+        stop_frame: Video frame index the segment stops before.
+        start_sample: First audio sample index in the segment.
+        stop_sample: Audio sample index the segment stops before.
+    """
+
+    index: int
+    start_frame: int
+    stop_frame: int
+    start_sample: int
+    stop_sample: int
+
+    @property
+    def file_name(self) -> str:
+        """Return the file name used for the finished segment."""
+
+        return f"segment_{self.index:05d}.mp4"
+
+
+def plan_segments(
+    total_frames: int,
+    total_samples: int,
+    count: int,
+    fps: int,
+    sample_rate: int,
+    audio_frame_size: int,
+) -> list[Segment]:
+    """Split the timeline into contiguous segments of roughly equal length.
+
+    Segments carry video only; the audio track is encoded once for the whole
+    timeline. The sample range of each segment marks the part of that track
+    it spans, with boundaries snapped down to whole encoder frames.
+
+    Args:
+        total_frames: Number of video frames in the export.
+        total_samples: Number of audio samples in the export.
+        count: Requested number of segments.
+        fps: Frames per second of the export.
+        sample_rate: Audio sample rate of the export.
+        audio_frame_size: Samples per encoded audio frame.
+
+    Returns:
+        list[Segment]: Segments in presentation order, without empty ones.
+    """
+
+    count = max(1, min(count, total_frames))
+    frame_bounds = [total_frames * k // count for k in range(count + 1)]
+    sample_bounds = [
+        int(start * sample_rate / fps) // audio_frame_size * audio_frame_size
+        for start in frame_bounds[:-1]
+    ] + [total_samples]
+    sample_bounds = [min(bound, total_samples) for bound in sample_bounds]
+
+    return [
+        Segment(
+            index=k,
+            start_frame=frame_bounds[k],
+            stop_frame=frame_bounds[k + 1],
+            start_sample=sample_bounds[k],
+            stop_sample=sample_bounds[k + 1],
+        )
+        for k in range(count)
+        if frame_bounds[k + 1] > frame_bounds[k]
+    ]
+
+
+def prepare_segment_dir(directory: str, settings: dict, segments: list[Segment]) -> set[int]:
+    """Create the segment directory and report which segments can be reused.
+
+    Segments from an earlier run are kept only when the manifest shows the
+    same export settings and segment layout; otherwise they are discarded.
+
+    Args:
+        directory: Directory holding the segment files.
+        settings: Export settings that must match for a resume.
+        segments: Planned segments for this export.
+
+    Returns:
+        set[int]: Indices of segments that are already finished.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = {
+        "settings": settings,
+        "segments": [asdict(segment) for segment in segments],
+    }
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+
+    previous = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            try:
+                previous = json.load(handle)
+            except json.JSONDecodeError:
+                previous = None
+
+    if previous != manifest:
+        for name in os.listdir(directory):
+            if name.startswith("segment_"):
+                os.remove(os.path.join(directory, name))
+        with open(manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+
+    return {
+        segment.index
+        for segment in segments
+        if os.path.exists(os.path.join(directory, segment.file_name))
+    }
+
+
+def remove_segment_dir(directory: str, segments: list[Segment]) -> None:
+    """Delete finished segment files, the manifest, and the directory if empty.
+
+    Args:
+        directory: Directory holding the segment files.
+        segments: Segments written for this export.
+    """
+
+    for name in [segment.file_name for segment in segments] + [AUDIO_TRACK_NAME, MANIFEST_NAME]:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    try:
+        os.rmdir(directory)
+    except OSError:
+        pass
+
+
+def concat_segments(
+    directory: str,
+    segments: list[Segment],
+    fps: int,
+    output_path: str | BinaryIO,
+    audio_path: str | None = None,
+    container_format: str | None = None,
+    container_options: dict[str, str] | None = None,
+) -> None:
+    """Remux segment files and the audio track into a single output.
+
+    Video packet timestamps are shifted by each segment's start time, so the
+    encoded bitstreams are copied as-is. The audio track was encoded in one
+    pass, so its packets are copied unchanged and interleaved with the video
+    by presentation time.
+
+    Args:
+        directory: Directory holding the segment files.
+        segments: Segments in presentation order.
+        fps: Frames per second of the export.
+        output_path: Destination file path or writable binary file object.
+        audio_path: Audio track covering the whole timeline, or None for a
+            video-only export.
+        container_format: Muxer name, or None to infer it from output_path.
+        container_options: Muxer options for the output.
+    """
+
+    output = av.open(output_path, mode="w", format=container_format, options=container_options or {})
+    try:
+        first = av.open(os.path.join(directory, segments[0].file_name))
+        video_stream = output.add_stream_from_template(first.streams.video[0])
+        first.close()
+
+        sources = [_video_packets(directory, segments, fps)]
+        audio = None
+        if audio_path is not None:
+            audio = av.open(audio_path)
+            audio_stream = output.add_stream_from_template(audio.streams.audio[0])
+            sources.append(_audio_packets(audio))
+
+        for _, packet in heapq.merge(*sources, key=lambda item: item[0]):
+            packet.stream = audio_stream if packet.stream.type == "audio" else video_stream
+            output.mux(packet)
+
+        if audio is not None:
+            audio.close()
+    finally:
+        output.close()
+
+
+def _video_packets(directory: str, segments: list[Segment], fps: int) -> Iterator[tuple[Fraction, av.Packet]]:
+    """Yield the video packets of every segment shifted onto the timeline.
+
+    Packets that would decode at or before the previous one raise ValueError
+    instead of being dropped, since dropping them would lose frames.
+
+    Args:
+        directory: Directory holding the segment files.
+        segments: Segments in presentation order.
+        fps: Frames per second of the export.
+
+    Yields:
+        tuple[Fraction, av.Packet]: Decode time in seconds and the packet.
+    """
+
+    last_dts = None
+    for segment in segments:
+        source = av.open(os.path.join(directory, segment.file_name))
+        stream = source.streams.video[0]
+        shift = int(Fraction(segment.start_frame, fps) / stream.time_base)
+        for packet in source.demux(stream):
+            if packet.dts is None:
+                continue
+            dts = packet.dts + shift
+            if last_dts is not None and dts <= last_dts:
+                source.close()
+                raise ValueError(
+                    f"{segment.file_name} decodes at {dts * stream.time_base}s, "
+                    f"not after the previous packet at {last_dts * stream.time_base}s."
+                )
+            last_dts = dts
+            if packet.pts is not None:
+                packet.pts += shift
+            packet.dts = dts
+            yield dts * stream.time_base, packet
+        source.close()
+
+
+def _audio_packets(source: av.container.InputContainer) -> Iterator[tuple[Fraction, av.Packet]]:
+    """Yield the packets of an audio track unchanged.
+
+    Args:
+        source: Container holding the audio track.
+
+    Yields:
+        tuple[Fraction, av.Packet]: Decode time in seconds and the packet.
+    """
+
+    stream = source.streams.audio[0]
+    for packet in source.demux(stream):
+        if packet.dts is None:
+            continue
+        yield packet.dts * stream.time_base, packet
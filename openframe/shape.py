@@ -60,6 +60,11 @@ class ShapeClip(FrameElement):
 
         canvas.paste(self.image, (0, 0), self.image)
 
+    def _static_image(self) -> Image.Image:
+        """Return the cached image so compositors can reuse its pixels."""
+
+        return self.image
+
     @property
     def bounding_box_size(self) -> Tuple[int, int]:
         """Return the size of the cached shape image."""
@@ -0,0 +1,304 @@
+import time
+from typing import BinaryIO, Callable
+
+import av
+import numpy as np
+
+from openframe.audio import AudioLayout
+from openframe.encoder import EncoderSettings
+from openframe.stats import active_stats
+
+AUDIO_FRAME_SIZE = 1024
+
+
+def convert_frame(data: np.ndarray, source_format: str, target_format: str) -> np.ndarray:
+    """Convert frame pixels between raw pixel formats.
+
+    Args:
+        data: Frame pixels in source_format.
+        source_format: Pixel format produced by the compositor, such as "rgba".
+        target_format: Requested pixel format, such as "rgb24" or "yuv420p".
+
+    Returns:
+        np.ndarray: Frame pixels in target_format. Planar formats are returned
+        with their planes stacked vertically as PyAV lays them out.
+    """
+
+    if source_format == target_format:
+        return data
+    frame = av.VideoFrame.from_ndarray(data, format=source_format)
+    return frame.reformat(format=target_format).to_ndarray()
+
+
+class Sink:
+    """Receive the frames and audio blocks of a render in presentation order.
+
+    Scene.render opens the sink once, then calls write_video for every frame
+    and write_audio for the mixed audio covering it, and closes the sink after
+    the last frame. Subclasses override the methods they need.
+    """
+
+    audio_frame_size = AUDIO_FRAME_SIZE
+
+    def open(self, width: int, height: int, fps: int, sample_rate: int, audio_layout: AudioLayout | None) -> None:
+        """Prepare the sink for a render.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+            fps: Frames per second.
+            sample_rate: Audio sample rate.
+            audio_layout: Audio channel layout, or None when the scene has no
+                audio and write_audio will not be called.
+        """
+
+    def write_video(
+        self,
+        data: np.ndarray,
+        pixel_format: str,
+        frame: av.VideoFrame | None = None,
+        repeated: bool = False,
+    ) -> None:
+        """Consume the next frame.
+
+        The compositor writes every frame into the same buffer, so copy the
+        data to keep it. Only repeated tells whether the pixels are unchanged;
+        the identity of data does not.
+
+        Args:
+            data: Frame pixels.
+            pixel_format: Pixel format of data, such as "rgba" or "rgb24".
+            frame: VideoFrame sharing memory with data, when the compositor
+                provides one.
+            repeated: Whether the frame is identical to the previous one, so
+                work derived from the previous frame can be reused.
+        """
+
+    def write_audio(self, samples: np.ndarray) -> None:
+        """Consume the next block of mixed audio.
+
+        Args:
+            samples: Planar float32 samples shaped as (channels,
+                audio_frame_size).
+        """
+
+    def close(self) -> None:
+        """Finish the render and release resources."""
+
+
+class ContainerSink(Sink):
+    """Encode frames and audio into a container written to a path or file object.
+
+    File objects let a render stream to a pipe such as stdout without a
+    temporary file; pair them with a streamable format such as "mpegts" or a
+    fragmented MP4.
+    """
+
+    def __init__(
+        self,
+        output: str | BinaryIO,
+        container_format: str | None = None,
+        container_options: dict[str, str] | None = None,
+        encoder: EncoderSettings | None = None,
+        include_video: bool = True,
+    ) -> None:
+        """Configure the destination.
+
+        Args:
+            output: File path or writable binary file object.
+            container_format: Muxer name such as "mp4" or "mpegts". Required
+                for file objects; defaults to the format implied by a path.
+            container_options: Muxer options such as movflags.
+            encoder: Codec settings, defaulting to EncoderSettings().
+            include_video: Whether to add a video stream. Without one, the
+                file holds only the audio track and write_video must not be
+                called.
+        """
+
+        self.output = output
+        self.container_format = container_format
+        self.container_options = container_options
+        self.encoder = encoder or EncoderSettings()
+        self.include_video = include_video
+        self._container = None
+        self._video = None
+        self._audio = None
+        self._index = 0
+        self._last_frame: av.VideoFrame | None = None
+
+    @property
+    def audio_frame_size(self) -> int:
+        """Return the number of samples the audio encoder takes per frame."""
+
+        if self._audio is None:
+            return AUDIO_FRAME_SIZE
+        return self._audio.codec_context.frame_size or AUDIO_FRAME_SIZE
+
+    def open(self, width: int, height: int, fps: int, sample_rate: int, audio_layout: AudioLayout | None) -> None:
+        """Open the container and add the requested streams.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+            fps: Frames per second.
+            sample_rate: Audio sample rate.
+            audio_layout: Audio channel layout, or None for a video-only file.
+        """
+
+        self._container = av.open(
+            self.output,
+            mode='w',
+            format=self.container_format,
+            options=self.container_options or {},
+        )
+        if self.include_video:
+            self._video = self._container.add_stream(self.encoder.codec, rate=fps)
+            self.encoder.configure_video(self._video)
+            self._video.width, self._video.height = width, height
+
+        if audio_layout is not None:
+            self._audio = self._container.add_stream(self.encoder.audio_codec, rate=sample_rate)
+            self._audio.layout = audio_layout.value
+            self.encoder.configure_audio(self._audio)
+        self._index = 0
+
+    def write_video(
+        self,
+        data: np.ndarray,
+        pixel_format: str,
+        frame: av.VideoFrame | None = None,
+        repeated: bool = False,
+    ) -> None:
+        """Encode a frame without copying it when a shared VideoFrame is given.
+
+        Otherwise a VideoFrame is built from data, and reused while the frame
+        repeats. Either way the same VideoFrame may be encoded many times, so
+        its pts is set to the frame's index before every encode.
+
+        Args:
+            data: Frame pixels.
+            pixel_format: Pixel format of data.
+            frame: VideoFrame sharing memory with data, if any.
+            repeated: Whether the frame is identical to the previous one.
+        """
+
+        collector = active_stats()
+        if collector is not None:
+            started = time.perf_counter()
+        if frame is None:
+            if not repeated or self._last_frame is None:
+                self._last_frame = av.VideoFrame.from_ndarray(data, format=pixel_format)
+            frame = self._last_frame
+            if collector is not None:
+                converted = time.perf_counter()
+                collector.add_time("frame_conversion", converted - started)
+                started = converted
+        frame.pts = self._index
+        self._index += 1
+        for packet in self._video.encode(frame):
+            self._container.mux(packet)
+        if collector is not None:
+            collector.add_time("video_encode", time.perf_counter() - started)
+
+    def write_audio(self, samples: np.ndarray) -> None:
+        """Encode a block of mixed audio.
+
+        Args:
+            samples: Planar float32 samples shaped as (channels, samples).
+        """
+
+        collector = active_stats()
+        if collector is not None:
+            started = time.perf_counter()
+        frame = av.AudioFrame.from_ndarray(samples, format="fltp", layout=self._audio.layout.name)
+        frame.sample_rate = self._audio.rate
+        for packet in self._audio.encode(frame):
+            self._container.mux(packet)
+        if collector is not None:
+            collector.add_time("audio_encode", time.perf_counter() - started)
+
+    def close(self) -> None:
+        """Flush the encoders and close the container."""
+
+        if self._video is not None:
+            for packet in self._video.encode():
+                self._container.mux(packet)
+        if self._audio is not None:
+            for packet in self._audio.encode():
+                self._container.mux(packet)
+        self._container.close()
+        self._last_frame = None
+
+
+class CallbackSink(Sink):
+    """Hand every frame and audio block to Python callbacks as NumPy arrays."""
+
+    def __init__(
+        self,
+        on_frame: Callable[[int, np.ndarray], None],
+        on_audio: Callable[[np.ndarray], None] | None = None,
+        pixel_format: str | None = None,
+    ) -> None:
+        """Configure the callbacks.
+
+        Args:
+            on_frame: Called with the frame index and pixels of every frame.
+                The pixels may be read-only and are overwritten by later frames.
+            on_audio: Called with each planar float32 audio block, if given.
+            pixel_format: Pixel format to convert frames into, such as "rgba"
+                or "yuv420p". Defaults to the compositor's own format.
+        """
+
+        self.on_frame = on_frame
+        self.on_audio = on_audio
+        self.pixel_format = pixel_format
+        self._index = 0
+        self._last_converted: np.ndarray | None = None
+
+    def open(self, width: int, height: int, fps: int, sample_rate: int, audio_layout: AudioLayout | None) -> None:
+        """Reset the frame counter.
+
+        Args:
+            width: Frame width in pixels.
+            height: Frame height in pixels.
+            fps: Frames per second.
+            sample_rate: Audio sample rate.
+            audio_layout: Audio channel layout, or None without audio.
+        """
+
+        self._index = 0
+        self._last_converted = None
+
+    def write_video(
+        self,
+        data: np.ndarray,
+        pixel_format: str,
+        frame: av.VideoFrame | None = None,
+        repeated: bool = False,
+    ) -> None:
+        """Pass the frame to on_frame.
+
+        Args:
+            data: Frame pixels.
+            pixel_format: Pixel format of data.
+            frame: VideoFrame sharing memory with data, if any.
+            repeated: Whether the frame is identical to the previous one, in
+                which case its conversion is reused.
+        """
+
+        if self.pixel_format is not None:
+            if not repeated or self._last_converted is None:
+                self._last_converted = convert_frame(data, pixel_format, self.pixel_format)
+            data = self._last_converted
+        self.on_frame(self._index, data)
+        self._index += 1
+
+    def write_audio(self, samples: np.ndarray) -> None:
+        """Pass the audio block to on_audio.
+
+        Args:
+            samples: Planar float32 samples shaped as (channels, samples).
+        """
+
+        if self.on_audio is not None:
+            self.on_audio(samples)
@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+_active: 'RenderStats | None' = None
+
+
+@dataclass
+class StageTiming:
+    """Accumulated time spent in one render stage.
+
+    Attributes:
+        calls: Number of timed calls.
+        seconds: Total time across calls.
+        max_seconds: Longest single call.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Return the average time per call."""
+
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Record one call.
+
+        Args:
+            seconds: Duration of the call.
+        """
+
+        self.calls += 1
+        self.seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+
+@dataclass
+class RenderStats:
+    """Timings and counters collected while a scene renders.
+
+    Stages nest: "compose" contains the "element:<class>" time of every
+    element drawn, which in turn contains "video_decode" and "video_process"
+    for video clips. The other stages are "visibility" (finding the elements
+    to draw), "frame_conversion" (building a VideoFrame from pixels that do
+    not share the compositor's buffer), "video_encode" and "audio_encode"
+    (encoding and muxing), "audio_mix", and "finish" (flushing the sink).
+
+    Counters include "overlay_allocations", "repeated_frames",
+    "composited_pixels", "decoded_frames", "decoder_seeks", and
+    "prefetch_restarts".
+
+    Work done in worker processes is not collected; with workers or
+    segments, only the stages that run in the main process are reported.
+
+    Attributes:
+        on_frame: Called with the stats, frame index, and the frame's
+            seconds after each frame is written.
+        on_finish: Called with the stats once the render completes.
+        stages: Timings keyed by stage name.
+        counters: Event counts keyed by name.
+        frame_seconds: Time spent on each frame in presentation order.
+        wall_seconds: Duration of the whole render.
+    """
+
+    on_frame: Callable[['RenderStats', int, float], None] | None = None
+    on_finish: Callable[['RenderStats'], None] | None = None
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    frame_seconds: list[float] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def frames(self) -> int:
+        """Return the number of frames written."""
+
+        return len(self.frame_seconds)
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add the duration of one call to a stage.
+
+        Args:
+            stage: Stage name.
+            seconds: Duration of the call.
+        """
+
+        timing = self.stages.get(stage)
+        if timing is None:
+            timing = self.stages[stage] = StageTiming()
+        timing.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter.
+
+        Args:
+            name: Counter name.
+            amount: Value to add.
+        """
+
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def end_frame(self, index: int, seconds: float) -> None:
+        """Record the time of a finished frame and notify on_frame.
+
+        Args:
+            index: Frame index.
+            seconds: Time spent on the frame.
+        """
+
+        self.frame_seconds.append(seconds)
+        if self.on_frame is not None:
+            self.on_frame(self, index, seconds)
+
+    def finish(self, wall_seconds: float) -> None:
+        """Record the render duration and notify on_finish.
+
+        Args:
+            wall_seconds: Duration of the whole render.
+        """
+
+        self.wall_seconds = wall_seconds
+        if self.on_finish is not None:
+            self.on_finish(self)
+
+    def summary(self) -> str:
+        """Format the stages and counters as a table, slowest stage first.
+
+        Returns:
+            str: Human-readable report.
+        """
+
+        lines = [f"{self.frames} frames in {self.wall_seconds:.3f}s"]
+        lines.append(f"{'stage':<28} {'calls':>8} {'total s':>10} {'mean ms':>10} {'max ms':>10}")
+        for name, timing in sorted(self.stages.items(), key=lambda item: item[1].seconds, reverse=True):
+            lines.append(
+                f"{name:<28} {timing.calls:>8} {timing.seconds:>10.3f} "
+                f"{timing.mean_seconds * 1000:>10.2f} {timing.max_seconds * 1000:>10.2f}"
+            )
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<28} {value:>8}")
+        return "\n".join(lines)
+
+
+def active_stats() -> RenderStats | None:
+    """Return the stats being collected by the current render, if any.
+
+    Instrumented code checks this once and skips all timing when it is None,
+    so collection costs nothing while disabled.
+
+    Returns:
+        RenderStats | None: Active stats, or None when collection is off.
+    """
+
+    return _active
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Increase a counter of the active stats, if any.
+
+    Args:
+        name: Counter name.
+        amount: Value to add.
+    """
+
+    if _active is not None:
+        _active.count(name, amount)
+
+
+@contextmanager
+def collecting(stats: RenderStats | None) -> Iterator[None]:
+    """Make stats the active collector for the duration of a render.
+
+    Args:
+        stats: Collector to activate, or None to leave collection off.
+
+    Yields:
+        None
+    """
+
+    global _active
+    previous = _active
+    _active = stats
+    try:
+        yield
+    finally:
+        _active = previous
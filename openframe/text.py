@@ -1,12 +1,23 @@
 from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Tuple
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from openframe.cache import ByteLRUCache
 from openframe.element import FrameElement
 from openframe.util import TextAlign
 
 DEFAULT_FONT_PATH = "/System/Library/Fonts/Helvetica.ttc"
+TEXT_CACHE_BYTES = 64 * 1024 * 1024
+LINE_SPACING = 4
+
+_PROBE_TEXT = "AVAT Wa fi, j\nTo yj.\n\"Q@g\" 1/7"
+
+_text_cache = ByteLRUCache(TEXT_CACHE_BYTES)
+
+Box = Tuple[int, int, int, int]
+
 
 @lru_cache(maxsize=256)
 def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
@@ -23,10 +34,397 @@ def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.truetype(path, size)
 
 
+@dataclass(frozen=True)
+class _Glyph:
+    """Metrics and coverage of one character.
+
+    Attributes:
+        advance: Horizontal advance in 1/64 pixel units.
+        box: Ink bounds (left, top, right, bottom) relative to the pen.
+        mask: Coverage shaped (height, width), or None for blank glyphs.
+        offset: Position of the mask's top-left corner relative to the pen.
+    """
+
+    advance: int
+    box: Box
+    mask: np.ndarray | None
+    offset: Tuple[int, int]
+
+
+class _GlyphAtlas:
+    """Cached glyphs of one font at one size, assembled into lines of text.
+
+    Reproduces Pillow's basic layout: the pen advances in 1/64 pixel units
+    with pairwise kerning, each glyph is drawn at the pen rounded to a whole
+    pixel, and overlapping coverage is merged the way Pillow merges glyph
+    bitmaps. Masks hold coverage only, so one atlas serves every color.
+    """
+
+    def __init__(self, font: ImageFont.FreeTypeFont) -> None:
+        """Create an empty atlas.
+
+        Args:
+            font: Font whose glyphs are cached.
+        """
+
+        self.font = font
+        self.line_spacing = font.getbbox('A')[3] + LINE_SPACING
+        self._glyphs: dict[str, _Glyph] = {}
+        self._kerning: dict[Tuple[str, str], int] = {}
+
+    def glyph(self, char: str) -> _Glyph:
+        """Return the cached glyph of a character, rasterizing it on first use.
+
+        Args:
+            char: Single character.
+
+        Returns:
+            _Glyph: Metrics and coverage of the character.
+        """
+
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            mask, offset = self.font.getmask2(char, mode='L')
+            width, height = mask.size
+            pixels = None
+            if width and height:
+                pixels = np.asarray(mask, dtype=np.uint8).reshape(height, width).astype(np.uint16)
+            glyph = self._glyphs[char] = _Glyph(
+                advance=round(self.font.getlength(char) * 64),
+                box=self.font.getbbox(char),
+                mask=pixels,
+                offset=offset,
+            )
+        return glyph
+
+    def kerning(self, left: str, right: str) -> int:
+        """Return the kerning between two adjacent characters.
+
+        Args:
+            left: First character.
+            right: Character that follows it.
+
+        Returns:
+            int: Adjustment of the pen in 1/64 pixel units.
+        """
+
+        pair = (left, right)
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            kerning = self._kerning[pair] = (
+                round(self.font.getlength(left + right) * 64)
+                - self.glyph(left).advance
+                - self.glyph(right).advance
+            )
+        return kerning
+
+    def length(self, line: str) -> int:
+        """Return the advance of a line of text.
+
+        Args:
+            line: Text without line breaks.
+
+        Returns:
+            int: Width in 1/64 pixel units, as reported by getlength.
+        """
+
+        pen = 0
+        previous = None
+        for char in line:
+            if previous is not None:
+                pen += self.kerning(previous, char)
+            pen += self.glyph(char).advance
+            previous = char
+        return pen
+
+    def _place(self, line: str, pen: int) -> tuple[list[tuple[_Glyph, int]], Box]:
+        """Position the glyphs of a line and measure their ink bounds.
+
+        Args:
+            line: Non-empty text without line breaks.
+            pen: Starting pen position in 1/64 pixel units.
+
+        Returns:
+            tuple: Glyphs with their whole-pixel x positions, and the line's
+            bounding box.
+        """
+
+        placed = []
+        left = top = right = bottom = None
+        previous = None
+        for char in line:
+            glyph = self.glyph(char)
+            if previous is not None:
+                pen += self.kerning(previous, char)
+            x = (pen + 32) >> 6
+            glyph_left, glyph_top, glyph_right, glyph_bottom = glyph.box
+            if left is None:
+                left, top, right, bottom = x + glyph_left, glyph_top, x + glyph_right, glyph_bottom
+            else:
+                left = min(left, x + glyph_left)
+                top = min(top, glyph_top)
+                right = max(right, x + glyph_right)
+                bottom = max(bottom, glyph_bottom)
+            placed.append((glyph, x))
+            pen += glyph.advance
+            previous = char
+        return placed, (left, top, right, bottom)
+
+    def bbox(self, line: str) -> Box:
+        """Return the bounding box of a line drawn at the origin.
+
+        Args:
+            line: Text without line breaks.
+
+        Returns:
+            Box: (left, top, right, bottom), as reported by getbbox.
+        """
+
+        if not line:
+            return (0, 0, 0, 0)
+        return self._place(line, 0)[1]
+
+    def draw_line(
+        self,
+        draw: ImageDraw.ImageDraw,
+        line: str,
+        pen: int,
+        y: int,
+        color: Tuple[int, int, int, int],
+    ) -> None:
+        """Draw one line of text from cached glyphs.
+
+        Args:
+            draw: Drawing helper of the target image.
+            line: Text without line breaks.
+            pen: Horizontal start in 1/64 pixel units.
+            y: Top of the line in pixels.
+            color: RGBA fill color.
+        """
+
+        if not line:
+            return
+
+        placed, (left, top, right, bottom) = self._place(line, pen)
+        if right <= left or bottom <= top:
+            return
+
+        coverage = np.zeros((bottom - top, right - left), dtype=np.uint16)
+        written = 0
+        for glyph, x in placed:
+            if glyph.mask is None:
+                continue
+            x += glyph.offset[0] - left
+            glyph_y = glyph.offset[1] - top
+            height, width = glyph.mask.shape
+            x0, y0 = max(0, x), max(0, glyph_y)
+            x1 = min(coverage.shape[1], x + width)
+            y1 = min(coverage.shape[0], glyph_y + height)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            region = coverage[y0:y1, x0:x1]
+            source = glyph.mask[y0 - glyph_y:y1 - glyph_y, x0 - x:x1 - x]
+            if x0 >= written:
+                region[...] = source
+            else:
+                # Overlaps combine as a + b - a * b / 255 with Pillow's rounding.
+                product = region * source + 128
+                region += source - ((product + (product >> 8)) >> 8)
+            written = max(written, x1)
+
+        mask = Image.fromarray(coverage.astype(np.uint8), 'L')
+        draw.bitmap((left, y + top), mask, fill=color)
+
+    def render(
+        self,
+        text: str,
+        color: Tuple[int, int, int, int],
+        align: TextAlign,
+        box_size: Tuple[int, int] | None,
+    ) -> tuple[Image.Image, Tuple[int, int]]:
+        """Render text the way TextClip lays it out with Pillow.
+
+        Args:
+            text: Text, with lines separated by newlines.
+            color: RGBA fill color.
+            align: Horizontal alignment of the lines and of the text in the box.
+            box_size: Size of the image, or None to fit the text.
+
+        Returns:
+            tuple: RGBA image and the size of the text's bounding box.
+        """
+
+        lines = text.split('\n')
+        spacing = self.line_spacing
+        # The bounding box is measured with left-aligned lines, as
+        # multiline_textbbox is called without an alignment.
+        boxes = [self.bbox(line) for line in lines]
+        left = min(box[0] for box in boxes)
+        top = min(box[1] + index * spacing for index, box in enumerate(boxes))
+        right = max(box[2] for box in boxes)
+        bottom = max(box[3] + index * spacing for index, box in enumerate(boxes))
+        text_size = (max(1, right - left), max(1, bottom - top))
+        image_size = text_size if box_size is None else box_size
+
+        image = Image.new('RGBA', image_size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        origin_x = _align_offset(align, image_size[0], text_size[0]) - left
+        widths = [self.length(line) for line in lines] if len(lines) > 1 else [0]
+        max_width = max(widths)
+        for index, (line, width) in enumerate(zip(lines, widths)):
+            difference = (max_width - width) / 64
+            x = origin_x + {
+                TextAlign.LEFT: 0,
+                TextAlign.CENTER: difference / 2.0,
+                TextAlign.RIGHT: difference,
+            }.get(align, 0)
+            self.draw_line(draw, line, _to_pen(x), index * spacing - top, color)
+        return image, text_size
+
+
+def _to_pen(x: float) -> int:
+    """Convert a pixel position to 1/64 pixel units, rounding halves away from zero.
+
+    Args:
+        x: Position in pixels.
+
+    Returns:
+        int: Position in 1/64 pixel units.
+    """
+
+    if x >= 0:
+        return int(x * 64 + 0.5)
+    return -int(0.5 - x * 64)
+
+
+def _align_offset(align: TextAlign, box_width: int, text_width: int) -> int:
+    """Return the left edge of the text inside its box.
+
+    Args:
+        align: Horizontal alignment.
+        box_width: Width of the box in pixels.
+        text_width: Width of the text in pixels.
+
+    Returns:
+        int: Horizontal offset in pixels.
+    """
+
+    return {
+        TextAlign.LEFT: 0,
+        TextAlign.CENTER: (box_width - text_width) // 2,
+        TextAlign.RIGHT: box_width - text_width,
+    }.get(align, 0)
+
+
+def _draw_text(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    color: Tuple[int, int, int, int],
+    align: TextAlign,
+    box_size: Tuple[int, int] | None,
+) -> tuple[Image.Image, Tuple[int, int]]:
+    """Render text with Pillow's own text drawing.
+
+    Args:
+        text: Text, with lines separated by newlines.
+        font: Font to draw with.
+        color: RGBA fill color.
+        align: Horizontal alignment of the lines and of the text in the box.
+        box_size: Size of the image, or None to fit the text.
+
+    Returns:
+        tuple: RGBA image and the size of the text's bounding box.
+    """
+
+    probe = Image.new('RGBA', (1, 1))
+    probe_draw = ImageDraw.Draw(probe)
+    left, top, right, bottom = probe_draw.multiline_textbbox((0, 0), text, font=font)
+    text_size = (max(1, right - left), max(1, bottom - top))
+    image_size = text_size if box_size is None else box_size
+
+    image = Image.new('RGBA', image_size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    x_pos = _align_offset(align, image_size[0], text_size[0])
+    draw.multiline_text((x_pos - left, -top), text, font=font, fill=color, align=align.value)
+    return image, text_size
+
+
+@lru_cache(maxsize=256)
+def _glyph_atlas(path: str, size: int) -> _GlyphAtlas | None:
+    """Return the glyph atlas of a font, shared by every caption using it.
+
+    The atlas mirrors Pillow's basic layout engine, so fonts loaded with
+    another engine, or whose probe text does not match Pillow's output
+    exactly, are drawn by Pillow instead.
+
+    Args:
+        path: File path for the font.
+        size: Font size in points.
+
+    Returns:
+        _GlyphAtlas | None: Atlas for the font, or None when Pillow must draw
+        the text.
+    """
+
+    font = _load_font(path, size)
+    if font.layout_engine != ImageFont.Layout.BASIC:
+        return None
+
+    atlas = _GlyphAtlas(font)
+    color = (255, 255, 255, 255)
+    for align in TextAlign:
+        expected, expected_size = _draw_text(_PROBE_TEXT, font, color, align, None)
+        image, text_size = atlas.render(_PROBE_TEXT, color, align, None)
+        if text_size != expected_size or image.tobytes() != expected.tobytes():
+            return None
+    return atlas
+
+
+def _text_image(
+    text: str,
+    path: str,
+    size: int,
+    color: Tuple[int, int, int, int],
+    align: TextAlign,
+    box_size: Tuple[int, int] | None,
+) -> tuple[Image.Image, Tuple[int, int]]:
+    """Return rendered text, reusing the image of an identical earlier caption.
+
+    Args:
+        text: Text, with lines separated by newlines.
+        path: File path for the font.
+        size: Font size in points.
+        color: RGBA fill color.
+        align: Horizontal alignment of the lines and of the text in the box.
+        box_size: Size of the image, or None to fit the text.
+
+    Returns:
+        tuple: RGBA image and the size of the text's bounding box. The image
+        is shared between callers and must not be modified.
+    """
+
+    key = (text, path, size, color, align, box_size)
+    entry = _text_cache.get(key)
+    if entry is not None:
+        return entry
+
+    atlas = _glyph_atlas(path, size)
+    if atlas is None:
+        entry = _draw_text(text, _load_font(path, size), color, align, box_size)
+    else:
+        entry = atlas.render(text, color, align, box_size)
+    image = entry[0]
+    _text_cache.put(key, entry, image.width * image.height * 4)
+    return entry
+
+
 @dataclass
 class TextClip(FrameElement):
     """Represents a text overlay with timing, styling, and position.
 
+    Captions with the same text, font, size, color, alignment, and box share
+    one image, and their glyphs come from an atlas cached per font and size.
+
     Attributes:
         text: The text string to render.
         start_time: Seconds at which the clip appears.
@@ -37,8 +435,11 @@ class TextClip(FrameElement):
         color: RGBA tuple used to draw the text.
         font: Loaded FreeType font instance for rendering.
         text_align: Horizontal alignment when positioning the text.
+        image: Rendered text. Clips showing the same caption share this
+            image, and compositors cache its pixels by identity, so treat it
+            as read-only: copy it before drawing on it, or assign a new image.
     """
-    
+
     text: str
     font_size: int = 24
     color: Tuple[int, int, int, int] = (255, 255, 255, 255)
@@ -51,36 +452,19 @@ class TextClip(FrameElement):
     def __post_init__(self) -> None:
         """Pre-render text into an RGBA image for fast compositing."""
 
-        font = self.load_font()
-        probe = Image.new('RGBA', (1, 1))
-        probe_draw = ImageDraw.Draw(probe)
-        left, top, right, bottom = probe_draw.multiline_textbbox((0, 0), self.text, font=font)
-        width = max(1, right - left)
-        height = max(1, bottom - top)
-        self._text_size = (width, height)
-        if self.size is None:
-            self._bbox_size = self._text_size
-        else:
-            box_width = max(1, self.size[0])
-            box_height = max(1, self.size[1])
-            self._bbox_size = (box_width, box_height)
-
-        self.image = Image.new('RGBA', self._bbox_size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(self.image)
-        box_width = self._bbox_size[0]
-        text_width = self._text_size[0]
-        x_pos = {
-            TextAlign.LEFT: 0,
-            TextAlign.CENTER: (box_width - text_width) // 2,
-            TextAlign.RIGHT: box_width - text_width,
-        }.get(self.text_align, 0)
-        draw.multiline_text(
-            (x_pos - left, -top),
+        box_size = None
+        if self.size is not None:
+            box_size = (max(1, self.size[0]), max(1, self.size[1]))
+
+        self.image, self._text_size = _text_image(
             self.text,
-            font=font,
-            fill=self.color,
-            align=self.text_align.value,
+            self.font,
+            self.font_size,
+            tuple(self.color),
+            self.text_align,
+            box_size,
         )
+        self._bbox_size = self.image.size
 
     def load_font(self) -> ImageFont.FreeTypeFont:
         """Load the configured font at the clip's size.
@@ -101,6 +485,11 @@ class TextClip(FrameElement):
 
         canvas.paste(self.image, (0, 0), self.image)
 
+    def _static_image(self) -> Image.Image:
+        """Return the cached image so compositors can reuse its pixels."""
+
+        return self.image
+
     @property
     def bounding_box_size(self) -> Tuple[int, int]:
         """Compute the pixel area required to render the clip's text."""
@@ -0,0 +1,174 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from openframe.audio import AudioClip
+from openframe.element import FrameElement
+
+
+@dataclass(frozen=True, eq=False)
+class Placement:
+    """Place an element on the root timeline without copying it.
+
+    Flattening a scene tree produces one placement per element, holding the
+    start offsets of every enclosing scene summed together. Frame methods
+    take root timeline times and resolve them against the element as
+    t - offset, so the element itself is never rebuilt per nesting level.
+
+    Attributes:
+        element: Element or audio clip as it was added to its scene.
+        offset: Accumulated start offset of the enclosing scenes in seconds.
+    """
+
+    element: FrameElement | AudioClip
+    offset: float
+
+    @property
+    def start_time(self) -> float:
+        """Return the time the element starts on the root timeline."""
+
+        return self.element.start_time + self.offset
+
+    @property
+    def end_time(self) -> float:
+        """Return the time the element ends on the root timeline."""
+
+        return self.element.end_time + self.offset
+
+    def is_visible(self, t: float) -> bool:
+        """Report whether the element is visible at root time t.
+
+        Args:
+            t: Root timeline time in seconds.
+
+        Returns:
+            bool: True if the element should be drawn at time t.
+        """
+
+        return self.element.is_visible(t - self.offset)
+
+    def opacity_at(self, t: float) -> float:
+        """Return the element's opacity at root time t.
+
+        Args:
+            t: Root timeline time in seconds.
+
+        Returns:
+            float: Fractional opacity between 0.0 and 1.0.
+        """
+
+        return self.element.opacity_at(t - self.offset)
+
+    def render(self, canvas: Image.Image, t: float, origin: Tuple[int, int] = (0, 0)) -> None:
+        """Draw the element onto a Pillow canvas at root time t.
+
+        Args:
+            canvas: Frame canvas to compose onto.
+            t: Root timeline time in seconds.
+            origin: Frame coordinate of the canvas's top-left corner.
+        """
+
+        self.element.render(canvas, t - self.offset, origin)
+
+    def composite(self, canvas: np.ndarray, t: float, origin: Tuple[int, int] = (0, 0)) -> None:
+        """Blend the element into a NumPy canvas at root time t.
+
+        Args:
+            canvas: Float RGB canvas shaped (height, width, 3).
+            t: Root timeline time in seconds.
+            origin: Frame coordinate of the canvas's top-left corner.
+        """
+
+        self.element.composite(canvas, t - self.offset, origin)
+
+    def _static_image(self) -> Image.Image | None:
+        """Return the element's pre-rendered image, if its pixels never change."""
+
+        return self.element._static_image()
+
+    def _content_at(self, t: float) -> Image.Image | None:
+        """Return the image that determines the element's pixels at root time t."""
+
+        return self.element._content_at(t - self.offset)
+
+    def close(self) -> None:
+        """Release resources held by the element."""
+
+        self.element.close()
+
+
+class TimelineIndex:
+    """Answer visibility queries for flattened element placements.
+
+    Elements are sorted by start time once, and a sweep keeps the set of
+    clips whose interval covers the last queried time. Sequential queries
+    therefore cost time proportional to the number of active clips rather
+    than the size of the whole timeline, while results keep the z-order of
+    the original list.
+    """
+
+    def __init__(self, elements: Sequence[Placement]) -> None:
+        """Build the start-ordered sweep over the given placements.
+
+        Args:
+            elements: Flattened placements in z-order (bottom first).
+        """
+
+        self._elements = list(elements)
+        self._ends = [element.end_time for element in self._elements]
+        self._order = sorted(
+            range(len(self._elements)),
+            key=lambda index: self._elements[index].start_time,
+        )
+        self._starts = [self._elements[index].start_time for index in self._order]
+        self._cursor = 0
+        self._active: list[int] = []
+        self._last_time: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def visible_at(self, t: float) -> list[Placement]:
+        """Return the placements visible at time t in z-order.
+
+        Args:
+            t: Timeline time in seconds.
+
+        Returns:
+            list[Placement]: Visible placements, bottom layer first.
+        """
+
+        if self._last_time is not None and t < self._last_time:
+            self._seek(t)
+        self._last_time = t
+
+        admitted = False
+        while self._cursor < len(self._order) and self._starts[self._cursor] <= t:
+            self._active.append(self._order[self._cursor])
+            self._cursor += 1
+            admitted = True
+
+        self._active = [index for index in self._active if self._ends[index] > t]
+        if admitted:
+            self._active.sort()
+
+        return [
+            self._elements[index]
+            for index in self._active
+            if self._elements[index].is_visible(t)
+        ]
+
+    def _seek(self, t: float) -> None:
+        """Rebuild the active set for an arbitrary, possibly earlier, time.
+
+        Args:
+            t: Timeline time in seconds.
+        """
+
+        self._cursor = bisect_right(self._starts, t)
+        self._active = sorted(
+            index for index in self._order[: self._cursor] if self._ends[index] > t
+        )
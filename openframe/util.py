@@ -25,6 +25,22 @@ class TextAlign(Enum):
     CENTER = "center"
     RIGHT = "right"
 
+class CompositorBackend(Enum):
+    PILLOW = "pillow"
+    NUMPY = "numpy"
+
+class EncoderProfile(Enum):
+    DRAFT = "draft"
+    STREAMING = "streaming"
+    ARCHIVE = "archive"
+
+class Interpolation(Enum):
+    FAST_BILINEAR = "FAST_BILINEAR"
+    BILINEAR = "BILINEAR"
+    BICUBIC = "BICUBIC"
+    AREA = "AREA"
+    LANCZOS = "LANCZOS"
+
 def _compute_scaled_size(
     original_size: Tuple[int, int],
     target_size: Tuple[int, int],
@@ -98,8 +114,24 @@ def _resize_image(
     if mode != ContentMode.FILL:
         return resized
 
-    left = (resized.width - width) // 2
-    top = (resized.height - height) // 2
-    right = left + width
-    bottom = top + height
-    return resized.crop((left, top, right, bottom))
+    return resized.crop(_compute_crop_box(resized.size, (width, height)))
+
+
+def _compute_crop_box(
+    scaled_size: Tuple[int, int],
+    target_size: Tuple[int, int],
+) -> Tuple[int, int, int, int]:
+    """Return the centered crop that trims a filled image to the target size.
+
+    Args:
+        scaled_size: Width and height of the scaled image.
+        target_size: Width and height the crop must produce.
+
+    Returns:
+        Tuple[int, int, int, int]: Left, top, right, and bottom edges.
+    """
+
+    width, height = target_size
+    left = (scaled_size[0] - width) // 2
+    top = (scaled_size[1] - height) // 2
+    return (left, top, left + width, top + height)
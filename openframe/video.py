@@ -1,11 +1,20 @@
+import math
 from dataclasses import dataclass, field
-from typing import Iterator, Tuple
+from typing import Tuple
 
 import av
 from PIL import Image, ImageDraw
 
+from openframe import stats
+from openframe.compositor import Premultiplied, premultiply
+from openframe.cache import ByteLRUCache
+from openframe.decoder import FramePrefetcher, LoopFrameCache, SharedDecoder, decoder_pool, probe_video
 from openframe.element import FrameElement
-from openframe.util import ContentMode, _resize_image
+from openframe.util import ContentMode, Interpolation, _compute_crop_box, _compute_scaled_size, _resize_image
+
+LOOP_CACHE_BYTES = 2 * 1024 * 1024 * 1024
+
+_loop_cache = ByteLRUCache(LOOP_CACHE_BYTES)
 
 
 @dataclass(kw_only=True)
@@ -14,6 +23,15 @@ class VideoClip(FrameElement):
 
     Looping can be enabled so the clip repeats whenever the requested duration exceeds the source length.
     Use playback_rate below 1.0 to play in slow motion.
+    Set prefetch to a frame count to decode and scale ahead on a background thread.
+    Prefetching is experimental and off by default: it only pays off when spare
+    cores are available, and ``benchmarks.suite`` measures it as ``video_render``.
+    Enable fast_scale to scale and convert frames in a single libswscale pass
+    instead of Pillow's LANCZOS resize, with interpolation selecting the filter.
+    Looping clips keep the processed frames of their first pass in memory when
+    they fit within loop_cache_bytes and replay them instead of decoding again.
+    Clips reading the same file share one decoder from the pool, opened on the
+    first rendered frame and closed once every clip using it is closed.
     """
 
     path: str
@@ -22,19 +40,35 @@ class VideoClip(FrameElement):
     content_mode: ContentMode = ContentMode.NONE
     loop_enable: bool = False
     playback_rate: float = 1.0
+    prefetch: int = 0
+    fast_scale: bool = False
+    interpolation: Interpolation = Interpolation.BICUBIC
+    loop_cache_bytes: int = 512 * 1024 * 1024
     _visible_duration: float = field(init=False)
     _source_duration: float = field(init=False)
+    _frame_size: Tuple[int, int] = field(init=False)
+    _scaled_size: Tuple[int, int] | None = field(init=False, default=None)
+    _crop_box: Tuple[int, int, int, int] | None = field(init=False, default=None)
+    _display_frame: Image.Image | None = field(init=False, default=None)
     _current_frame: Image.Image | None = field(init=False, default=None)
     _current_time: float | None = field(init=False, default=None)
-    _container: av.container.input.InputContainer = field(init=False)
-    _stream: av.video.stream.VideoStream = field(init=False)
-    _frame_iter: Iterator[av.VideoFrame] | None = field(init=False, default=None)
+    _current_lap: int = field(init=False, default=0)
+    _wanted_lap: int = field(init=False, default=0)
+    _prefetcher: FramePrefetcher | None = field(init=False, default=None)
+    _pending: tuple[int, float, Image.Image | av.VideoFrame] | None = field(init=False, default=None)
+    _last_target: float | None = field(init=False, default=None)
+    _loop_frames: LoopFrameCache | None = field(init=False, default=None)
+    _loop_served: Image.Image | None = field(init=False, default=None)
+    _premultiplied: tuple[Image.Image, Premultiplied] | None = field(init=False, default=None)
+    _shown: tuple[float, Image.Image] | None = field(init=False, default=None)
+    _decoder: SharedDecoder | None = field(init=False, default=None)
     _time_base: float = field(init=False)
+    _frame_rate: float = field(init=False)
     _source_start_time: float = field(init=False)
     _source_end_time: float = field(init=False)
 
     def __post_init__(self) -> None:
-        """Initialize the decoder and timing for sequential playback.
+        """Validate the source range and compute timing from cached metadata.
 
         Returns:
             None
@@ -43,16 +77,25 @@ class VideoClip(FrameElement):
         if self.playback_rate <= 0:
             raise ValueError("playback_rate must be greater than 0.")
 
-        self._container = av.open(self.path)
-        self._stream = self._container.streams.video[0]
-        if self._stream.time_base is None:
+        if self.prefetch < 0:
+            raise ValueError("prefetch must be 0 or greater.")
+
+        info = probe_video(self.path)
+        if info.time_base is None:
             raise ValueError("Video stream does not provide a time base.")
 
-        if self._stream.duration is None:
+        if info.duration is None:
             raise ValueError("Video stream does not provide a duration.")
 
-        self._time_base = float(self._stream.time_base)
-        stream_duration = float(self._stream.duration * self._time_base)
+        self._time_base = info.time_base
+        self._frame_rate = info.frame_rate
+        self._frame_size = (info.width, info.height)
+        if self.size is not None and self.content_mode != ContentMode.NONE:
+            target_size = (max(1, self.size[0]), max(1, self.size[1]))
+            self._scaled_size = _compute_scaled_size(self._frame_size, target_size, self.content_mode)
+            if self.content_mode == ContentMode.FILL:
+                self._crop_box = _compute_crop_box(self._scaled_size, target_size)
+        stream_duration = info.duration
         self._source_start_time = max(0.0, self.source_start)
         self._source_end_time = stream_duration if self.source_end is None else self.source_end
 
@@ -68,7 +111,66 @@ class VideoClip(FrameElement):
         else:
             self._visible_duration = min(self.duration, self._source_duration / self.playback_rate)
 
-        self._reset_decoder(self._source_start_time)
+    def __getstate__(self) -> dict:
+        """Drop decoder handles so the clip can be sent to worker processes.
+
+        Returns:
+            dict: Picklable clip state without decoders or decoded frames.
+        """
+
+        state = self.__dict__.copy()
+        for name in (
+            '_decoder',
+            '_prefetcher',
+            '_pending',
+            '_loop_frames',
+            '_loop_served',
+            '_display_frame',
+            '_current_frame',
+            '_current_time',
+            '_premultiplied',
+            '_shown',
+        ):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the clip; its decoder is acquired again on the first frame.
+
+        Args:
+            state: State produced by __getstate__.
+        """
+
+        self.__dict__.update(state)
+        self._decoder = None
+        self._premultiplied = None
+        self._shown = None
+        self._prefetcher = None
+        self._pending = None
+        self._loop_frames = None
+        self._loop_served = None
+        self._display_frame = None
+        self._current_frame = None
+        self._current_time = None
+
+    def close(self) -> None:
+        """Stop background decoding and release the shared decoder.
+
+        Returns:
+            None
+        """
+
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+        if self._decoder is not None:
+            decoder_pool.release(self._decoder)
+            self._decoder = None
+        self._pending = None
+        self._loop_frames = None
+        self._current_time = None
+        self._current_frame = None
+        self._shown = None
 
     def is_visible(self, t: float) -> bool:
         """Report whether the clip should still draw its frames.
@@ -85,26 +187,63 @@ class VideoClip(FrameElement):
 
         return t < self.start_time + self._visible_duration
 
-    def render(self, canvas: Image.Image, t: float) -> None:
+    def render(self, canvas: Image.Image, t: float, origin: Tuple[int, int] = (0, 0)) -> None:
         """Select the correct frame before delegating to the base renderer.
 
         Args:
             canvas: Frame canvas to render onto.
             t: Timeline time in seconds.
+            origin: Frame coordinate of the canvas's top-left corner.
 
         Returns:
             None
         """
 
-        self._current_frame = self._frame_for_time(t)
+        self._display_frame = self._frame_for_time(t)
         try:
-            super().render(canvas, t)
+            super().render(canvas, t, origin)
         finally:
-            self._current_frame = None
+            self._display_frame = None
+
+    def _premultiplied_pixels(self, t: float) -> Premultiplied:
+        """Return the frame for time t prepared for NumPy blending.
+
+        Consecutive timeline frames that map onto the same source frame reuse
+        the previous conversion. Frames larger than the clip are cropped to
+        its bounds, as the Pillow path does.
+
+        Args:
+            t: Timeline time in seconds.
+
+        Returns:
+            Premultiplied: Pixels of the selected video frame.
+        """
+
+        frame = self._frame_for_time(t)
+        if self._premultiplied is None or self._premultiplied[0] is not frame:
+            width, height = self.bounding_box_size
+            visible = frame if frame.width <= width and frame.height <= height else frame.crop((0, 0, width, height))
+            self._premultiplied = (frame, premultiply(visible))
+        return self._premultiplied[1]
+
+    def _content_at(self, t: float) -> Image.Image:
+        """Return the frame drawn at time t.
+
+        Args:
+            t: Timeline time in seconds.
+
+        Returns:
+            Image.Image: Frame that should be drawn.
+        """
+
+        return self._frame_for_time(t)
 
     def _frame_for_time(self, t: float) -> Image.Image:
         """Pick the frame that most closely matches the requested timeline.
 
+        Repeated queries for the same time return the same frame without
+        touching the decoder.
+
         Args:
             t: Timeline time in seconds.
 
@@ -112,6 +251,9 @@ class VideoClip(FrameElement):
             Image.Image: Frame that should be drawn.
         """
 
+        if self._shown is not None and self._shown[0] == t:
+            return self._shown[1]
+
         elapsed_base = max(0.0, t - self.start_time)
         if self.loop_enable and self._source_duration > 0:
             elapsed = (elapsed_base * self.playback_rate) % self._source_duration
@@ -119,7 +261,9 @@ class VideoClip(FrameElement):
             elapsed = min(elapsed_base, self._visible_duration) * self.playback_rate
 
         target_time = self._source_start_time + elapsed
-        return self._ensure_frame_for_time(target_time)
+        frame = self._ensure_frame_for_time(target_time)
+        self._shown = (t, frame)
+        return frame
 
     def _render_content(self, canvas: Image.Image, draw: ImageDraw.ImageDraw) -> None:
         """Paint the current frame onto the overlay canvas.
@@ -132,9 +276,9 @@ class VideoClip(FrameElement):
             None
         """
 
-        if self._current_frame is None:
+        if self._display_frame is None:
             return
-        canvas.paste(self._current_frame, (0, 0), self._current_frame)
+        canvas.paste(self._display_frame, (0, 0), self._display_frame)
 
     def _ensure_frame_for_time(self, target_time: float) -> Image.Image:
         """Decode frames until the desired timestamp is reached.
@@ -146,57 +290,202 @@ class VideoClip(FrameElement):
             Image.Image: Decoded frame closest to the target time.
         """
 
+        cached = self._cached_loop_frame(target_time)
+        if cached is not None:
+            return cached
+
+        if self.prefetch > 0:
+            return self._prefetched_frame_for_time(target_time)
+
         if self._current_time is None or target_time < self._current_time:
-            self._reset_decoder(self._source_start_time)
+            self._restart_pass()
+            cached = self._cached_loop_frame(target_time)
+            if cached is not None:
+                return cached
 
         if self._current_time is not None and target_time <= self._current_time:
             return self._current_frame
 
-        self._advance_to_time(target_time)
+        if self._loop_frames is not None:
+            self._record_loop_until(target_time)
+        else:
+            self._decode_frame(target_time)
         if self._current_frame is None:
             raise ValueError("Failed to decode a frame at the requested time.")
         return self._current_frame
 
-    def _advance_to_time(self, target_time: float) -> None:
-        """Advance the decoder until reaching the requested time.
+    def _prefetched_frame_for_time(self, target_time: float) -> Image.Image:
+        """Take frames from the background decoder until the target is reached.
+
+        A looping clip asking for an earlier time moves on to the next pass of
+        the source; a non-looping clip restarts the decoder at the target. A
+        frame from a later pass is held back until that pass is requested, so
+        the end of each pass keeps showing its last frame.
 
         Args:
             target_time: Timestamp in seconds relative to the source.
 
         Returns:
-            None
+            Image.Image: First buffered frame at or after the target time.
         """
 
-        for frame in self._frame_iter:
-            frame_time = self._frame_time(frame)
+        if self._prefetcher is None:
+            self._start_prefetch(self._source_start_time)
+        elif self._current_time is not None and target_time < self._current_time:
+            if self.loop_enable and self._current_lap >= self._wanted_lap:
+                self._wanted_lap = self._current_lap + 1
+            elif not self.loop_enable:
+                self._start_prefetch(target_time)
+
+        if self._last_target is not None and target_time > self._last_target:
+            self._prefetcher.hint(target_time, target_time - self._last_target)
+        self._last_target = target_time
+
+        if (
+            self._current_time is not None
+            and self._current_lap >= self._wanted_lap
+            and target_time <= self._current_time
+        ):
+            return self._current_frame
 
-            if frame_time < self._source_start_time:
-                continue
-            if frame_time > self._source_end_time:
+        while True:
+            item, self._pending = self._pending or self._prefetcher.next(), None
+            if item is None:
                 break
 
-            if frame_time < target_time:
+            lap, frame_time, image = item
+            if self._loop_frames is not None:
+                if lap == 0:
+                    if isinstance(image, av.VideoFrame):
+                        image = self._process_frame(image)
+                    self._loop_frames.record(frame_time, image)
+                else:
+                    self._finish_loop_recording()
+
+            if lap < self._wanted_lap or (lap == self._wanted_lap and frame_time < target_time):
                 continue
 
-            self._current_time = frame_time
-            self._current_frame = self._process_frame(frame)
-            return
+            if lap > self._wanted_lap and self._current_lap == self._wanted_lap and self._current_frame is not None:
+                self._pending = (lap, frame_time, image)
+                break
 
-    def _frame_time(self, frame: av.VideoFrame) -> float:
-        """Return the presentation timestamp in seconds for a video frame.
+            if isinstance(image, av.VideoFrame):
+                image = self._process_frame(image)
+            self._current_lap, self._current_time, self._current_frame = lap, frame_time, image
+            self._wanted_lap = lap
+            break
+
+        if self._current_frame is None:
+            raise ValueError("Failed to decode a frame at the requested time.")
+        return self._current_frame
+
+    def _start_prefetch(self, seek_time: float) -> None:
+        """Replace any running background decoder with one starting at seek_time.
 
         Args:
-            frame: Video frame from PyAV.
+            seek_time: Source time in seconds to begin decoding from.
+
+        Returns:
+            None
+        """
+
+        self.close()
+        stats.count("prefetch_restarts")
+        self._current_lap = 0
+        self._wanted_lap = 0
+        self._last_target = None
+        self._prefetcher = FramePrefetcher(
+            path=self.path,
+            start_time=self._source_start_time,
+            end_time=self._source_end_time,
+            loop=self.loop_enable,
+            process=self._process_frame,
+            capacity=self.prefetch,
+        )
+        self._prefetcher.start(seek_time)
+        self._start_loop_recording(seek_time)
+
+    def _shared_decoder(self) -> SharedDecoder:
+        """Return the pooled decoder for this clip's file, acquiring it on first use.
+
+        Returns:
+            SharedDecoder: Decoder shared with other clips reading the same file.
+        """
+
+        if self._decoder is None:
+            self._decoder = decoder_pool.acquire(self.path)
+        return self._decoder
+
+    def _decode_frame(self, target_time: float) -> bool:
+        """Make the first frame at or after target_time the current frame.
+
+        The current frame is kept when no frame remains in the source range.
+
+        Args:
+            target_time: Timestamp in seconds relative to the source.
+
+        Returns:
+            bool: True when a frame was found.
+        """
+
+        hit = self._shared_decoder().frame_at(
+            target_time,
+            self._source_start_time,
+            self._source_end_time,
+            self._processing_key(),
+            self._process_frame,
+        )
+        if hit is None:
+            return False
+
+        self._current_time, self._current_frame = hit
+        return True
+
+    def _record_loop_until(self, target_time: float) -> None:
+        """Decode every frame of the pass up to target_time into the loop recording.
+
+        Reaching the end of the source range completes the recording.
+
+        Args:
+            target_time: Timestamp in seconds relative to the source.
+
+        Returns:
+            None
+        """
+
+        frames = self._loop_frames
+        while frames.recording:
+            if frames.times:
+                query = frames.times[-1] + self._time_base / 2
+            else:
+                query = self._source_start_time
+
+            if not self._decode_frame(query):
+                self._finish_loop_recording()
+                return
+
+            frames.record(self._current_time, self._current_frame)
+            if self._current_time >= target_time:
+                return
+
+        self._loop_frames = None
+        self._decode_frame(target_time)
+
+    def _restart_pass(self) -> None:
+        """Forget the current frame so playback restarts from the source start.
+
+        An unfinished loop recording is completed first, since the restart
+        means the renderer has wrapped around to the next pass.
 
         Returns:
-            float: Frame timestamp in seconds.
+            None
         """
 
-        if frame.pts is not None:
-            return float(frame.pts * self._time_base)
-        if frame.time is not None:
-            return float(frame.time)
-        raise ValueError("Decoded frame does not provide timing information.")
+        if self._loop_frames is not None and self._loop_frames.recording:
+            self._record_loop_until(self._source_end_time + 1.0)
+        self._current_time = None
+        self._current_frame = None
+        self._start_loop_recording(self._source_start_time)
 
     def _process_frame(self, frame: av.VideoFrame) -> Image.Image:
         """Convert and resize a decoded frame for rendering.
@@ -208,26 +497,143 @@ class VideoClip(FrameElement):
             Image.Image: Processed RGBA frame.
         """
 
+        if self.fast_scale:
+            return self._scale_frame(frame)
+
         image = frame.to_image().convert('RGBA')
         if self.size is None or self.content_mode == ContentMode.NONE:
             return image
         return _resize_image(image, self.size, self.content_mode)
 
-    def _reset_decoder(self, seek_time: float) -> None:
-        """Seek and prepare decoding from the requested time.
+    def _scale_frame(self, frame: av.VideoFrame) -> Image.Image:
+        """Scale and convert a frame to RGBA in one libswscale pass.
+
+        The scaled size and fill crop are computed once in __post_init__, so
+        only a view of the converted pixels is cropped here.
 
         Args:
-            seek_time: Target time in seconds for the seek.
+            frame: Video frame from PyAV.
+
+        Returns:
+            Image.Image: Processed RGBA frame.
+        """
+
+        width, height = self._scaled_size or (frame.width, frame.height)
+        pixels = frame.reformat(
+            width=width,
+            height=height,
+            format='rgba',
+            interpolation=self.interpolation.value,
+        ).to_ndarray()
+
+        if self._crop_box is not None:
+            left, top, right, bottom = self._crop_box
+            pixels = pixels[top:bottom, left:right]
+
+        return Image.fromarray(pixels, 'RGBA')
+
+    def _processing_key(self) -> tuple:
+        """Return the settings that determine how a decoded frame is processed.
+
+        Returns:
+            tuple: Size and scaling settings.
+        """
+
+        return (self.size, self.content_mode, self.fast_scale, self.interpolation)
+
+    def _loop_cache_key(self) -> tuple:
+        """Return the key identifying this clip's processed loop frames.
+
+        Returns:
+            tuple: Source range and processing settings.
+        """
+
+        return (self.path, self._source_start_time, self._source_end_time) + self._processing_key()
+
+    def _loop_cache_fits(self) -> bool:
+        """Estimate whether one processed pass fits in loop_cache_bytes.
+
+        Returns:
+            bool: True when caching the loop is worth attempting.
+        """
+
+        if not self.loop_enable or self.loop_cache_bytes <= 0:
+            return False
+
+        rate = self._frame_rate
+        if rate <= 0:
+            return False
+
+        if self._scaled_size is None:
+            width, height = self._frame_size
+        elif self._crop_box is not None:
+            width, height = self.bounding_box_size
+        else:
+            width, height = self._scaled_size
+
+        frame_count = math.ceil(self._source_duration * rate) + 1
+        return frame_count * width * height * 4 <= self.loop_cache_bytes
+
+    def _cached_loop_frame(self, target_time: float) -> Image.Image | None:
+        """Serve a frame from a completed loop pass without decoding.
+
+        Like the decoder, a target past the final frame keeps showing the
+        previously served frame.
+
+        Args:
+            target_time: Timestamp in seconds relative to the source.
+
+        Returns:
+            Image.Image | None: Cached frame, or None when no pass is cached.
+        """
+
+        if not self.loop_enable:
+            return None
+
+        frames = _loop_cache.get(self._loop_cache_key())
+        if frames is None:
+            return None
+
+        if self._prefetcher is not None:
+            self.close()
+
+        frame_time, image = frames.lookup(target_time)
+        if frame_time < target_time and self._loop_served is not None:
+            return self._loop_served
+
+        self._loop_served = image
+        return image
+
+    def _start_loop_recording(self, seek_time: float) -> None:
+        """Begin recording a pass when decoding restarts at the source start.
+
+        Args:
+            seek_time: Source time in seconds decoding restarts from.
 
         Returns:
             None
         """
 
-        pts = int(seek_time / self._time_base)
-        self._container.seek(pts, stream=self._stream, any_frame=False, backward=True)
-        self._frame_iter = self._container.decode(self._stream)
-        self._current_time = None
-        self._current_frame = None
+        self._loop_frames = None
+        if seek_time > self._source_start_time or self._loop_cache_key() in _loop_cache:
+            return
+        if self._loop_cache_fits():
+            self._loop_frames = LoopFrameCache(self.loop_cache_bytes)
+
+    def _finish_loop_recording(self) -> None:
+        """Publish a completed pass to the shared loop cache.
+
+        Returns:
+            None
+        """
+
+        frames, self._loop_frames = self._loop_frames, None
+        if frames is None:
+            return
+
+        frames.finish()
+        if frames.complete:
+            _loop_cache.put(self._loop_cache_key(), frames, frames.nbytes)
 
     @property
     def bounding_box_size(self) -> Tuple[int, int]:
@@ -240,5 +646,4 @@ class VideoClip(FrameElement):
         if self.size is not None:
             return (max(1, self.size[0]), max(1, self.size[1]))
 
-        frame = self._ensure_frame_for_time(self._source_start_time)
-        return frame.size
+        return self._frame_size
@@ -0,0 +1,47 @@
+import pytest
+
+from benchmarks.assets import make_sine_audio, make_test_pattern_video, write_font
+from openframe.cache import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the persistent caches at a per-test directory."""
+
+    directory = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(directory))
+    return directory
+
+
+@pytest.fixture(scope="session")
+def media_dir(tmp_path_factory):
+    """Return a directory shared by the generated test media."""
+
+    return tmp_path_factory.mktemp("media")
+
+
+@pytest.fixture(scope="session")
+def tone(media_dir):
+    """Return the path of a two-second 440 Hz stereo AAC tone."""
+
+    path = str(media_dir / "tone.m4a")
+    make_sine_audio(path, 2.0, 440.0)
+    return path
+
+
+@pytest.fixture(scope="session")
+def pattern_video(media_dir):
+    """Return the path of a two-second 64x48 test-pattern video at 10 fps."""
+
+    path = str(media_dir / "pattern.mp4")
+    make_test_pattern_video(path, 64, 48, 10, 2.0)
+    return path
+
+
+@pytest.fixture(scope="session")
+def font_path(media_dir):
+    """Return the path of the TrueType font bundled with Pillow."""
+
+    path = str(media_dir / "font.ttf")
+    write_font(path)
+    return path
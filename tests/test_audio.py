@@ -0,0 +1,126 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from openframe import AudioClip
+from openframe import audio as audio_module
+from openframe.audio import AUDIO_CACHE_NAMESPACE
+from openframe.cache import CACHE_DIR_ENV
+
+SAMPLE_RATE = 44100
+
+
+@pytest.fixture
+def source(tmp_path, tone):
+    """Return a private copy of the test tone with nothing cached in memory."""
+
+    path = str(tmp_path / "tone.m4a")
+    shutil.copyfile(tone, path)
+    audio_module._load_pcm.cache_clear()
+    audio_module._source_duration.cache_clear()
+    yield path
+    audio_module._load_pcm.cache_clear()
+    audio_module._source_duration.cache_clear()
+
+
+def _decode_directly(path, layout):
+    decoder = audio_module._SourceDecoder(path, SAMPLE_RATE, layout)
+    try:
+        blocks = []
+        while True:
+            block = decoder.read(audio_module.AUDIO_DECODE_BLOCK)
+            if block.shape[0] == 0:
+                return np.concatenate(blocks)
+            blocks.append(block.copy())
+    finally:
+        decoder.close()
+
+
+def test_decoded_samples_are_mapped_from_the_disk_cache(source, isolated_cache):
+    samples = audio_module._decode_audio_cached(source, SAMPLE_RATE, "stereo")
+
+    (entry,) = (isolated_cache / AUDIO_CACHE_NAMESPACE).glob("*.pcm")
+    assert entry.name.endswith(f"-{SAMPLE_RATE}-stereo.pcm")
+    assert isinstance(samples, np.memmap)
+    assert not samples.flags.writeable
+    np.testing.assert_array_equal(samples, _decode_directly(source, "stereo"))
+
+
+def test_cached_samples_are_read_back_without_decoding(source, monkeypatch):
+    expected = np.array(audio_module._decode_audio_cached(source, SAMPLE_RATE, "mono"))
+    audio_module._load_pcm.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the source was decoded again")
+
+    monkeypatch.setattr(audio_module, "_decode_into", fail)
+    np.testing.assert_array_equal(audio_module._decode_audio_cached(source, SAMPLE_RATE, "mono"), expected)
+
+
+def test_each_format_and_source_version_gets_its_own_entry(source, isolated_cache):
+    audio_module._decode_audio_cached(source, SAMPLE_RATE, "mono")
+    audio_module._decode_audio_cached(source, SAMPLE_RATE, "stereo")
+    audio_module._decode_audio_cached(source, 22050, "stereo")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    audio_module._decode_audio_cached(source, SAMPLE_RATE, "mono")
+
+    assert len(list((isolated_cache / AUDIO_CACHE_NAMESPACE).glob("*.pcm"))) == 4
+
+
+def test_unwritable_cache_falls_back_to_a_temporary_file(source, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    monkeypatch.setenv(CACHE_DIR_ENV, str(blocker))
+
+    samples = audio_module._decode_audio_cached(source, SAMPLE_RATE, "stereo")
+    np.testing.assert_array_equal(samples, _decode_directly(source, "stereo"))
+
+
+def test_source_duration_is_cached_on_disk(source, isolated_cache, monkeypatch):
+    duration = AudioClip(path=source).duration
+    audio_module._source_duration.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the source was opened again")
+
+    monkeypatch.setattr(audio_module.av, "open", fail)
+    assert AudioClip(path=source).duration == duration
+    assert duration == pytest.approx(2.0, abs=0.05)
+
+
+def _looped_clip(path):
+    return AudioClip(
+        path=path,
+        source_end=5.0,
+        loop_enable=True,
+        fade_in_duration=0.5,
+        fade_out_duration=1.0,
+        volume=0.5,
+    )
+
+
+def test_looped_clip_repeats_the_source_under_one_envelope(tone):
+    source = np.array(audio_module._decode_audio_cached(tone, SAMPLE_RATE, "stereo"), dtype=np.float64)
+    total = 5 * SAMPLE_RATE
+    expected = np.resize(source, (total, 2))
+    envelope = np.full(total, 0.5)
+    fade_in, fade_out = SAMPLE_RATE // 2, SAMPLE_RATE
+    envelope[:fade_in] *= np.arange(fade_in) / fade_in
+    envelope[total - fade_out :] *= (total - np.arange(total - fade_out, total)) / fade_out
+    expected *= envelope[:, None]
+
+    rendered = _looped_clip(tone).render(SAMPLE_RATE, 2)
+    assert rendered.shape == (total, 2)
+    np.testing.assert_allclose(rendered, expected, atol=1e-6)
+
+
+def test_looped_clip_reads_the_same_in_any_block_size(tone):
+    reference = _looped_clip(tone).render(SAMPLE_RATE, 2)
+    for block in (1000, 44100, 100_000):
+        reader = _looped_clip(tone).reader(SAMPLE_RATE, "stereo")
+        blocks = [reader.read(position, block) for position in range(0, reader.total, block)]
+        reader.close()
+        np.testing.assert_array_equal(np.concatenate(blocks)[: reader.total], reference)
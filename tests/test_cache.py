@@ -0,0 +1,47 @@
+from openframe.cache import ByteLRUCache
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = ByteLRUCache(30)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.put("c", 3, 10)
+    assert cache.get("a") == 1
+
+    cache.put("d", 4, 10)
+    assert "b" not in cache
+    assert [key for key in "acd" if key in cache] == ["a", "c", "d"]
+    assert cache.size == 30
+
+
+def test_eviction_frees_enough_bytes_for_a_large_entry():
+    cache = ByteLRUCache(30)
+    for key in "abc":
+        cache.put(key, key, 10)
+
+    cache.put("big", "big", 25)
+    assert len(cache) == 1
+    assert cache.size == 25
+
+
+def test_entries_larger_than_the_budget_are_not_stored():
+    cache = ByteLRUCache(30)
+    cache.put("a", 1, 10)
+    cache.put("huge", 2, 31)
+
+    assert "huge" not in cache
+    assert cache.get("a") == 1
+    assert cache.size == 10
+
+
+def test_replacing_a_key_updates_its_size():
+    cache = ByteLRUCache(30)
+    cache.put("a", 1, 10)
+    cache.put("a", 2, 20)
+
+    assert len(cache) == 1
+    assert cache.size == 20
+    assert cache.get("a") == 2
+    assert cache.pop("a") == 2
+    assert cache.size == 0
+    assert cache.get("a", "missing") == "missing"
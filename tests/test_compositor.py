@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from openframe import CallbackSink, CompositorBackend, ContentMode, ImageClip, Rectangle, Scene, TextClip, VideoClip
+
+WIDTH, HEIGHT, FPS = 64, 48, 10
+
+
+def _render(scene, compositor):
+    frames = []
+    scene.render(
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        compositor=compositor,
+        sink=CallbackSink(lambda index, data: frames.append(data.astype(np.int16)), pixel_format="rgb24"),
+    )
+    return frames
+
+
+def _max_backend_difference(build):
+    pillow = _render(build(), CompositorBackend.PILLOW)
+    numpy = _render(build(), CompositorBackend.NUMPY)
+    assert len(pillow) == len(numpy) > 0
+    return max(int(np.abs(a - b).max()) for a, b in zip(pillow, numpy))
+
+
+@pytest.fixture
+def translucent_image(tmp_path):
+    pixels = np.zeros((24, 32, 4), dtype=np.uint8)
+    pixels[..., 0] = np.linspace(0, 255, 32, dtype=np.uint8)[None, :]
+    pixels[..., 1] = 180
+    pixels[..., 2] = 40
+    pixels[..., 3] = np.linspace(0, 255, 24, dtype=np.uint8)[:, None]
+    path = str(tmp_path / "translucent.png")
+    Image.fromarray(pixels, "RGBA").save(path)
+    return path
+
+
+def test_backends_match_on_opaque_content(pattern_video):
+    def build():
+        scene = Scene(start_at=0)
+        scene.add(VideoClip(path=pattern_video, duration=1, size=(WIDTH, HEIGHT), content_mode=ContentMode.FILL))
+        scene.add(Rectangle(size=(20, 10), fill=(0, 0, 255, 255), position=(4, 4), duration=1))
+        return scene
+
+    assert _max_backend_difference(build) <= 1
+
+
+def test_backends_match_on_translucent_and_fading_content(translucent_image, font_path):
+    def build():
+        scene = Scene(start_at=0)
+        scene.add(Rectangle(size=(WIDTH, HEIGHT), fill=(30, 60, 90, 255), duration=1))
+        scene.add(ImageClip(path=translucent_image, position=(8, 8), duration=1, fade_in_duration=0.5))
+        scene.add(Rectangle(size=(30, 20), fill=(255, 0, 0, 128), position=(20, 20), duration=1, fade_out_duration=0.5))
+        scene.add(TextClip(text="Hi", font=font_path, font_size=20, color=(255, 255, 0, 200), position=(2, 20), duration=1))
+        return scene
+
+    assert _max_backend_difference(build) <= 1
+
+
+@pytest.mark.parametrize("layers", [1, 2, 4])
+def test_backend_difference_grows_at_most_one_level_per_translucent_layer(font_path, layers):
+    def build():
+        scene = Scene(start_at=0)
+        scene.add(Rectangle(size=(WIDTH, HEIGHT), fill=(30, 60, 90, 255), duration=1))
+        for index in range(layers - 1):
+            scene.add(
+                Rectangle(
+                    size=(40, 30),
+                    fill=(200, 40 + 40 * index, 10, 128),
+                    position=(2 * index, 2 * index),
+                    opacity=0.6,
+                    duration=1,
+                )
+            )
+        scene.add(
+            TextClip(
+                text="Hi there",
+                font=font_path,
+                font_size=20,
+                color=(255, 255, 0, 200),
+                position=(2, 10),
+                duration=1,
+                fade_in_duration=1,
+            )
+        )
+        return scene
+
+    assert _max_backend_difference(build) <= layers
@@ -0,0 +1,69 @@
+import os
+import shutil
+
+import av
+import pytest
+
+from openframe import decoder
+from openframe.decoder import KEYFRAME_INDEX_NAMESPACE, keyframe_index
+
+
+@pytest.fixture
+def video(tmp_path, pattern_video):
+    """Return a private copy of the test video with no index in memory."""
+
+    path = str(tmp_path / "pattern.mp4")
+    shutil.copyfile(pattern_video, path)
+    decoder._load_keyframe_index.cache_clear()
+    yield path
+    decoder._load_keyframe_index.cache_clear()
+
+
+def _index_files(cache):
+    directory = cache / KEYFRAME_INDEX_NAMESPACE
+    return sorted(directory.iterdir()) if directory.exists() else []
+
+
+def _scan(path):
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        return sorted(packet.pts for packet in container.demux(stream) if packet.is_keyframe and packet.pts is not None)
+
+
+def test_index_matches_a_packet_scan_and_is_written_to_disk(video, isolated_cache):
+    index = keyframe_index(video)
+
+    assert list(index.seek_timestamps) == _scan(video)
+    assert list(index.times) == sorted(index.times)
+    assert len(_index_files(isolated_cache)) == 1
+    assert index.keyframe_before(index.times[-1] + 10) == (index.times[-1], index.seek_timestamps[-1])
+
+
+def test_index_is_read_back_without_scanning(video, isolated_cache, monkeypatch):
+    expected = keyframe_index(video)
+    decoder._load_keyframe_index.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the video was scanned again")
+
+    monkeypatch.setattr(decoder.av, "open", fail)
+    assert keyframe_index(video) == expected
+
+
+def test_edited_file_is_scanned_again(video, isolated_cache):
+    keyframe_index(video)
+    stat = os.stat(video)
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    keyframe_index(video)
+    assert len(_index_files(isolated_cache)) == 2
+
+
+def test_corrupt_index_is_rebuilt(video, isolated_cache):
+    expected = keyframe_index(video)
+    (entry,) = _index_files(isolated_cache)
+    entry.write_text("{not json")
+    decoder._load_keyframe_index.cache_clear()
+
+    assert keyframe_index(video) == expected
+    assert entry.read_text().startswith("{\"path\"")
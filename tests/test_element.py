@@ -0,0 +1,51 @@
+import numpy as np
+
+from openframe import CallbackSink, Rectangle, Scene
+from openframe.element import OPACITY_LEVELS
+
+WIDTH, HEIGHT, FPS = 32, 24, 10
+
+
+def test_faded_overlays_are_cached_per_opacity_level():
+    rectangle = Rectangle(size=(8, 8), fill=(255, 0, 0, 200))
+    image = rectangle._static_image()
+
+    half = rectangle._faded_overlay(image, 0.5)
+    assert rectangle._faded_overlay(image, 0.5) is half
+    assert rectangle._faded_overlay(image, 0.5 + 0.1 / OPACITY_LEVELS) is half
+    assert rectangle._faded_overlay(image, 0.75) is not half
+    assert rectangle._faded_overlay(image, 1.0) is rectangle._faded_overlay(image, 1.0)
+
+
+def test_faded_overlay_scales_the_full_overlay_alpha():
+    rectangle = Rectangle(size=(8, 8), fill=(255, 0, 0, 200))
+    image = rectangle._static_image()
+    level = round(0.4 * (OPACITY_LEVELS - 1))
+
+    full = np.asarray(rectangle._faded_overlay(image, 1.0))
+    faded = np.asarray(rectangle._faded_overlay(image, 0.4))
+    np.testing.assert_array_equal(faded[..., :3], full[..., :3])
+    np.testing.assert_array_equal(faded[..., 3], full[..., 3].astype(np.int32) * level // (OPACITY_LEVELS - 1))
+
+
+def test_fades_reuse_their_overlays_across_renders():
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=1, fade_in_duration=0.5, fade_out_duration=0.5))
+
+    def render():
+        frames = []
+        stats = scene.render(
+            width=WIDTH,
+            height=HEIGHT,
+            fps=FPS,
+            stats=True,
+            sink=CallbackSink(lambda index, data: frames.append(data.copy())),
+        )
+        return frames, stats
+
+    first, first_stats = render()
+    second, second_stats = render()
+    assert first_stats.counters.get("overlay_allocations", 0) > 0
+    assert second_stats.counters.get("overlay_allocations", 0) == 0
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,44 @@
+import av
+import pytest
+
+from openframe import EncoderProfile, EncoderSettings, Rectangle, Scene
+
+
+@pytest.mark.parametrize("fps", [24, 30, 60])
+def test_streaming_profile_keyframes_every_two_seconds(tmp_path, fps):
+    container = av.open(str(tmp_path / "probe.mp4"), mode="w")
+    stream = container.add_stream("h264", rate=fps)
+    EncoderSettings.from_profile(EncoderProfile.STREAMING).configure_video(stream)
+
+    assert stream.codec_context.gop_size == 2 * fps
+
+
+def test_gop_size_overrides_keyframe_interval(tmp_path):
+    container = av.open(str(tmp_path / "probe.mp4"), mode="w")
+    stream = container.add_stream("h264", rate=24)
+    EncoderSettings(gop_size=10, keyframe_interval=2.0).configure_video(stream)
+
+    assert stream.codec_context.gop_size == 10
+
+
+def test_keyframe_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        EncoderSettings(keyframe_interval=0)
+
+
+def test_streaming_render_places_keyframes_on_two_second_boundaries(tmp_path):
+    fps = 24
+    output = str(tmp_path / "streaming.mp4")
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(16, 16), fill=(255, 0, 0, 255), duration=5.0))
+    scene.render(width=32, height=32, fps=fps, output_path=output, encoder=EncoderProfile.STREAMING)
+
+    container = av.open(output)
+    stream = container.streams.video[0]
+    keyframes = [
+        round(packet.pts * stream.time_base * fps)
+        for packet in container.demux(stream)
+        if packet.pts is not None and packet.is_keyframe
+    ]
+    container.close()
+    assert keyframes == [0, 48, 96]
@@ -0,0 +1,90 @@
+import av
+import pytest
+from tqdm import tqdm
+
+from openframe import AudioClip, CallbackSink, Rectangle, Scene, Sink
+from openframe import scene as scene_module
+
+WIDTH, HEIGHT, FPS = 32, 24, 10
+SAMPLE_RATE = 44100
+
+
+class RecordingBar(tqdm):
+    """Progress bar that remembers its final count and whether it closed."""
+
+    bars = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.closed = False
+        RecordingBar.bars.append(self)
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_progress_bar_reaches_the_last_frame_and_closes(monkeypatch, workers):
+    RecordingBar.bars = []
+    monkeypatch.setattr(scene_module, "tqdm", RecordingBar)
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=1))
+
+    scene.render(width=WIDTH, height=HEIGHT, fps=FPS, workers=workers, sink=CallbackSink(lambda index, data: None))
+
+    (bar,) = RecordingBar.bars
+    assert bar.n == bar.total == FPS
+    assert bar.closed
+
+
+class RecordingSink(Sink):
+    """Sink that records how much audio was written before each frame."""
+
+    def __init__(self):
+        self.samples_before_frame = []
+        self.samples = 0
+
+    def write_video(self, data, pixel_format, frame=None, repeated=False):
+        self.samples_before_frame.append(self.samples)
+
+    def write_audio(self, samples):
+        self.samples += samples.shape[1]
+
+
+def _scene_with_audio(tone):
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=2))
+    scene.add_audio(AudioClip(path=tone))
+    return scene
+
+
+def test_audio_is_written_alongside_each_frame(tone):
+    sink = RecordingSink()
+    _scene_with_audio(tone).render(width=WIDTH, height=HEIGHT, fps=FPS, audio_sample_rate=SAMPLE_RATE, sink=sink)
+
+    assert len(sink.samples_before_frame) == 2 * FPS
+    for index, written in enumerate(sink.samples_before_frame):
+        covered = index * SAMPLE_RATE // FPS
+        assert covered <= written < covered + sink.audio_frame_size
+    assert sink.samples >= 2 * SAMPLE_RATE
+
+
+def test_encoded_streams_are_interleaved_in_decode_order(tmp_path, tone):
+    path = str(tmp_path / "interleaved.mp4")
+    _scene_with_audio(tone).render(width=WIDTH, height=HEIGHT, fps=FPS, audio_sample_rate=SAMPLE_RATE, output_path=path)
+
+    with av.open(path) as container:
+        packets = [
+            (packet.stream.type, float(packet.dts * packet.stream.time_base))
+            for packet in container.demux()
+            if packet.dts is not None
+        ]
+
+    switches = sum(1 for previous, current in zip(packets, packets[1:]) if previous[0] != current[0])
+    assert {kind for kind, _ in packets} == {"video", "audio"}
+    assert switches >= 2 * FPS
+    for kind in ("video", "audio"):
+        times = [time for packet_kind, time in packets if packet_kind == kind]
+        assert times == sorted(times)
+    assert max(abs(a[1] - b[1]) for a, b in zip(packets, packets[1:]) if a[0] != b[0]) < 1.0 / FPS + 0.03
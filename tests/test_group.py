@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from openframe import CompositorBackend, Rectangle, Scene, TextClip
+from openframe.group import LayerGroup, group_static_layers
+
+WIDTH, HEIGHT, FPS = 64, 48, 10
+
+
+def _build(font_path):
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(WIDTH, HEIGHT), fill=(30, 60, 90, 255), duration=2))
+    scene.add(Rectangle(size=(30, 20), fill=(255, 0, 0, 255), position=(4, 4), duration=2))
+    scene.add(Rectangle(size=(30, 20), fill=(0, 255, 0, 128), position=(20, 14), duration=2))
+    scene.add(TextClip(text="Hi", font=font_path, font_size=20, color=(255, 255, 0, 200), position=(2, 20), duration=2))
+    scene.add(Rectangle(size=(10, 10), fill=(255, 255, 255, 200), position=(40, 2), duration=1, fade_out_duration=0.5))
+    scene.add(Rectangle(size=(10, 10), fill=(0, 0, 0, 160), position=(40, 30), duration=1, fade_out_duration=0.5))
+    return scene
+
+
+def test_static_runs_are_grouped(font_path):
+    placements = _build(font_path)._get_elements()
+    grouped = group_static_layers(placements, WIDTH, HEIGHT)
+
+    groups = [placement.element for placement in grouped if isinstance(placement.element, LayerGroup)]
+    assert len(grouped) < len(placements)
+    assert sum(len(group.members) for group in groups) + len(grouped) - len(groups) == len(placements)
+
+
+@pytest.mark.parametrize("compositor", [CompositorBackend.PILLOW, CompositorBackend.NUMPY])
+def test_grouped_render_matches_ungrouped(font_path, compositor):
+    def frames(group_static):
+        return [
+            frame.astype(np.int16)
+            for frame in _build(font_path).iter_frames(
+                WIDTH, HEIGHT, FPS, compositor=compositor, pixel_format="rgb24", group_static=group_static
+            )
+        ]
+
+    grouped = frames(True)
+    ungrouped = frames(False)
+    assert len(grouped) == len(ungrouped) == 2 * FPS
+    assert max(int(np.abs(a - b).max()) for a, b in zip(grouped, ungrouped)) <= 1
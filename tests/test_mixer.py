@@ -0,0 +1,74 @@
+import av
+import numpy as np
+import pytest
+
+from openframe import AudioClip
+from openframe.audio import _channel_gains
+from openframe.mixer import AudioMixer
+from openframe.timeline import Placement
+
+SAMPLE_RATE = 44100
+
+
+def _mix(placements, layout, samples, block=1024):
+    mixer = AudioMixer(placements, SAMPLE_RATE, layout, samples)
+    blocks = []
+    try:
+        while mixer.remaining:
+            blocks.append(mixer.read(block))
+    finally:
+        mixer.close()
+    return np.concatenate(blocks, axis=1)[:, : len(samples)]
+
+
+def test_overlapping_clips_are_clipped_to_full_scale(tone):
+    placements = [Placement(AudioClip(path=tone, volume=2.0), 0.0), Placement(AudioClip(path=tone, volume=2.0), 0.0)]
+    mixed = _mix(placements, "stereo", range(SAMPLE_RATE))
+
+    assert np.abs(mixed).max() == 1.0
+    assert np.isclose(mixed, 1.0).mean() > 0.1
+
+
+def test_block_size_does_not_change_the_mix(tone):
+    placements = [Placement(AudioClip(path=tone, start_time=0.25), 0.0), Placement(AudioClip(path=tone), 1.0)]
+    samples = range(SAMPLE_RATE // 2, 3 * SAMPLE_RATE)
+
+    reference = _mix(placements, "stereo", samples, block=len(samples))
+    for block in (333, 1024, 4096):
+        np.testing.assert_array_equal(_mix(placements, "stereo", samples, block=block), reference)
+
+
+def test_pan_moves_a_clip_between_channels(tone):
+    def channel_rms(pan):
+        mixed = _mix([Placement(AudioClip(path=tone, pan=pan), 0.0)], "stereo", range(SAMPLE_RATE))
+        return np.sqrt((mixed.astype(np.float64) ** 2).mean(axis=1))
+
+    center = channel_rms(0.0)
+    left = channel_rms(-1.0)
+    right = channel_rms(1.0)
+    half_left = channel_rms(-0.5)
+
+    np.testing.assert_allclose(center[0], center[1], rtol=1e-6)
+    np.testing.assert_allclose(left, [center[0] * np.sqrt(2.0), 0.0], atol=1e-6)
+    np.testing.assert_allclose(right, [0.0, center[1] * np.sqrt(2.0)], atol=1e-6)
+    assert half_left[0] > center[0] > half_left[1] > 0
+    np.testing.assert_allclose((half_left ** 2).sum(), (center ** 2).sum(), rtol=1e-4)
+
+
+def test_pan_leaves_center_and_lfe_channels_alone():
+    gains = _channel_gains("5.1", 1.0)
+    channels = [channel.name for channel in av.AudioLayout("5.1").channels]
+
+    for channel, gain in zip(channels, gains):
+        if channel in ("FC", "LFE"):
+            assert gain == 1.0
+        elif channel.endswith("L"):
+            assert gain == pytest.approx(0.0, abs=1e-6)
+        else:
+            assert gain == pytest.approx(np.sqrt(2.0))
+    assert _channel_gains("5.1", 0.0) is None
+
+
+def test_pan_outside_the_range_is_rejected(tone):
+    with pytest.raises(ValueError):
+        AudioClip(path=tone, pan=1.5)
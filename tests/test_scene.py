@@ -0,0 +1,49 @@
+import numpy as np
+
+from openframe import CallbackSink, ContentMode, Rectangle, Scene, VideoClip
+
+WIDTH, HEIGHT, FPS = 32, 24, 10
+
+
+def _render(scene):
+    frames = []
+    stats = scene.render(
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        stats=True,
+        sink=CallbackSink(lambda index, data: frames.append(data.copy())),
+    )
+    return frames, stats
+
+
+def test_static_frames_are_composited_once_per_run():
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=1))
+    scene.add(Rectangle(size=(8, 8), fill=(0, 0, 255, 255), position=(10, 10), start_time=1, duration=1))
+
+    frames, stats = _render(scene)
+    assert stats.counters["repeated_frames"] == 2 * FPS - 2
+    assert all(np.array_equal(frame, frames[0]) for frame in frames[:FPS])
+    assert all(np.array_equal(frame, frames[FPS]) for frame in frames[FPS:])
+    assert not np.array_equal(frames[0], frames[FPS])
+
+
+def test_fading_frames_are_not_repeated_until_the_fade_ends():
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=2, fade_in_duration=1))
+
+    frames, stats = _render(scene)
+    assert stats.counters["repeated_frames"] == FPS - 1
+    brightness = [int(frame[..., 0].max()) for frame in frames[:FPS + 1]]
+    assert brightness == sorted(brightness)
+    assert brightness[0] < brightness[FPS]
+
+
+def test_frames_with_video_are_always_composited(pattern_video):
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(WIDTH, HEIGHT), fill=(0, 0, 0, 255), duration=1))
+    scene.add(VideoClip(path=pattern_video, size=(16, 12), content_mode=ContentMode.FILL, duration=1))
+
+    _, stats = _render(scene)
+    assert stats.counters.get("repeated_frames", 0) == 0
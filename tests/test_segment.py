@@ -0,0 +1,112 @@
+import os
+import shutil
+
+import av
+import numpy as np
+import pytest
+
+from openframe import AudioClip, Rectangle, Scene
+from openframe.segment import Segment, concat_segments, plan_segments, prepare_segment_dir
+
+SAMPLE_RATE = 44100
+FPS = 10
+
+
+def _decode_audio(path):
+    container = av.open(path)
+    try:
+        return np.concatenate([frame.to_ndarray() for frame in container.decode(audio=0)], axis=1)
+    finally:
+        container.close()
+
+
+def _count_video_frames(path):
+    container = av.open(path)
+    try:
+        return sum(1 for _ in container.decode(video=0))
+    finally:
+        container.close()
+
+
+def _build_scene(tone):
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(16, 16), fill=(255, 0, 0, 255), duration=2.0))
+    scene.add_audio(AudioClip(path=tone))
+    return scene
+
+
+def test_plan_segments_snaps_audio_to_encoder_frames():
+    plan = plan_segments(100, 441000, 3, 10, SAMPLE_RATE, 1024)
+
+    assert [(segment.start_frame, segment.stop_frame) for segment in plan] == [(0, 33), (33, 66), (66, 100)]
+    assert plan[0].start_sample == 0
+    assert plan[-1].stop_sample == 441000
+    for previous, segment in zip(plan, plan[1:]):
+        assert segment.start_sample % 1024 == 0
+        assert segment.start_sample == previous.stop_sample
+        assert segment.start_sample <= segment.start_frame * SAMPLE_RATE // 10 < segment.start_sample + 1024
+
+
+def test_plan_segments_never_yields_empty_segments():
+    plan = plan_segments(2, 88200, 5, 1, SAMPLE_RATE, 1024)
+
+    assert len(plan) == 2
+    assert all(segment.stop_frame > segment.start_frame for segment in plan)
+
+
+def test_prepare_segment_dir_resumes_only_matching_manifest(tmp_path):
+    directory = str(tmp_path / "segments")
+    plan = [Segment(0, 0, 10, 0, 44032), Segment(1, 10, 20, 44032, 88200)]
+    settings = {"width": 64, "height": 48}
+
+    assert prepare_segment_dir(directory, settings, plan) == set()
+    with open(os.path.join(directory, plan[0].file_name), "wb") as handle:
+        handle.write(b"finished")
+
+    assert prepare_segment_dir(directory, settings, plan) == {0}
+    assert prepare_segment_dir(directory, {"width": 32, "height": 48}, plan) == set()
+    assert not os.path.exists(os.path.join(directory, plan[0].file_name))
+
+
+def test_segmented_audio_matches_single_pass_across_boundaries(tmp_path, tone):
+    single = str(tmp_path / "single.mp4")
+    segmented = str(tmp_path / "segmented.mp4")
+    _build_scene(tone).render(width=32, height=32, fps=FPS, output_path=single)
+    _build_scene(tone).render(width=32, height=32, fps=FPS, output_path=segmented, segments=3, workers=2)
+
+    expected = _decode_audio(single)
+    actual = _decode_audio(segmented)
+    assert actual.shape == expected.shape
+
+    total_samples = 2 * SAMPLE_RATE
+    for segment in plan_segments(2 * FPS, total_samples, 3, FPS, SAMPLE_RATE, 1024)[1:]:
+        window = slice(segment.start_sample - 2048, segment.start_sample + 2048)
+        np.testing.assert_allclose(actual[:, window], expected[:, window], atol=1e-6)
+    assert _count_video_frames(segmented) == 2 * FPS
+    assert not os.path.exists(f"{segmented}.segments")
+
+
+def _write_segment_files(directory, count):
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(16, 16), fill=(255, 0, 0, 255), duration=1.0))
+    first = os.path.join(directory, Segment(0, 0, 0, 0, 0).file_name)
+    scene.render(width=32, height=24, fps=FPS, output_path=first)
+    for index in range(1, count):
+        shutil.copyfile(first, os.path.join(directory, Segment(index, 0, 0, 0, 0).file_name))
+
+
+def test_concat_segments_copies_every_frame(tmp_path):
+    _write_segment_files(str(tmp_path), 2)
+    segments = [Segment(0, 0, FPS, 0, 0), Segment(1, FPS, 2 * FPS, 0, 0)]
+    output = str(tmp_path / "joined.mp4")
+
+    concat_segments(str(tmp_path), segments, FPS, output)
+    assert _count_video_frames(output) == 2 * FPS
+
+
+def test_concat_segments_rejects_overlapping_segments(tmp_path):
+    _write_segment_files(str(tmp_path), 2)
+    segments = [Segment(0, 0, FPS, 0, 0), Segment(1, FPS // 2, FPS + FPS // 2, 0, 0)]
+
+    with pytest.raises(ValueError):
+        concat_segments(str(tmp_path), segments, FPS, str(tmp_path / "joined.mp4"))
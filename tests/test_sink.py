@@ -0,0 +1,106 @@
+import av
+import numpy as np
+import pytest
+
+from openframe import CallbackSink, CompositorBackend, ContainerSink, EncoderSettings, Rectangle, Scene
+
+WIDTH, HEIGHT, FPS = 64, 48, 10
+
+
+def _two_static_runs():
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(20, 20), fill=(255, 0, 0, 255), position=(4, 4), duration=1))
+    scene.add(Rectangle(size=(20, 20), fill=(0, 0, 255, 255), position=(30, 20), start_time=1, duration=1))
+    return scene
+
+
+def test_callback_sink_converts_a_buffer_mutated_in_place():
+    frames = []
+    sink = CallbackSink(lambda index, data: frames.append(data.copy()), pixel_format="rgb24")
+    sink.open(WIDTH, HEIGHT, FPS, 44100, None)
+    buffer = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+    sink.write_video(buffer, "rgba")
+    buffer[:] = 255
+    sink.write_video(buffer, "rgba")
+    sink.close()
+
+    assert frames[0].max() == 0
+    assert frames[1].min() == 255
+
+
+def test_container_sink_encodes_a_buffer_mutated_in_place(tmp_path):
+    path = str(tmp_path / "mutated.mp4")
+    sink = ContainerSink(path)
+    sink.open(WIDTH, HEIGHT, FPS, 44100, None)
+    buffer = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    sink.write_video(buffer, "rgb24")
+    buffer[:] = 255
+    sink.write_video(buffer, "rgb24")
+    sink.close()
+
+    with av.open(path) as container:
+        means = [frame.to_ndarray(format="rgb24").mean() for frame in container.decode(video=0)]
+    assert means[0] < 16
+    assert means[1] > 239
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rendered_frames_follow_the_timeline_across_repeats(workers):
+    expected = [frame.copy() for frame in _two_static_runs().iter_frames(WIDTH, HEIGHT, FPS, pixel_format="rgb24")]
+    frames = []
+    _two_static_runs().render(
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        workers=workers,
+        sink=CallbackSink(lambda index, data: frames.append(data.copy()), pixel_format="rgb24"),
+    )
+
+    assert len(frames) == len(expected) == 2 * FPS
+    assert not np.array_equal(expected[0], expected[FPS])
+    for frame, reference in zip(frames, expected):
+        np.testing.assert_array_equal(frame, reference)
+
+
+@pytest.mark.parametrize(
+    ("compositor", "encoder", "extension"),
+    [
+        (CompositorBackend.NUMPY, EncoderSettings(codec="libx264rgb", pixel_format="rgb24"), "mp4"),
+        (CompositorBackend.PILLOW, EncoderSettings(codec="png", pixel_format="rgba"), "mov"),
+    ],
+)
+def test_frames_shared_with_the_encoder_get_increasing_timestamps(tmp_path, compositor, encoder, extension):
+    path = str(tmp_path / f"shared.{extension}")
+    _two_static_runs().render(width=WIDTH, height=HEIGHT, fps=FPS, output_path=path, compositor=compositor, encoder=encoder)
+
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        times = sorted(
+            round(packet.pts * stream.time_base * FPS)
+            for packet in container.demux(stream)
+            if packet.pts is not None
+        )
+    assert times == list(range(2 * FPS))
+
+
+def test_repeated_frames_from_workers_get_their_own_timestamps(tmp_path):
+    path = str(tmp_path / "workers.mp4")
+    encoder = EncoderSettings(codec="libx264rgb", pixel_format="rgb24")
+    _two_static_runs().render(
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        output_path=path,
+        workers=2,
+        compositor=CompositorBackend.NUMPY,
+        encoder=encoder,
+    )
+
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        times = sorted(
+            round(packet.pts * stream.time_base * FPS)
+            for packet in container.demux(stream)
+            if packet.pts is not None
+        )
+    assert times == list(range(2 * FPS))
@@ -0,0 +1,62 @@
+from openframe import CallbackSink, Rectangle, RenderStats, Scene
+from openframe.stats import StageTiming, active_stats, collecting
+
+WIDTH, HEIGHT, FPS = 32, 24, 10
+
+
+def _scene():
+    scene = Scene(start_at=0)
+    scene.add(Rectangle(size=(8, 8), fill=(255, 0, 0, 255), duration=1, fade_in_duration=0.5))
+    return scene
+
+
+def test_render_collects_stages_counters_and_frame_times(tmp_path):
+    stats = _scene().render(width=WIDTH, height=HEIGHT, fps=FPS, output_path=str(tmp_path / "out.mp4"), stats=True)
+
+    assert isinstance(stats, RenderStats)
+    assert stats.frames == FPS
+    assert stats.wall_seconds >= sum(stats.frame_seconds) > 0
+    for stage in ("visibility", "compose", "element:Rectangle", "video_encode", "finish"):
+        assert stats.stages[stage].calls > 0
+    assert stats.stages["compose"].seconds >= stats.stages["element:Rectangle"].seconds
+    assert stats.counters["repeated_frames"] == FPS // 2 - 1
+    assert "repeated_frames" in stats.summary()
+
+
+def test_callbacks_receive_every_frame_and_the_finish():
+    seen = []
+    finished = []
+    stats = RenderStats(
+        on_frame=lambda collected, index, seconds: seen.append(index),
+        on_finish=lambda collected: finished.append(collected.frames),
+    )
+
+    returned = _scene().render(
+        width=WIDTH, height=HEIGHT, fps=FPS, stats=stats, sink=CallbackSink(lambda index, data: None)
+    )
+    assert returned is stats
+    assert seen == list(range(FPS))
+    assert finished == [FPS]
+
+
+def test_collection_is_off_unless_requested():
+    assert _scene().render(width=WIDTH, height=HEIGHT, fps=FPS, sink=CallbackSink(lambda index, data: None)) is None
+    assert active_stats() is None
+
+    outer, inner = RenderStats(), RenderStats()
+    with collecting(outer):
+        with collecting(inner):
+            assert active_stats() is inner
+        assert active_stats() is outer
+    assert active_stats() is None
+
+
+def test_stage_timing_tracks_calls_total_and_max():
+    timing = StageTiming()
+    for seconds in (0.5, 2.0, 0.5):
+        timing.add(seconds)
+
+    assert timing.calls == 3
+    assert timing.seconds == 3.0
+    assert timing.max_seconds == 2.0
+    assert timing.mean_seconds == 1.0
@@ -0,0 +1,67 @@
+import pytest
+from PIL import Image, ImageFont
+
+from openframe import TextClip
+from openframe import text as text_module
+from openframe.util import TextAlign
+
+COLOR = (255, 200, 0, 255)
+
+
+@pytest.fixture
+def fresh_atlas():
+    """Drop the memoized atlases so a test can change how they are built."""
+
+    text_module._glyph_atlas.cache_clear()
+    yield
+    text_module._glyph_atlas.cache_clear()
+
+
+def _pillow_text(text, font_path, size, align=TextAlign.LEFT, box_size=None):
+    font = text_module._load_font(font_path, size)
+    return text_module._draw_text(text, font, COLOR, align, box_size)
+
+
+def test_identical_captions_share_one_image(font_path):
+    first = TextClip(text="Shared caption", font=font_path, font_size=18, color=COLOR)
+    second = TextClip(text="Shared caption", font=font_path, font_size=18, color=COLOR)
+    recolored = TextClip(text="Shared caption", font=font_path, font_size=18, color=(0, 0, 255, 255))
+
+    assert first.image is second.image
+    assert recolored.image is not first.image
+
+
+@pytest.mark.parametrize("align", list(TextAlign))
+def test_atlas_matches_pillow(font_path, align):
+    atlas = text_module._glyph_atlas(font_path, 22)
+    assert atlas is not None
+
+    for text, box_size in [("Hello, world", None), ("Two\nlines of text", None), ("Boxed", (120, 40))]:
+        image, size = atlas.render(text, COLOR, align, box_size)
+        expected, expected_size = _pillow_text(text, font_path, 22, align, box_size)
+        assert size == expected_size
+        assert image.tobytes() == expected.tobytes()
+
+
+def test_atlas_falls_back_for_other_layout_engines(font_path, fresh_atlas, monkeypatch):
+    font = ImageFont.truetype(font_path, 21)
+    font.layout_engine = ImageFont.Layout.RAQM
+    monkeypatch.setattr(text_module, "_load_font", lambda path, size: font)
+
+    assert text_module._glyph_atlas(font_path, 21) is None
+
+
+def test_atlas_falls_back_when_the_probe_differs(font_path, fresh_atlas, monkeypatch):
+    render = text_module._GlyphAtlas.render
+
+    def flipped(self, text, color, align, box_size):
+        image, size = render(self, text, color, align, box_size)
+        return image.transpose(Image.Transpose.FLIP_LEFT_RIGHT), size
+
+    monkeypatch.setattr(text_module._GlyphAtlas, "render", flipped)
+    assert text_module._glyph_atlas(font_path, 23) is None
+
+    image, size = text_module._text_image("Fallback caption", font_path, 23, COLOR, TextAlign.LEFT, None)
+    expected, expected_size = _pillow_text("Fallback caption", font_path, 23)
+    assert size == expected_size
+    assert image.tobytes() == expected.tobytes()
@@ -0,0 +1,51 @@
+import random
+
+from openframe import Rectangle, Scene
+from openframe.timeline import Placement, TimelineIndex
+
+
+def _placements(count=40, seed=7):
+    rng = random.Random(seed)
+    placements = []
+    for _ in range(count):
+        element = Rectangle(size=(4, 4), start_time=rng.uniform(0, 10), duration=rng.uniform(0.1, 3))
+        placements.append(Placement(element, rng.choice([0.0, 1.5])))
+    return placements
+
+
+def _brute_force(placements, t):
+    return [placement for placement in placements if placement.is_visible(t)]
+
+
+def test_sequential_queries_match_brute_force():
+    placements = _placements()
+    index = TimelineIndex(placements)
+
+    for step in range(0, 140):
+        t = step / 10
+        assert index.visible_at(t) == _brute_force(placements, t)
+
+
+def test_seeking_backwards_matches_brute_force():
+    placements = _placements()
+    index = TimelineIndex(placements)
+    times = [step / 10 for step in range(0, 140)]
+    random.Random(3).shuffle(times)
+
+    for t in [12.0, 1.0, 9.5, 0.0] + times:
+        assert index.visible_at(t) == _brute_force(placements, t)
+
+
+def test_results_keep_z_order():
+    scene = Scene(start_at=0)
+    top = Rectangle(size=(4, 4), start_time=0, duration=2)
+    bottom = Rectangle(size=(4, 4), start_time=1, duration=2)
+    scene.add(bottom)
+    scene.add(top)
+    placements = scene._get_elements()
+    index = TimelineIndex(placements)
+
+    index.visible_at(2.5)
+    assert [placement.element for placement in index.visible_at(1.5)] == [
+        placement.element for placement in placements
+    ]